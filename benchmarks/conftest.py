@@ -0,0 +1,45 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Shared fixtures for the benchmarks of the workflow API hot paths."""
+
+import pytest
+from workflows import WORKFLOW_SIZES, build_definition
+
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowInstance
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    InMemoryWorkflowInstance,
+)
+
+
+@pytest.fixture(scope="module", params=WORKFLOW_SIZES, ids=lambda size: f"{size}-elements")
+def instance(request) -> InMemoryWorkflowInstance:
+    """Workflow instance of each benchmarked size, already run once."""
+    instance = InMemoryWorkflowEngine().create_instance(build_definition(request.param))
+    instance.run()
+    return instance
+
+
+@pytest.fixture
+def async_instance(instance) -> AsyncInMemoryWorkflowInstance:
+    """Asynchronous view of the workflow instance of each benchmarked size."""
+    return AsyncInMemoryWorkflowInstance(instance)
@@ -0,0 +1,111 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Benchmarks of the asynchronous API hot paths.
+
+Each benchmark awaits the measured call ``REPEAT`` times inside a single event loop, so that
+the cost of starting the loop is spread over many calls. Divide the reported times by
+``REPEAT`` to get the time per call.
+"""
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import anyio
+import pytest
+from workflows import last_component_name
+
+from ansys.engineeringworkflow.api.iasyncworkflow import IAsyncControlStatement
+
+pytestmark = pytest.mark.benchmark(group="iasyncworkflow")
+
+REPEAT = 100
+"""Number of times that each benchmark awaits the measured call per round."""
+
+
+@pytest.fixture(autouse=True)
+def record_repeat(benchmark):
+    benchmark.extra_info["calls_per_round"] = REPEAT
+
+
+def repeat(function, *args, **kwargs) -> None:
+    """Await a coroutine function ``REPEAT`` times in a new event loop."""
+
+    async def main():
+        for _ in range(REPEAT):
+            await function(*args, **kwargs)
+
+    anyio.run(main)
+
+
+async def walk(element) -> int:
+    """Visit every element below a control statement and return how many there are."""
+    count = 1 + len(await element.get_datapins())
+    if isinstance(element, IAsyncControlStatement):
+        for child in (await element.get_elements()).values():
+            count += await walk(child)
+    return count
+
+
+def test_run_reset(benchmark, async_instance):
+    async def main():
+        await async_instance.run(reset=True, collect_names={"Root.y"})
+
+    benchmark(anyio.run, main)
+    benchmark.extra_info["calls_per_round"] = 1
+
+
+def test_run_without_changes(benchmark, async_instance):
+    benchmark(repeat, async_instance.run, collect_names={"Root.y"})
+
+
+def test_get_element_by_name(benchmark, async_instance):
+    name = last_component_name(async_instance.instance) + ".b"
+
+    benchmark(repeat, async_instance.get_element_by_name, name)
+
+
+def test_datapin_get_state(benchmark, async_instance):
+    name = last_component_name(async_instance.instance) + ".b"
+    datapin = anyio.run(async_instance.get_element_by_name, name)
+
+    benchmark(repeat, datapin.get_state)
+
+
+def test_datapin_set_state(benchmark, async_instance):
+    datapin = anyio.run(async_instance.get_element_by_name, "Root.x")
+    state = VariableState(RealValue(1.0), True)
+
+    benchmark(repeat, datapin.set_state, state)
+
+
+def test_get_properties(benchmark, async_instance):
+    name = last_component_name(async_instance.instance)
+    component = anyio.run(async_instance.get_element_by_name, name)
+
+    benchmark(repeat, component.get_properties)
+
+
+def test_tree_walk(benchmark, async_instance):
+    async def main():
+        await walk(await async_instance.get_root())
+
+    benchmark(anyio.run, main)
+    benchmark.extra_info["calls_per_round"] = 1
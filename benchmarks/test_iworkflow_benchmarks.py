@@ -0,0 +1,76 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmarks of the synchronous API hot paths."""
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+from workflows import last_component_name
+
+from ansys.engineeringworkflow.api.iworkflow import IControlStatement
+
+pytestmark = pytest.mark.benchmark(group="iworkflow")
+
+
+def walk(element) -> int:
+    """Visit every element below a control statement and return how many there are."""
+    count = 1 + len(element.get_datapins())
+    if isinstance(element, IControlStatement):
+        for child in element.get_elements().values():
+            count += walk(child)
+    return count
+
+
+def test_run_reset(benchmark, instance):
+    benchmark(instance.run, reset=True, collect_names={"Root.y"})
+
+
+def test_run_without_changes(benchmark, instance):
+    benchmark(instance.run, collect_names={"Root.y"})
+
+
+def test_get_element_by_name(benchmark, instance):
+    name = last_component_name(instance) + ".b"
+
+    benchmark(instance.get_element_by_name, name)
+
+
+def test_datapin_get_state(benchmark, instance):
+    datapin = instance.get_element_by_name(last_component_name(instance) + ".b")
+
+    benchmark(datapin.get_state)
+
+
+def test_datapin_set_state(benchmark, instance):
+    datapin = instance.get_element_by_name("Root.x")
+    state = VariableState(RealValue(1.0), True)
+
+    benchmark(datapin.set_state, state)
+
+
+def test_get_properties(benchmark, instance):
+    component = instance.get_element_by_name(last_component_name(instance))
+
+    benchmark(component.get_properties)
+
+
+def test_tree_walk(benchmark, instance):
+    benchmark(walk, instance.get_root())
@@ -0,0 +1,94 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Workflows used by the benchmarks of the workflow API hot paths."""
+
+from typing import Any, Dict, List
+
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowInstance,
+    WorkflowDefinition,
+)
+
+WORKFLOW_SIZES = [10, 1_000, 100_000]
+"""Approximate numbers of elements in the benchmarked workflows."""
+
+GROUP_SIZE = 100
+"""Number of components in each control statement below the root."""
+
+
+def increment(a):
+    """Compute the output of every component in the benchmarked workflows."""
+    return {"b": a + 1.0}
+
+
+def build_definition(element_count: int) -> WorkflowDefinition:
+    """
+    Build a workflow with about the given number of elements.
+
+    The workflow is a single chain of linked components, each with one input and one output,
+    which are grouped into sequential control statements of ``GROUP_SIZE`` components below
+    the root. The root has an input ``x`` that feeds the chain and an output ``y`` that
+    receives the result.
+    """
+    component_count = max(1, (element_count - 3) // 3)
+    groups: List[Dict[str, Any]] = []
+    links = []
+    source = "Root.x"
+    for index in range(component_count):
+        if index % GROUP_SIZE == 0:
+            groups.append(
+                {"name": f"Group{len(groups)}", "control_type": "sequential", "elements": []}
+            )
+        name = f"Component{index}"
+        groups[-1]["elements"].append(
+            {
+                "name": name,
+                "callable": increment,
+                "properties": {"mesh_size": 0.1, "max_iterations": 100},
+                "inputs": {"a": {"type": "real", "lower_bound": -1e9}},
+                "outputs": {"b": {"type": "real"}},
+            }
+        )
+        target = f"Root.{groups[-1]['name']}.{name}"
+        links.append({"source": source, "target": target + ".a"})
+        source = target + ".b"
+    links.append({"source": source, "target": "Root.y"})
+    return WorkflowDefinition.from_dict(
+        {
+            "root": {
+                "name": "Root",
+                "control_type": "sequential",
+                "datapins": {
+                    "x": {"type": "real", "is_input": True, "value": 0.0},
+                    "y": {"type": "real"},
+                },
+                "elements": groups,
+            },
+            "links": links,
+        }
+    )
+
+
+def last_component_name(instance: InMemoryWorkflowInstance) -> str:
+    """Get the full name of the deepest component in a benchmarked workflow."""
+    group = list(instance.get_root().get_elements().values())[-1]
+    return list(group.get_elements().values())[-1].full_name
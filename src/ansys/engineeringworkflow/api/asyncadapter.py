@@ -0,0 +1,562 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Asynchronous adapters of synchronous engines.
+
+This module exposes any ``IWorkflowEngine`` object and its workflow instances and elements
+through the asynchronous interfaces, so that services running an event loop can use engines
+that are only synchronous without blocking the loop.
+
+Calls that may block are offloaded to worker threads. Each engine adapter has a capacity
+limiter, which its workflow instances and elements share, so that a slow engine cannot take
+all the worker threads of the event loop. Properties that only read local attributes, such as
+``name`` and ``full_name``, are read on the event loop thread.
+"""
+
+from __future__ import annotations
+
+from os import PathLike
+from typing import (
+    AbstractSet,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ansys.tools.variableinterop import (
+    CommonVariableMetadata,
+    IVariableValue,
+    VariableState,
+    VariableType,
+)
+import anyio
+import anyio.to_thread
+
+from .cancellation import run_sync_cancellable
+from .datatypes import (
+    BatchRunResult,
+    DatapinLink,
+    Property,
+    RunStatistics,
+    TreeSnapshot,
+    WorkflowEngineInfo,
+    WorkflowInstanceState,
+)
+from .events import PushEventStream
+from .iasyncworkflow import (
+    IAsyncComponent,
+    IAsyncControlStatement,
+    IAsyncDatapin,
+    IAsyncElement,
+    IAsyncFileBasedWorkflowEngine,
+    IAsyncRunHandle,
+    IAsyncWorkflowInstance,
+)
+from .iworkflow import (
+    IComponent,
+    IControlStatement,
+    IDatapin,
+    IElement,
+    IFileBasedWorkflowEngine,
+    IRunHandle,
+    IWorkflowEngine,
+    IWorkflowInstance,
+)
+from .linkgraph import LinkGraph
+from .runhandle import AsyncRunHandle, RunHandle
+
+T = TypeVar("T")
+
+DEFAULT_MAX_THREADS = 8
+"""Default number of worker threads that the calls to one engine may use at once."""
+
+_EXHAUSTED = object()
+
+
+class AsyncWorkflowEngine(IAsyncFileBasedWorkflowEngine):
+    """Provides an asynchronous workflow engine that forwards every call to a synchronous one."""
+
+    def __init__(
+        self,
+        engine: IWorkflowEngine,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        limiter: Optional[anyio.CapacityLimiter] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        engine : IWorkflowEngine
+            Synchronous engine to forward calls to.
+        max_threads : int, default: 8
+            Maximum number of calls to the engine that run on worker threads at once. Ignored if
+            ``limiter`` is given.
+        limiter : Optional[anyio.CapacityLimiter], default: None
+            Capacity limiter that bounds the number of calls that run on worker threads at once,
+            which may be shared with other code.
+        """
+        if limiter is None:
+            if max_threads < 1:
+                raise ValueError("The maximum number of threads must be at least 1.")
+            limiter = anyio.CapacityLimiter(max_threads)
+        self._engine = engine
+        self._limiter = limiter
+
+    @property
+    def engine(self) -> IWorkflowEngine:
+        """Synchronous engine that calls are forwarded to."""
+        return self._engine
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        """Capacity limiter that bounds the number of calls that run on worker threads at once."""
+        return self._limiter
+
+    async def _call(self, function: Callable[..., T], *args: Any) -> T:
+        """Call a function on a worker thread."""
+        return await anyio.to_thread.run_sync(function, *args, limiter=self._limiter)
+
+    async def get_server_info(self) -> WorkflowEngineInfo:
+        """Get information about the server that is serving the request."""
+        return await self._call(self._engine.get_server_info)
+
+    async def load_workflow(self, file_name: Union[PathLike, str]) -> AsyncWorkflowInstance:
+        """
+        Load a workflow from a local file into the engine.
+
+        Raises
+        ------
+        NotImplementedError
+            If the synchronous engine does not load workflows from files.
+        """
+        if not isinstance(self._engine, IFileBasedWorkflowEngine):
+            raise NotImplementedError("This engine does not load workflows from files.")
+        return AsyncWorkflowInstance(
+            await self._call(self._engine.load_workflow, file_name), self._limiter
+        )
+
+
+class _SubscriptionStream(PushEventStream):
+    """Provides an event stream fed by the subscription of a synchronous workflow instance."""
+
+    def __init__(self, max_buffer_size: Optional[int], limiter: anyio.CapacityLimiter):
+        super().__init__(max_buffer_size)
+        self._limiter = limiter
+        self._sync_unsubscribe: Callable[[], None] = lambda: None
+
+    async def aclose(self) -> None:
+        # The stream is closed first, so that a publishing thread does not wait for the event
+        # loop while the loop waits for the subscription to end.
+        await super().aclose()
+        await anyio.to_thread.run_sync(self._sync_unsubscribe, limiter=self._limiter)
+
+
+class AsyncWorkflowInstance(IAsyncWorkflowInstance):
+    """Provides an asynchronous workflow instance that forwards every call to a synchronous one."""
+
+    def __init__(self, instance: IWorkflowInstance, limiter: anyio.CapacityLimiter):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : IWorkflowInstance
+            Synchronous workflow instance to forward calls to.
+        limiter : anyio.CapacityLimiter
+            Capacity limiter that bounds the number of calls that run on worker threads at once.
+        """
+        self._instance = instance
+        self._limiter = limiter
+        self._wrappers: Dict[str, AsyncElement] = {}
+
+    @property
+    def instance(self) -> IWorkflowInstance:
+        """Synchronous workflow instance that calls are forwarded to."""
+        return self._instance
+
+    def _wrap(self, element: Optional[IElement]) -> Optional[AsyncElement]:
+        """Get the asynchronous wrapper of an element, creating it on first use."""
+        if element is None:
+            return None
+        wrapper = self._wrappers.get(element.element_id)
+        if wrapper is None:
+            if isinstance(element, IControlStatement):
+                wrapper = AsyncControlStatement(self, element)
+            elif isinstance(element, IComponent):
+                wrapper = AsyncComponent(self, element)
+            elif isinstance(element, IDatapin):
+                wrapper = AsyncDatapin(self, element)
+            else:
+                wrapper = AsyncElement(self, element)
+            self._wrappers[element.element_id] = wrapper
+        return wrapper
+
+    def _wrap_all(self, elements: Mapping[str, Any]) -> Dict[str, Any]:
+        """Wrap the elements of a mapping returned by a synchronous element."""
+        return {name: self._wrap(element) for name, element in elements.items()}
+
+    async def _call(self, function: Callable[..., T], *args: Any) -> T:
+        """Call a function on a worker thread."""
+        return await anyio.to_thread.run_sync(function, *args, limiter=self._limiter)
+
+    async def _iterate(self, iterator: Iterator[T]) -> AsyncIterator[T]:
+        """Get the items of an iterator one at a time on worker threads."""
+        try:
+            while True:
+                item = await self._call(next, iterator, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    return
+                yield item  # type: ignore[misc]
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                with anyio.CancelScope(shield=True):
+                    await self._call(close)
+
+    async def get_state(self) -> WorkflowInstanceState:
+        """Get the state of the workflow instance."""
+        return await self._call(self._instance.get_state)
+
+    async def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+    ) -> Mapping[str, VariableState]:
+        """
+        Set a workflow's input datapins and run it.
+
+        If the calling task is cancelled, the synchronous run is cancelled with its cancel token
+        and the cancellation is raised once it has stopped.
+        """
+        return await run_sync_cancellable(
+            lambda cancel_token: self._instance.run(
+                inputs, reset, validation_names, collect_names, cancel_token=cancel_token
+            ),
+            self._limiter,
+        )
+
+    async def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+    ) -> IAsyncRunHandle:
+        """
+        Set a workflow's input datapins and start running the workflow.
+
+        Handles of the ``RunHandle`` class wake their waiters directly. Other handles are waited
+        on by worker threads.
+        """
+        handle = await self._call(
+            self._instance.start_run, inputs, reset, validation_names, collect_names, timeout
+        )
+        if isinstance(handle, RunHandle):
+            return AsyncRunHandle.from_run_handle(handle)
+        return _OffloadedRunHandle(handle, self._limiter)
+
+    async def cancel(self) -> None:
+        """Ask the current run of the workflow instance to stop."""
+        await self._call(self._instance.cancel)
+
+    async def run_batch(
+        self,
+        inputs: Sequence[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        max_concurrency: int = 1,
+    ) -> AsyncIterator[BatchRunResult]:
+        """
+        Run the workflow once for each design.
+
+        Each result is requested from the synchronous iterator on a worker thread.
+        """
+        results = await self._call(
+            self._instance.run_batch,
+            inputs,
+            reset,
+            validation_names,
+            collect_names,
+            ordered,
+            max_concurrency,
+        )
+        async for result in self._iterate(results):
+            yield result
+
+    async def subscribe(self, max_buffer_size: Optional[int] = None) -> PushEventStream:
+        """
+        Get a stream of the events of the workflow instance.
+
+        The stream is fed by a callback subscription to the synchronous workflow instance.
+        """
+        stream = _SubscriptionStream(max_buffer_size, self._limiter)
+        stream._sync_unsubscribe = await self._call(self._instance.subscribe, stream.put)
+        return stream
+
+    async def get_root(self) -> AsyncControlStatement:
+        """Get the root element of the workflow instance."""
+        return self._wrap(await self._call(self._instance.get_root))  # type: ignore[return-value]
+
+    async def get_element_by_name(self, element_name: str) -> AsyncElement:
+        """Get an element of the workflow instance by name."""
+        return self._wrap(  # type: ignore[return-value]
+            await self._call(self._instance.get_element_by_name, element_name)
+        )
+
+    async def get_metadata_version(self) -> int:
+        """Get a number that changes whenever the structure or datapin metadata changes."""
+        return await self._call(self._instance.get_metadata_version)
+
+    async def get_states(self, datapin_names: AbstractSet[str]) -> Mapping[str, VariableState]:
+        """Get the states of several datapins in one call."""
+        return await self._call(self._instance.get_states, datapin_names)
+
+    async def set_states(self, states: Mapping[str, VariableState]) -> None:
+        """Set the states of several datapins in one call."""
+        await self._call(self._instance.set_states, states)
+
+    async def get_properties_bulk(
+        self, element_names: AbstractSet[str], property_names: Optional[AbstractSet[str]] = None
+    ) -> Mapping[str, Mapping[str, Property]]:
+        """Get the properties of several elements in one call."""
+        return await self._call(self._instance.get_properties_bulk, element_names, property_names)
+
+    async def set_properties_bulk(self, values: Mapping[Tuple[str, str], IVariableValue]) -> None:
+        """Set properties of several elements in one call."""
+        await self._call(self._instance.set_properties_bulk, values)
+
+    async def get_tree_snapshot(
+        self, max_depth: Optional[int] = None, name_filter: Optional[str] = None
+    ) -> TreeSnapshot:
+        """Get a description of the whole element tree of the workflow instance in one call."""
+        return await self._call(self._instance.get_tree_snapshot, max_depth, name_filter)
+
+    async def get_links(self) -> Sequence[DatapinLink]:
+        """Get the links between the datapins of the workflow instance."""
+        return await self._call(self._instance.get_links)
+
+    async def get_link_graph(self) -> LinkGraph:
+        """Get a graph of the links between the datapins of the workflow instance."""
+        return await self._call(self._instance.get_link_graph)
+
+    async def get_run_statistics(self) -> RunStatistics:
+        """Get what happened to each component of the workflow instance during its last run."""
+        return await self._call(self._instance.get_run_statistics)
+
+
+class _OffloadedRunHandle(IAsyncRunHandle):
+    """Provides an asynchronous handle that waits on a synchronous handle on worker threads."""
+
+    def __init__(self, handle: IRunHandle, limiter: anyio.CapacityLimiter):
+        self._handle = handle
+        self._limiter = limiter
+
+    def done(self) -> bool:
+        """Get whether the run is known to have finished, either successfully or not."""
+        return self._handle.done()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the run to finish."""
+        # A cancelled wait leaves its thread blocked until the run finishes or the timeout
+        # expires, rather than holding up the cancellation.
+        return await anyio.to_thread.run_sync(
+            self._handle.wait, timeout, abandon_on_cancel=True, limiter=self._limiter
+        )
+
+    async def result(self, timeout: Optional[float] = None) -> Mapping[str, VariableState]:
+        """Wait for the run to finish and get its outputs."""
+        return await anyio.to_thread.run_sync(
+            self._handle.result, timeout, abandon_on_cancel=True, limiter=self._limiter
+        )
+
+    async def cancel(self) -> None:
+        """Ask the run to stop."""
+        await anyio.to_thread.run_sync(self._handle.cancel, limiter=self._limiter)
+
+
+class AsyncElement(IAsyncElement):
+    """Provides an asynchronous element that forwards every call to a synchronous one."""
+
+    def __init__(self, instance: AsyncWorkflowInstance, element: IElement):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : AsyncWorkflowInstance
+            Adapter of the workflow instance that the element belongs to.
+        element : IElement
+            Synchronous element to forward calls to.
+        """
+        self._instance = instance
+        self._element = element
+        self._call = instance._call
+
+    @property
+    def element(self) -> IElement:
+        """Synchronous element that calls are forwarded to."""
+        return self._element
+
+    @property
+    def element_id(self) -> str:
+        """Unique ID for the element that is assigned by the system."""
+        return self._element.element_id
+
+    @property
+    def parent_element_id(self) -> str:
+        """Element ID of the parent element."""
+        return self._element.parent_element_id
+
+    async def get_parent_element(self) -> Optional[AsyncElement]:  # type: ignore[override]
+        """Get the parent element of the element."""
+        return self._instance._wrap(await self._call(self._element.get_parent_element))
+
+    @property
+    def name(self) -> str:
+        """Name of the element."""
+        return self._element.name
+
+    @property
+    def full_name(self) -> str:
+        """Full name of the element in dotted notation."""
+        return self._element.full_name
+
+    async def get_property(self, property_name: str) -> Property:
+        """Get a property by name."""
+        return await self._call(self._element.get_property, property_name)
+
+    async def get_property_names(self) -> AbstractSet[str]:
+        """Get the names of the properties of the element."""
+        return await self._call(self._element.get_property_names)
+
+    async def get_properties(self) -> Mapping[str, Property]:
+        """Get all properties of the element."""
+        return await self._call(self._element.get_properties)
+
+    async def set_property(self, property_name: str, property_value: IVariableValue) -> None:
+        """Set the value of a property."""
+        await self._call(self._element.set_property, property_name, property_value)
+
+
+class _AsyncDatapinContainer(AsyncElement):
+    """Provides the ``get_datapins`` method of asynchronous components and control statements."""
+
+    async def get_datapins(self) -> Mapping[str, IAsyncDatapin]:  # type: ignore[override]
+        """Get the datapins of the element, by name."""
+        return self._instance._wrap_all(
+            await self._call(self._element.get_datapins)  # type: ignore[attr-defined]
+        )
+
+
+class AsyncControlStatement(_AsyncDatapinContainer, IAsyncControlStatement):
+    """Provides an asynchronous control statement that forwards every call to a synchronous one."""
+
+    @property
+    def control_type(self) -> str:
+        """Type of the control statement."""
+        return self._element.control_type  # type: ignore[attr-defined]
+
+    async def get_elements(self) -> Mapping[str, IAsyncElement]:  # type: ignore[override]
+        """Get the child elements of the control statement, by name."""
+        return self._instance._wrap_all(
+            await self._call(self._element.get_elements)  # type: ignore[attr-defined]
+        )
+
+
+class AsyncComponent(_AsyncDatapinContainer, IAsyncComponent):
+    """Provides an asynchronous component that forwards every call to a synchronous one."""
+
+    @property
+    def pacz_url(self) -> Optional[str]:
+        """URL to the PACZ file or directory."""
+        return self._element.pacz_url  # type: ignore[attr-defined]
+
+
+class AsyncDatapin(AsyncElement, IAsyncDatapin):
+    """Provides an asynchronous datapin that forwards every call to a synchronous one."""
+
+    async def get_metadata(self) -> CommonVariableMetadata:
+        """Get the metadata for the datapin."""
+        return await self._call(self._element.get_metadata)  # type: ignore[attr-defined]
+
+    @property
+    def value_type(self) -> VariableType:
+        """Type of value that the datapin stores."""
+        return self._element.value_type  # type: ignore[attr-defined]
+
+    async def get_state(self, hid: Optional[str] = None) -> VariableState:
+        """Get the state of the datapin."""
+        return await self._call(self._element.get_state, hid)  # type: ignore[attr-defined]
+
+    async def set_state(self, state: VariableState) -> None:
+        """Set the state of the datapin."""
+        await self._call(self._element.set_state, state)  # type: ignore[attr-defined]
+
+    async def get_history_ids(self) -> Sequence[str]:
+        """Get the IDs of the recorded history entries of the datapin, oldest first."""
+        return await self._call(self._element.get_history_ids)  # type: ignore[attr-defined]
+
+    async def iter_history(
+        self, hids: Optional[Sequence[str]] = None, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Tuple[str, VariableState]]]:
+        """Get history entries of the datapin in chunks, each on a worker thread."""
+        chunks = await self._call(
+            self._element.iter_history, hids, chunk_size  # type: ignore[attr-defined]
+        )
+        async for chunk in self._instance._iterate(chunks):
+            yield chunk
+
+    async def get_upstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """Get the datapins that this datapin depends on."""
+        return await self._call(
+            self._element.get_upstream_datapins, transitive  # type: ignore[attr-defined]
+        )
+
+    async def get_downstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """Get the datapins that depend on this datapin."""
+        return await self._call(
+            self._element.get_downstream_datapins, transitive  # type: ignore[attr-defined]
+        )
+
+    @property
+    def is_input_to_component(self) -> bool:
+        """Flag indicating if this datapin is an input in the context of its component."""
+        return self._element.is_input_to_component  # type: ignore[attr-defined]
+
+    @property
+    def is_input_to_workflow(self) -> bool:
+        """Flag indicating if this datapin is an unlinked input in the context of the workflow."""
+        return self._element.is_input_to_workflow  # type: ignore[attr-defined]
@@ -0,0 +1,187 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Helpers for engines that implement cancellation and deadlines of runs.
+
+Synchronous runs are stopped by a ``CancelToken`` object or a timeout, and asynchronous runs by
+AnyIO cancel scopes. The helpers in this module translate between the two:
+
+- The ``cancel_scope`` function opens a cancel scope in an event loop that a cancel token or a
+  deadline cancels, so that synchronous callers can stop asynchronous work.
+- The ``run_sync_cancellable`` function calls a blocking function on a worker thread and cancels
+  its token when the calling task is cancelled, so that cancel scopes stop synchronous work.
+
+Deadlines are values of the ``time.monotonic`` clock.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import threading
+import time
+from typing import Callable, Iterator, Optional, TypeVar
+
+import anyio
+import anyio.from_thread
+import anyio.lowlevel
+import anyio.to_thread
+
+from .datatypes import CancelToken
+from .exceptions import RunCancelledError, RunTimeoutError
+
+T = TypeVar("T")
+
+
+def deadline_after(timeout: Optional[float]) -> Optional[float]:
+    """
+    Get the deadline of a run that may take the given time.
+
+    Parameters
+    ----------
+    timeout : Optional[float]
+        Maximum duration of the run in seconds, or ``None`` for no deadline.
+    """
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def cancellation_error(cancel_token: Optional[CancelToken]) -> RunCancelledError:
+    """
+    Create the error that a run stopped by a cancel token or a deadline raises.
+
+    Parameters
+    ----------
+    cancel_token : Optional[CancelToken]
+        Token of the run. If it is not cancelled, the run is assumed to have reached its
+        deadline.
+    """
+    if cancel_token is not None and cancel_token.cancelled:
+        return RunCancelledError("The workflow run was cancelled.")
+    return RunTimeoutError("The workflow run did not finish before its timeout expired.")
+
+
+def check_cancelled(cancel_token: Optional[CancelToken], deadline: Optional[float]) -> None:
+    """
+    Raise the error of a stopped run if its token is cancelled or its deadline has passed.
+
+    Engines call this function between the steps of a synchronous run.
+
+    Parameters
+    ----------
+    cancel_token : Optional[CancelToken]
+        Token of the run.
+    deadline : Optional[float]
+        Deadline of the run, or ``None`` for no deadline.
+    """
+    if (cancel_token is not None and cancel_token.cancelled) or (
+        deadline is not None and time.monotonic() >= deadline
+    ):
+        raise cancellation_error(cancel_token)
+
+
+@contextmanager
+def cancel_scope(
+    cancel_token: Optional[CancelToken], deadline: Optional[float]
+) -> Iterator[anyio.CancelScope]:
+    """
+    Open a cancel scope that a cancel token or a deadline cancels.
+
+    This function must be called from an event loop. The token may be cancelled from any thread.
+    If the scope is cancelled by the token or the deadline, the error returned by the
+    ``cancellation_error`` function is raised when the ``with`` block is left.
+
+    Parameters
+    ----------
+    cancel_token : Optional[CancelToken]
+        Token that cancels the scope.
+    deadline : Optional[float]
+        Deadline of the scope, or ``None`` for no deadline.
+    """
+    loop_thread = threading.get_ident()
+    loop_token = anyio.lowlevel.current_token()
+    with anyio.CancelScope() as scope:
+        if deadline is not None:
+            scope.deadline = anyio.current_time() + deadline - time.monotonic()
+
+        def cancel() -> None:
+            if threading.get_ident() == loop_thread:
+                scope.cancel()
+                return
+            try:
+                anyio.from_thread.run_sync(scope.cancel, token=loop_token)
+            except RuntimeError:
+                # The event loop has closed, so the scope has been left.
+                pass
+
+        remove = cancel_token.add_callback(cancel) if cancel_token is not None else None
+        try:
+            yield scope
+        finally:
+            if remove is not None:
+                remove()
+    if scope.cancelled_caught:
+        raise cancellation_error(cancel_token)
+
+
+async def run_sync_cancellable(
+    function: Callable[[CancelToken], T], limiter: Optional[anyio.CapacityLimiter] = None
+) -> T:
+    """
+    Call a blocking function on a worker thread, cancelling its token if the caller is cancelled.
+
+    When the calling task is cancelled, the token passed to the function is cancelled and the
+    cancellation is only raised once the function has returned, so that the work it does has
+    stopped.
+
+    Parameters
+    ----------
+    function : Callable[[CancelToken], T]
+        Function to call with a new cancel token.
+    limiter : Optional[anyio.CapacityLimiter], default: None
+        Capacity limiter of the worker threads. If ``None``, the default limiter is used.
+    """
+    cancel_token = CancelToken()
+    lock = threading.Lock()
+    started = abandoned = False
+    finished = threading.Event()
+
+    def call() -> T:
+        nonlocal started
+        with lock:
+            if abandoned:
+                raise cancellation_error(cancel_token)
+            started = True
+        try:
+            return function(cancel_token)
+        finally:
+            finished.set()
+
+    try:
+        return await anyio.to_thread.run_sync(call, abandon_on_cancel=True, limiter=limiter)
+    except anyio.get_cancelled_exc_class():
+        with lock:
+            abandoned = True
+            must_wait = started
+        cancel_token.cancel()
+        if must_wait:
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(finished.wait)
+        raise
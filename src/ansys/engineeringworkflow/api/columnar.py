@@ -0,0 +1,292 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Columnar batch runs.
+
+This module runs a batch of designs given as NumPy arrays, one element per design, and returns
+the collected outputs the same way. It is built on the ``run_batch`` method of the workflow
+instance interfaces, so it works with any engine.
+
+Columns of real, integer, and boolean datapins are stored as ``float64``, ``int64``, and ``bool``
+arrays. Input arrays of these types are used without copying, and the values of each design are
+read from them only when the design is run. Columns of string datapins are stored as object
+arrays. Array datapins are not supported as inputs; their outputs are stored as object arrays of
+variable values.
+
+An output column is created for every datapin named by the ``collect_names`` parameter, even if
+no design succeeds. The elements of designs whose run failed are ``0``, ``False``, or ``None``,
+depending on the type of the column, and are marked as not valid.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Callable, Dict, Iterator, Mapping, Sequence, Union
+
+from ansys.tools.variableinterop import (
+    BooleanValue,
+    IntegerValue,
+    IVariableValue,
+    RealValue,
+    StringValue,
+    VariableState,
+    VariableType,
+)
+import numpy as np
+
+from .datatypes import BatchRunResult, ElementKind, TreeSnapshot
+from .iasyncworkflow import IAsyncDatapin, IAsyncElement, IAsyncWorkflowInstance
+from .iworkflow import IDatapin, IElement, IWorkflowInstance
+
+_DTYPES: Dict[VariableType, type] = {
+    VariableType.REAL: np.float64,
+    VariableType.INTEGER: np.int64,
+    VariableType.BOOLEAN: np.bool_,
+    VariableType.STRING: np.object_,
+}
+
+_VALUE_TYPES: Dict[VariableType, Callable[[Any], IVariableValue]] = {
+    VariableType.REAL: RealValue,
+    VariableType.INTEGER: IntegerValue,
+    VariableType.BOOLEAN: BooleanValue,
+    VariableType.STRING: StringValue,
+}
+
+
+@dataclass(frozen=True)
+class ColumnarResult:
+    """Stores the outcome of a columnar batch run."""
+
+    values: Mapping[str, np.ndarray]
+    """Map of collected datapin names to arrays of their values, one element per design."""
+    valid: Mapping[str, np.ndarray]
+    """
+    Map of collected datapin names to boolean arrays of their validity flags.
+
+    The flags of all datapins are ``False`` for designs whose run failed.
+    """
+    errors: Mapping[int, Exception]
+    """Map of the indices of the designs whose run failed to the errors that the runs raised."""
+
+
+def _value_type(name: str, element: Union[IElement, IAsyncElement]) -> VariableType:
+    """Get the type of an input datapin, checking that the named element is a datapin."""
+    if not isinstance(element, (IDatapin, IAsyncDatapin)):
+        raise ValueError(f"The element {name!r} is not a datapin.")
+    return element.value_type
+
+
+def _output_types(
+    snapshot: TreeSnapshot, collect_names: AbstractSet[str]
+) -> Dict[str, VariableType]:
+    """Get the types of the datapins that a run collects, expanding elements into datapins."""
+    value_types: Dict[str, VariableType] = {}
+    pending = [snapshot.get_by_name(name) for name in collect_names]
+    while pending:
+        element = pending.pop()
+        if element.kind == ElementKind.DATAPIN:
+            value_types[element.full_name] = element.value_type
+        else:
+            pending.extend(snapshot.get_children(element))
+    return value_types
+
+
+class _InputColumns(Sequence[Mapping[str, VariableState]]):
+    """Presents input columns as the sequence of designs that ``run_batch`` expects."""
+
+    def __init__(
+        self,
+        columns: Mapping[str, np.ndarray],
+        valid: Mapping[str, np.ndarray],
+        value_types: Mapping[str, VariableType],
+    ):
+        lengths = set()
+        self._columns = []
+        for name, column in columns.items():
+            value_type = value_types[name]
+            if value_type not in _DTYPES:
+                raise ValueError(
+                    f"The datapin {name!r} is of type {value_type}, which is not supported in "
+                    "columnar mode."
+                )
+            array = np.asarray(column, dtype=_DTYPES[value_type])
+            mask = np.asarray(valid.get(name, True), dtype=np.bool_)
+            if array.ndim != 1 or mask.ndim > 1:
+                raise ValueError(f"The column of the datapin {name!r} is not one-dimensional.")
+            lengths.add(len(array))
+            if mask.ndim:
+                lengths.add(len(mask))
+            else:
+                mask = np.broadcast_to(mask, array.shape)
+            self._columns.append((name, array, mask, _VALUE_TYPES[value_type]))
+        if len(lengths) > 1:
+            raise ValueError("The input columns do not all have the same length.")
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        return {
+            name: VariableState(value_type(array[index]), bool(mask[index]))
+            for name, array, mask, value_type in self._columns
+        }
+
+    def __iter__(self) -> Iterator[Mapping[str, VariableState]]:
+        for index in range(self._length):
+            yield self[index]
+
+
+class _OutputColumns:
+    """Accumulates the results of a batch run into columns."""
+
+    def __init__(self, length: int, value_types: Mapping[str, VariableType]):
+        self._length = length
+        self._values: Dict[str, np.ndarray] = {}
+        self._valid: Dict[str, np.ndarray] = {}
+        self._errors: Dict[int, Exception] = {}
+        for name, value_type in value_types.items():
+            self._create(name, value_type)
+
+    def _create(self, name: str, value_type: VariableType) -> np.ndarray:
+        dtype = _DTYPES.get(value_type, np.object_)
+        if dtype is np.object_:
+            values = np.full(self._length, None, dtype=np.object_)
+        else:
+            values = np.zeros(self._length, dtype=dtype)
+        self._values[name] = values
+        self._valid[name] = np.zeros(self._length, dtype=np.bool_)
+        return values
+
+    def add(self, result: BatchRunResult) -> None:
+        if not result.succeeded:
+            self._errors[result.index] = result.exception
+            return
+        for name, state in result.outputs.items():
+            values = self._values.get(name)
+            if values is None:
+                values = self._create(name, state.value.variable_type)
+            values[result.index] = state.value
+            self._valid[name][result.index] = state.is_valid
+
+    def finish(self) -> ColumnarResult:
+        return ColumnarResult(self._values, self._valid, self._errors)
+
+
+def run_columns(
+    instance: IWorkflowInstance,
+    inputs: Mapping[str, np.ndarray],
+    valid: Mapping[str, np.ndarray] = {},
+    reset: bool = False,
+    validation_names: AbstractSet[str] = set(),
+    collect_names: AbstractSet[str] = set(),
+    max_concurrency: int = 1,
+) -> ColumnarResult:
+    """
+    Run a workflow instance once per design, with inputs and outputs stored in columns.
+
+    Parameters
+    ----------
+    instance : IWorkflowInstance
+        Workflow instance to run.
+    inputs : Mapping[str, np.ndarray]
+        Map of input datapin names to one-dimensional arrays of their values, one element per
+        design. All arrays must have the same length.
+    valid : Mapping[str, np.ndarray]
+        Map of input datapin names to boolean arrays of their validity flags. Values of datapins
+        that are not in this map are valid.
+    reset : bool, default: False
+        Whether to reset the workflow before running each design.
+    validation_names : AbstractSet[str]
+        Names of the specific datapins or components that are required to be valid.
+    collect_names : AbstractSet[str]
+        Names of the specific datapins or elements whose values are to be collected. If an
+        element is specified, all child datapins are recursively included.
+    max_concurrency : int, default: 1
+        Maximum number of designs that the engine may run at the same time.
+
+    Returns
+    -------
+    ColumnarResult
+        Collected outputs of the designs.
+
+    Raises
+    ------
+    ValueError
+        If an input name is not the name of a datapin, if an input datapin is not of a supported
+        type, if the columns are not one-dimensional arrays of the same length, or if a collected
+        name is not the name of an element.
+    """
+    value_types = {name: _value_type(name, instance.get_element_by_name(name)) for name in inputs}
+    designs = _InputColumns(inputs, valid, value_types)
+    output_types = (
+        _output_types(instance.get_tree_snapshot(), collect_names) if collect_names else {}
+    )
+    outputs = _OutputColumns(len(designs), output_types)
+    results = instance.run_batch(
+        designs,
+        reset,
+        validation_names,
+        collect_names,
+        ordered=False,
+        max_concurrency=max_concurrency,
+    )
+    for result in results:
+        outputs.add(result)
+    return outputs.finish()
+
+
+async def async_run_columns(
+    instance: IAsyncWorkflowInstance,
+    inputs: Mapping[str, np.ndarray],
+    valid: Mapping[str, np.ndarray] = {},
+    reset: bool = False,
+    validation_names: AbstractSet[str] = set(),
+    collect_names: AbstractSet[str] = set(),
+    max_concurrency: int = 1,
+) -> ColumnarResult:
+    """
+    Run an asynchronous workflow instance once per design, with data stored in columns.
+
+    See the ``run_columns`` function for a description of the parameters.
+    """
+    value_types = {
+        name: _value_type(name, await instance.get_element_by_name(name)) for name in inputs
+    }
+    designs = _InputColumns(inputs, valid, value_types)
+    output_types = (
+        _output_types(await instance.get_tree_snapshot(), collect_names) if collect_names else {}
+    )
+    outputs = _OutputColumns(len(designs), output_types)
+    results = instance.run_batch(
+        designs,
+        reset,
+        validation_names,
+        collect_names,
+        ordered=False,
+        max_concurrency=max_concurrency,
+    )
+    async for result in results:
+        outputs.add(result)
+    return outputs.finish()
@@ -22,11 +22,20 @@
 """API datatype definitions."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Callable, Iterator, List, Mapping, Optional, Tuple
 
-from ansys.tools.variableinterop import IVariableValue
+from ansys.tools.variableinterop import (
+    CommonVariableMetadata,
+    IVariableValue,
+    VariableState,
+    VariableType,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
 
 
 @dataclass(frozen=True)
@@ -92,6 +101,132 @@ class WorkflowInstanceState(Enum):
     PAUSED = 3
     FAILED = 4
     SUCCESS = 5
+    CANCELLED = 6
+
+
+class CancelToken:
+    """
+    Lets any thread ask the synchronous runs that use it to stop.
+
+    A token stays cancelled once it has been cancelled, so a new token is needed for each run
+    that may have to be cancelled on its own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance."""
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the ``cancel`` method has been called."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """
+        Ask the runs that use this token to stop.
+
+        The method returns without waiting for them. Calling it again has no effect.
+        """
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the token to be cancelled.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Maximum time to wait in seconds. If ``None``, the method waits until the token is
+            cancelled.
+
+        Returns
+        -------
+        bool
+            ``True`` if the token is cancelled, ``False`` if the timeout expired first.
+        """
+        return self._cancelled.wait(timeout)
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Add a function to call when the token is cancelled.
+
+        If the token is already cancelled, the function is called immediately. Otherwise, it is
+        called on the thread that cancels the token. Engines use callbacks to stop work that does
+        not check the token itself.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Function to call.
+
+        Returns
+        -------
+        Callable[[], None]
+            Function that removes the callback again.
+        """
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+class WorkflowEventType(Enum):
+    """Provides an enum with the types of events that a workflow instance can report."""
+
+    STATE_CHANGED = 0
+    COMPONENT_STARTED = 1
+    COMPONENT_FINISHED = 2
+    COMPONENT_FAILED = 3
+
+
+@dataclass(frozen=True)
+class WorkflowEvent:
+    """Stores an event reported by a workflow instance to its subscribers."""
+
+    event_type: WorkflowEventType
+    """Type of the event."""
+    timestamp: float
+    """Time at which the event occurred, in seconds since the epoch."""
+    state: Optional[WorkflowInstanceState] = None
+    """New state of the workflow instance for ``STATE_CHANGED`` events, otherwise ``None``."""
+    element_name: str = ""
+    """
+    Full name of the component for component events.
+
+    The value is a blank string for ``STATE_CHANGED`` events.
+    """
+
+
+@dataclass(frozen=True)
+class BatchRunResult:
+    """Stores the outcome of running one design of a batch."""
+
+    index: int
+    """Position of the design in the sequence of inputs passed to ``run_batch``."""
+    outputs: Mapping[str, VariableState] = field(default_factory=dict)
+    """Collected outputs of the run, or an empty map if the run failed."""
+    exception: Optional[Exception] = None
+    """Error raised by the run, or ``None`` if the run succeeded."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Flag indicating if the run succeeded."""
+        return self.exception is None
 
 
 @dataclass(frozen=True)
@@ -108,3 +243,200 @@ class Property:
     parent_element_id: str
     property_name: str
     property_value: IVariableValue
+
+
+@dataclass(frozen=True)
+class DatapinLink:
+    """Stores a link along which the value of one datapin is passed to another."""
+
+    source_name: str
+    """Full name of the datapin that the value comes from."""
+    target_name: str
+    """Full name of the datapin that receives the value."""
+    equation: Optional[str] = None
+    """Equation that computes the target from the source, or ``None`` for a direct link."""
+
+
+class ElementKind(Enum):
+    """Provides an enum with the kinds of elements in a workflow."""
+
+    CONTROL_STATEMENT = 0
+    COMPONENT = 1
+    DATAPIN = 2
+
+
+@dataclass(frozen=True, slots=True)
+class ElementSnapshot:
+    """
+    Stores the description of one element in a ``TreeSnapshot`` object.
+
+    Attributes that do not apply to the kind of element are ``None``.
+    """
+
+    index: int
+    """Position of the element in the snapshot."""
+    parent_index: int
+    """Position of the parent element in the snapshot, or ``-1`` for the root element."""
+    depth: int
+    """Number of ancestors of the element, which is ``0`` for the root element."""
+    kind: ElementKind
+    """Kind of the element."""
+    element_id: str
+    """Unique ID for the element that is assigned by the system."""
+    full_name: str
+    """Full name of the element in dotted notation."""
+    properties: Mapping[str, Property]
+    """Properties of the element."""
+    control_type: Optional[str] = None
+    """Type of the control statement."""
+    pacz_url: Optional[str] = None
+    """URL to the PACZ file or directory of the component."""
+    value_type: Optional[VariableType] = None
+    """Type of value that the datapin stores."""
+    metadata: Optional[CommonVariableMetadata] = None
+    """Metadata of the datapin."""
+    is_input_to_component: Optional[bool] = None
+    """Flag indicating if the datapin is an input in the context of its component."""
+    is_input_to_workflow: Optional[bool] = None
+    """Flag indicating if the datapin is an unlinked input in the context of the workflow."""
+
+    @property
+    def name(self) -> str:
+        """Name of the element."""
+        return self.full_name.rpartition(".")[2]
+
+
+@dataclass(frozen=True, slots=True)
+class TreeSnapshot:
+    """
+    Stores the element hierarchy of a workflow instance as it was at one point in time.
+
+    Elements are stored in depth-first order, starting with the root element. The datapins of an
+    element come before its child elements. The snapshot does not change when the workflow
+    instance does.
+    """
+
+    elements: Tuple[ElementSnapshot, ...]
+    """Descriptions of the elements."""
+    _by_name: Mapping[str, ElementSnapshot] = field(init=False, repr=False, compare=False)
+    _children: Tuple[Tuple[int, ...], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index the elements by name and by parent."""
+        children: List[List[int]] = [[] for _ in self.elements]
+        for element in self.elements:
+            if element.parent_index >= 0:
+                children[element.parent_index].append(element.index)
+        object.__setattr__(self, "_by_name", {e.full_name: e for e in self.elements})
+        object.__setattr__(self, "_children", tuple(tuple(c) for c in children))
+
+    def __len__(self) -> int:
+        """Get the number of elements in the snapshot."""
+        return len(self.elements)
+
+    def __iter__(self) -> Iterator[ElementSnapshot]:
+        """Iterate over the elements in depth-first order."""
+        return iter(self.elements)
+
+    @property
+    def root(self) -> Optional[ElementSnapshot]:
+        """Root element, or ``None`` if the snapshot is empty."""
+        return self.elements[0] if self.elements else None
+
+    def get_by_name(self, full_name: str) -> ElementSnapshot:
+        """
+        Get an element by its full name.
+
+        Parameters
+        ----------
+        full_name : str
+            Full name of the element in dotted notation.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot does not contain an element with the given name.
+        """
+        try:
+            return self._by_name[full_name]
+        except KeyError:
+            raise ValueError(f"There is no element named {full_name!r}.") from None
+
+    def get_parent(self, element: ElementSnapshot) -> Optional[ElementSnapshot]:
+        """Get the parent of an element, or ``None`` for the root element."""
+        return self.elements[element.parent_index] if element.parent_index >= 0 else None
+
+    def get_children(self, element: ElementSnapshot) -> Tuple[ElementSnapshot, ...]:
+        """Get the datapins and child elements of an element that are in the snapshot."""
+        return tuple(self.elements[index] for index in self._children[element.index])
+
+
+class ElementRunStatus(Enum):
+    """Provides an enum with what happened to an element during a run."""
+
+    NOT_RUN = 0
+    """The element had to run, but the run ended before the element was reached."""
+    SKIPPED = 1
+    """The element did not need to run because it was valid or not required."""
+    CACHED = 2
+    """The outputs of an earlier execution of the element were reused without running it."""
+    EXECUTED = 3
+    """The element ran successfully."""
+    FAILED = 4
+    """The element ran and raised an error."""
+
+
+@dataclass(frozen=True)
+class RunStatistics:
+    """
+    Stores what happened to each element of a workflow instance during its last run.
+
+    The statistics are stored in columns, with one row per element in the same position of each
+    column, so that the statistics of many runs can be compared without parsing engine logs.
+    """
+
+    element_names: Tuple[str, ...]
+    """Full names of the elements."""
+    wall_times: Tuple[float, ...]
+    """Time that each element spent executing, in seconds, or ``0.0`` if it did not execute."""
+    queue_waits: Tuple[float, ...]
+    """
+    Time between the moment each element was ready to run and the moment it started executing,
+    in seconds, such as the time spent waiting for a free worker. The value is ``0.0`` if the
+    element did not execute.
+    """
+    execution_counts: Tuple[int, ...]
+    """Number of times that each element executed during the run."""
+    statuses: Tuple[ElementRunStatus, ...]
+    """What happened to each element during the run."""
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self.element_names)
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Get the statistics as a NumPy structured array with one record per element.
+
+        The fields are ``element_name``, ``wall_time``, ``queue_wait``, ``execution_count``, and
+        ``status``, which holds the values of the ``ElementRunStatus`` members.
+        """
+        import numpy as np
+
+        name_length = max(map(len, self.element_names), default=1)
+        records = np.empty(
+            len(self),
+            dtype=[
+                ("element_name", f"U{name_length}"),
+                ("wall_time", np.float64),
+                ("queue_wait", np.float64),
+                ("execution_count", np.int64),
+                ("status", np.int8),
+            ],
+        )
+        records["element_name"] = self.element_names
+        records["wall_time"] = self.wall_times
+        records["queue_wait"] = self.queue_waits
+        records["execution_count"] = self.execution_counts
+        records["status"] = [status.value for status in self.statuses]
+        return records
@@ -0,0 +1,229 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Dependency analysis for partial workflow runs.
+
+The ``validation_names`` parameter of the ``run`` method allows engines to run only the part of
+a workflow that the requested elements depend on. This module contains the analysis that an
+engine needs to do so, independently of how the engine stores its workflows:
+
+- The ``DependencyGraph`` class finds the components that must run to make a set of elements
+  valid, from the inputs and outputs of the components and the links between datapins.
+- The ``InputChangeTracker`` class remembers the inputs and outputs of the last run of each
+  component, so that a component whose inputs are unchanged can be made valid again without
+  running it.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from ansys.tools.variableinterop import VariableState
+
+T = TypeVar("T")
+
+
+class DependencyGraph:
+    """
+    Provides the data dependencies between the components of a workflow.
+
+    Elements are identified by their full names. The control statement hierarchy is taken from
+    the names: an element depends on everything that any element whose name starts with its own
+    name followed by a dot depends on.
+
+    A graph is immutable and may be shared by all instances of a workflow.
+    """
+
+    def __init__(
+        self,
+        components: Mapping[str, Tuple[Sequence[str], Sequence[str]]],
+        links: Iterable[Tuple[str, str]],
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        components : Mapping[str, Tuple[Sequence[str], Sequence[str]]]
+            Full names of the input and output datapins of each component, by the full name of
+            the component. Components are reported in the order of this mapping, which should
+            be the order in which the engine runs them.
+        links : Iterable[Tuple[str, str]]
+            Pairs of full datapin names, in ``(source, target)`` order.
+        """
+        self._component_names = list(components)
+        self._component_inputs: List[List[int]] = []
+        self._producers: Dict[int, int] = {}
+        self._datapin_ids: Dict[str, int] = {}
+        for index, (inputs, outputs) in enumerate(components.values()):
+            self._component_inputs.append([self._datapin_id(name) for name in inputs])
+            for name in outputs:
+                self._producers[self._datapin_id(name)] = index
+        self._link_sources: Dict[int, int] = {
+            self._datapin_id(target): self._datapin_id(source) for source, target in links
+        }
+        self._element_names = sorted([*self._component_names, *self._datapin_ids])
+        self._component_ids = {name: index for index, name in enumerate(self._component_names)}
+        self._cached_required_components = lru_cache(maxsize=64)(self._find_required_components)
+
+    @property
+    def component_names(self) -> Sequence[str]:
+        """Full names of all components, in run order."""
+        return tuple(self._component_names)
+
+    def required_components(self, names: AbstractSet[str]) -> Sequence[str]:
+        """
+        Get the components that must run to make the given elements valid.
+
+        Parameters
+        ----------
+        names : AbstractSet[str]
+            Full names of datapins, components, or control statements. If empty, the whole
+            workflow is required.
+
+        Returns
+        -------
+        Sequence[str]
+            Full names of the required components, in run order. Names that no component
+            affects, such as those of unlinked datapins of control statements, add nothing.
+        """
+        if not names:
+            return self.component_names
+        return self._cached_required_components(frozenset(names))
+
+    def _find_required_components(self, names: FrozenSet[str]) -> Sequence[str]:
+        required = set()
+        pending: List[int] = []
+        for name in self._expand(names):
+            if name in self._component_ids:
+                index = self._component_ids[name]
+                required.add(index)
+                pending.extend(self._component_inputs[index])
+            else:
+                pending.append(self._datapin_ids[name])
+        visited = set()
+        # The traversal is iterative so that long chains of linked components do not exhaust
+        # the interpreter's recursion limit.
+        while pending:
+            datapin = pending.pop()
+            if datapin in visited:
+                continue
+            visited.add(datapin)
+            producer = self._producers.get(datapin)
+            if producer is not None and producer not in required:
+                required.add(producer)
+                pending.extend(self._component_inputs[producer])
+            source = self._link_sources.get(datapin)
+            if source is not None:
+                pending.append(source)
+        return tuple(self._component_names[index] for index in sorted(required))
+
+    def _expand(self, names: FrozenSet[str]) -> Iterable[str]:
+        """Get the known elements that the given names refer to, including descendants."""
+        for name in names:
+            start = bisect_left(self._element_names, name)
+            for element_name in self._element_names[start:]:
+                if element_name != name and not element_name.startswith(name + "."):
+                    if not element_name.startswith(name):
+                        break
+                    continue
+                yield element_name
+
+    def _datapin_id(self, name: str) -> int:
+        return self._datapin_ids.setdefault(name, len(self._datapin_ids))
+
+
+class InputChangeTracker(Generic[T]):
+    """
+    Remembers the inputs and outputs of the last successful run of each component.
+
+    Inputs are compared with the ``==`` operator of the ``VariableState`` class, so a component
+    whose inputs are set to the values that they had in its last run is not run again. Engines
+    should clear the tracker when a run is reset, and should not use it for components whose
+    outputs do not depend only on their inputs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance."""
+        self._records: Dict[Hashable, Tuple[Mapping[str, VariableState], T]] = {}
+
+    def record(self, component: Hashable, inputs: Mapping[str, VariableState], outputs: T) -> None:
+        """
+        Record a successful run of a component.
+
+        Parameters
+        ----------
+        component : Hashable
+            Component, or a key that identifies it.
+        inputs : Mapping[str, VariableState]
+            States of the input datapins of the component in the run, by datapin name.
+        outputs : T
+            Outputs of the run, in any form that the engine can restore.
+        """
+        self._records[component] = (dict(inputs), outputs)
+
+    def unchanged_outputs(
+        self, component: Hashable, inputs: Mapping[str, VariableState]
+    ) -> Optional[T]:
+        """
+        Get the outputs of the last run of a component if its inputs have not changed since.
+
+        Parameters
+        ----------
+        component : Hashable
+            Component, or a key that identifies it.
+        inputs : Mapping[str, VariableState]
+            Current states of the input datapins of the component, by datapin name.
+
+        Returns
+        -------
+        Optional[T]
+            Outputs of the last run, or ``None`` if the component has not run or its inputs
+            have changed.
+        """
+        record = self._records.get(component)
+        if record is None or record[0] != inputs:
+            return None
+        return record[1]
+
+    def forget(self, component: Hashable) -> None:
+        """Forget the last run of a component, so that it runs again."""
+        self._records.pop(component, None)
+
+    def clear(self) -> None:
+        """Forget the last runs of all components."""
+        self._records.clear()
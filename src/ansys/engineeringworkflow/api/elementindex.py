@@ -0,0 +1,368 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Element index.
+
+This module contains an index of the elements of a workflow instance by full name and by
+element ID, which engines can use to implement ``get_element_by_name`` and
+``get_parent_element`` without walking the element tree:
+
+- Engines that know their elements when they create them add them to an ``ElementIndex``
+  object directly.
+- Other engines derive their workflow instance class from ``IndexedWorkflowInstanceMixin`` or
+  ``AsyncIndexedWorkflowInstanceMixin``, which build the index by walking the tree from the
+  root element on first use and rebuild it after the engine reports a structure change, either
+  by calling ``invalidate_element_index`` or by returning a new ``get_metadata_version`` number.
+
+The ``get_children`` and ``async_get_children`` functions list the children of one element, for
+code that walks the element tree.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Generic, Iterable, Iterator, List, Mapping, Optional, TypeVar, Union
+
+from .exceptions import NameCollisionError
+from .iasyncworkflow import (
+    IAsyncControlStatement,
+    IAsyncDatapinContainer,
+    IAsyncElement,
+)
+from .iworkflow import IControlStatement, IDatapinContainer, IElement
+
+E = TypeVar("E", bound=Union[IElement, IAsyncElement])
+
+
+def get_children(element: IElement) -> List[IElement]:
+    """
+    Get the datapins and then the child elements of an element.
+
+    Parameters
+    ----------
+    element : IElement
+        Element whose children to get. Elements that have no children give an empty list.
+    """
+    children: List[IElement] = []
+    if isinstance(element, IDatapinContainer):
+        children.extend(element.get_datapins().values())
+    if isinstance(element, IControlStatement):
+        children.extend(element.get_elements().values())
+    return children
+
+
+async def async_get_children(element: IAsyncElement) -> List[IAsyncElement]:
+    """
+    Get the datapins and then the child elements of an asynchronous element.
+
+    See the ``get_children`` function for a description of the parameters.
+    """
+    children: List[IAsyncElement] = []
+    if isinstance(element, IAsyncDatapinContainer):
+        children.extend(_values(await element.get_datapins()))
+    if isinstance(element, IAsyncControlStatement):
+        children.extend(_values(await element.get_elements()))
+    return children
+
+
+def _values(elements) -> List[IAsyncElement]:
+    # The asynchronous interfaces allow either a mapping or a plain collection here.
+    return list(elements.values() if isinstance(elements, Mapping) else elements)
+
+
+class ElementIndex(Generic[E]):
+    """
+    Maps full names and element IDs to the elements of a workflow instance.
+
+    Lookups take constant time. The index is not thread-safe for writing, but may be read from
+    several threads once it has been filled.
+    """
+
+    def __init__(self, elements: Iterable[E] = ()):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        elements : Iterable[E]
+            Elements to add to the index.
+        """
+        self._by_name: Dict[str, E] = {}
+        self._by_id: Dict[str, E] = {}
+        for element in elements:
+            self.add(element)
+
+    @classmethod
+    def from_root(cls, root: IControlStatement) -> ElementIndex[IElement]:
+        """
+        Create an index of the given root element and all of its descendants.
+
+        Parameters
+        ----------
+        root : IControlStatement
+            Root element of the workflow instance.
+        """
+        index: ElementIndex[IElement] = cls()
+        pending: List[IElement] = [root]
+        while pending:
+            element = pending.pop()
+            index.add(element)
+            pending.extend(get_children(element))
+        return index
+
+    @classmethod
+    async def from_async_root(cls, root: IAsyncControlStatement) -> ElementIndex[IAsyncElement]:
+        """
+        Create an index of the given asynchronous root element and all of its descendants.
+
+        Parameters
+        ----------
+        root : IAsyncControlStatement
+            Root element of the workflow instance.
+        """
+        index: ElementIndex[IAsyncElement] = cls()
+        pending: List[IAsyncElement] = [root]
+        while pending:
+            element = pending.pop()
+            index.add(element)
+            pending.extend(await async_get_children(element))
+        return index
+
+    def add(self, element: E) -> None:
+        """
+        Add an element to the index.
+
+        Parameters
+        ----------
+        element : E
+            Element to add.
+
+        Raises
+        ------
+        NameCollisionError
+            If the index already contains an element with the same full name or element ID.
+        """
+        if element.full_name in self._by_name:
+            raise NameCollisionError(f"There is more than one element named {element.full_name!r}.")
+        if element.element_id in self._by_id:
+            raise NameCollisionError(
+                f"There is more than one element with the ID {element.element_id!r}."
+            )
+        self._by_name[element.full_name] = element
+        self._by_id[element.element_id] = element
+
+    def __len__(self) -> int:
+        """Get the number of elements in the index."""
+        return len(self._by_name)
+
+    def __iter__(self) -> Iterator[E]:
+        """Iterate over the elements in the order in which they were added."""
+        return iter(self._by_name.values())
+
+    def get_by_name(self, full_name: str) -> E:
+        """
+        Get an element by its full name.
+
+        Parameters
+        ----------
+        full_name : str
+            Full name of the element in dotted notation.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given name.
+        """
+        try:
+            return self._by_name[full_name]
+        except KeyError:
+            raise ValueError(f"There is no element named {full_name!r}.") from None
+
+    def get_by_id(self, element_id: str) -> E:
+        """
+        Get an element by its element ID.
+
+        Parameters
+        ----------
+        element_id : str
+            ID of the element.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given ID.
+        """
+        try:
+            return self._by_id[element_id]
+        except KeyError:
+            raise ValueError(f"There is no element with the ID {element_id!r}.") from None
+
+    def get_parent(self, element: E) -> Optional[E]:
+        """
+        Get the parent of an element, or ``None`` for the root element.
+
+        Parameters
+        ----------
+        element : E
+            Element whose parent to get.
+        """
+        parent_element_id = element.parent_element_id
+        return self.get_by_id(parent_element_id) if parent_element_id else None
+
+
+class IndexedWorkflowInstanceMixin:
+    """
+    Implements the element lookups of ``IWorkflowInstance`` with an ``ElementIndex`` object.
+
+    The index is built from the ``get_root`` method on first use. It is rebuilt when the
+    ``get_metadata_version`` method returns a new number, which lookups check at most once per
+    ``element_index_version_check_interval`` seconds. Engines that add, remove, or rename
+    elements can call the ``invalidate_element_index`` method to rebuild the index on next use
+    without waiting for the next check. Building the index is idempotent, so concurrent first
+    uses at worst build it twice.
+    """
+
+    element_index_version_check_interval = 1.0
+    """Minimum time between calls to ``get_metadata_version`` by lookups, in seconds."""
+
+    _element_index: Optional[ElementIndex[IElement]] = None
+    _element_index_version: Optional[int] = None
+    _element_index_checked = float("-inf")
+
+    @property
+    def element_index(self) -> ElementIndex[IElement]:
+        """Index of the current elements of the workflow instance."""
+        now = time.monotonic()
+        if now - self._element_index_checked >= self.element_index_version_check_interval:
+            version = self.get_metadata_version()
+            self._element_index_checked = now
+            if version != self._element_index_version:
+                self._element_index_version = version
+                self._element_index = None
+        index = self._element_index
+        if index is None:
+            index = self._element_index = ElementIndex.from_root(self.get_root())
+        return index
+
+    def invalidate_element_index(self) -> None:
+        """Discard the element index so that it is rebuilt on next use."""
+        self._element_index = None
+
+    def get_element_by_name(self, element_name: str) -> IElement:
+        """
+        Get an element of the workflow instance by name.
+
+        Parameters
+        ----------
+        element_name : str
+            Name of the element to retrieve in dotted notation. For example,
+            ``'Root.Component.Thing'``.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given name.
+        """
+        return self.element_index.get_by_name(element_name)
+
+    def get_element_by_id(self, element_id: str) -> IElement:
+        """
+        Get an element of the workflow instance by element ID.
+
+        Parameters
+        ----------
+        element_id : str
+            ID of the element.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given ID.
+        """
+        return self.element_index.get_by_id(element_id)
+
+
+class AsyncIndexedWorkflowInstanceMixin:
+    """
+    Implements the element lookups of ``IAsyncWorkflowInstance`` with an ``ElementIndex`` object.
+
+    The index is built and rebuilt as described for the ``IndexedWorkflowInstanceMixin`` class.
+    """
+
+    element_index_version_check_interval = 1.0
+    """Minimum time between calls to ``get_metadata_version`` by lookups, in seconds."""
+
+    _element_index: Optional[ElementIndex[IAsyncElement]] = None
+    _element_index_version: Optional[int] = None
+    _element_index_checked = float("-inf")
+
+    async def get_element_index(self) -> ElementIndex[IAsyncElement]:
+        """Get the index of the current elements of the workflow instance."""
+        now = time.monotonic()
+        if now - self._element_index_checked >= self.element_index_version_check_interval:
+            version = await self.get_metadata_version()
+            self._element_index_checked = now
+            if version != self._element_index_version:
+                self._element_index_version = version
+                self._element_index = None
+        index = self._element_index
+        if index is None:
+            index = await ElementIndex.from_async_root(await self.get_root())
+            self._element_index = index
+        return index
+
+    def invalidate_element_index(self) -> None:
+        """Discard the element index so that it is rebuilt on next use."""
+        self._element_index = None
+
+    async def get_element_by_name(self, element_name: str) -> IAsyncElement:
+        """
+        Get an element of the workflow instance by name.
+
+        Parameters
+        ----------
+        element_name : str
+            Name of the element to retrieve in dotted notation. For example,
+            ``'Root.Component.Thing'``.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given name.
+        """
+        return (await self.get_element_index()).get_by_name(element_name)
+
+    async def get_element_by_id(self, element_id: str) -> IAsyncElement:
+        """
+        Get an element of the workflow instance by element ID.
+
+        Parameters
+        ----------
+        element_id : str
+            ID of the element.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given ID.
+        """
+        return (await self.get_element_index()).get_by_id(element_id)
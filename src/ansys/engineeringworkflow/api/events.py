@@ -0,0 +1,381 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Workflow event implementations.
+
+This module contains the building blocks for the ``subscribe`` methods of the workflow instance
+interfaces:
+
+- Engines that are notified of state changes and component progress publish events to an
+  ``EventBroadcaster`` object, which forwards them to every subscriber.
+- Asynchronous subscribers receive events through an ``EventStream`` object. A
+  ``PushEventStream`` object is fed by a broadcaster, while a ``PollingEventStream`` object
+  polls the state of a workflow instance for engines that cannot push events.
+- Synchronous subscribers of engines that cannot push events are served by a ``StatePoller``
+  object, which polls the state of the workflow instance on a background thread.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import deque
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Deque, Optional, Tuple
+
+import anyio
+
+from .datatypes import WorkflowEvent, WorkflowEventType, WorkflowInstanceState
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .iasyncworkflow import IAsyncWorkflowInstance
+    from .iworkflow import IWorkflowInstance
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 0.5
+"""Default delay between state queries of the polling fallbacks, in seconds."""
+
+EventCallback = Callable[[WorkflowEvent], None]
+
+
+def _current_call_soon() -> Callable[[Callable[[], None]], Any]:
+    """
+    Get a function that schedules a callback in the current event loop from any thread.
+
+    The function returns without waiting for the callback to run, and raises ``RuntimeError``
+    once the event loop has closed.
+    """
+    try:
+        return asyncio.get_running_loop().call_soon_threadsafe
+    except RuntimeError:
+        # Trio is the only other backend of AnyIO.
+        import trio.lowlevel
+
+        return trio.lowlevel.current_trio_token().run_sync_soon
+
+
+def state_changed(state: WorkflowInstanceState) -> WorkflowEvent:
+    """
+    Create a ``STATE_CHANGED`` event that occurs now.
+
+    Parameters
+    ----------
+    state : WorkflowInstanceState
+        New state of the workflow instance.
+    """
+    return WorkflowEvent(WorkflowEventType.STATE_CHANGED, time.time(), state=state)
+
+
+class EventBroadcaster:
+    """
+    Forwards the events of a workflow instance to any number of subscribers.
+
+    Subscribing and unsubscribing are thread-safe. Events are delivered on the thread that
+    publishes them, in the order in which they are published.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new instance."""
+        self._lock = threading.Lock()
+        # Replaced rather than mutated, so that publishing does not need the lock.
+        self._callbacks: Tuple[EventCallback, ...] = ()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Flag indicating if anyone is subscribed, so that engines can skip creating events."""
+        return bool(self._callbacks)
+
+    def subscribe(self, callback: EventCallback) -> Callable[[], None]:
+        """
+        Call a function with every event published from now on.
+
+        Parameters
+        ----------
+        callback : Callable[[WorkflowEvent], None]
+            Function to call. Exceptions that it raises are logged and otherwise ignored.
+
+        Returns
+        -------
+        Callable[[], None]
+            Function that ends the subscription. Calling it more than once has no effect.
+        """
+        with self._lock:
+            self._callbacks += (callback,)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                callbacks = list(self._callbacks)
+                if callback in callbacks:
+                    callbacks.remove(callback)
+                    self._callbacks = tuple(callbacks)
+
+        return unsubscribe
+
+    def subscribe_stream(self, max_buffer_size: Optional[int] = None) -> PushEventStream:
+        """
+        Create an asynchronous stream of every event published from now on.
+
+        This method must be called from the event loop that consumes the stream.
+
+        Parameters
+        ----------
+        max_buffer_size : Optional[int]
+            Maximum number of events to hold for the consumer. See the ``PushEventStream`` class.
+        """
+        stream = PushEventStream(max_buffer_size)
+        stream._unsubscribe = self.subscribe(stream.put)
+        return stream
+
+    def publish(self, event: WorkflowEvent) -> None:
+        """
+        Deliver an event to all subscribers.
+
+        Parameters
+        ----------
+        event : WorkflowEvent
+            Event to deliver.
+        """
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                _LOGGER.exception("A workflow event subscriber raised an exception.")
+
+
+class EventStream(ABC):
+    """
+    Provides an asynchronous iterator of workflow events.
+
+    Iteration ends once the stream is closed. Use the stream as an asynchronous context manager
+    to close it on exit::
+
+        async with await instance.subscribe() as events:
+            async for event in events:
+                ...
+    """
+
+    def __aiter__(self) -> EventStream:
+        """Get the iterator, which is the stream itself."""
+        return self
+
+    @abstractmethod
+    async def __anext__(self) -> WorkflowEvent:
+        """Wait for the next event."""
+        ...
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """End the subscription, making any pending and future iteration stop."""
+        ...
+
+    async def __aenter__(self) -> EventStream:
+        """Enter the context, returning the stream."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the stream."""
+        await self.aclose()
+
+
+class PushEventStream(EventStream):
+    """
+    Provides an event stream that the engine pushes events into.
+
+    The stream must be created in the event loop that consumes it. Events may be put into it
+    from any thread. Events are buffered until they are consumed. A consumer waiting on another
+    thread is woken by scheduling a callback in its event loop, so publishing never waits for
+    the event loop and engines may publish events while they hold locks that it needs.
+    """
+
+    def __init__(self, max_buffer_size: Optional[int] = None):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        max_buffer_size : Optional[int]
+            Maximum number of events to hold for the consumer. If the buffer is full, new events
+            are dropped and counted by the ``dropped_count`` property. If ``None``, the buffer
+            size is not limited.
+        """
+        self._max_buffer_size = max_buffer_size
+        self._lock = threading.Lock()
+        self._buffer: Deque[WorkflowEvent] = deque()
+        self._call_soon = _current_call_soon()
+        self._loop_thread = threading.get_ident()
+        self._waiter: Optional[anyio.Event] = None
+        self._closed = False
+        self._dropped_count = 0
+        self._unsubscribe: Callable[[], None] = lambda: None
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of events that were dropped because the buffer was full."""
+        return self._dropped_count
+
+    def put(self, event: WorkflowEvent) -> None:
+        """
+        Add an event to the stream.
+
+        This method may be called from any thread.
+
+        Parameters
+        ----------
+        event : WorkflowEvent
+            Event to add.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if self._max_buffer_size is not None and len(self._buffer) >= self._max_buffer_size:
+                self._dropped_count += 1
+                return
+            self._buffer.append(event)
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._wake(waiter)
+
+    def _wake(self, waiter: anyio.Event) -> None:
+        if threading.get_ident() == self._loop_thread:
+            waiter.set()
+            return
+        try:
+            self._call_soon(waiter.set)
+        except RuntimeError:
+            # The event loop has closed, so nobody can be waiting any more.
+            pass
+
+    async def __anext__(self) -> WorkflowEvent:
+        """Wait for the next event."""
+        while True:
+            with self._lock:
+                if self._buffer:
+                    return self._buffer.popleft()
+                if self._closed:
+                    raise StopAsyncIteration
+                waiter = self._waiter = anyio.Event()
+            await waiter.wait()
+
+    async def aclose(self) -> None:
+        """End the subscription, making any pending and future iteration stop."""
+        self._unsubscribe()
+        with self._lock:
+            self._closed = True
+            self._buffer.clear()
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            waiter.set()
+
+
+class PollingEventStream(EventStream):
+    """
+    Provides an event stream that polls the state of an asynchronous workflow instance.
+
+    Only ``STATE_CHANGED`` events are reported, and state changes that are shorter than the
+    polling interval may be missed. The stream reports the current state as its first event.
+    """
+
+    def __init__(self, instance: IAsyncWorkflowInstance, interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : IAsyncWorkflowInstance
+            Workflow instance to poll.
+        interval : float
+            Delay between state queries, in seconds.
+        """
+        self._instance = instance
+        self._interval = interval
+        self._state: Optional[WorkflowInstanceState] = None
+        self._closed = False
+
+    async def __anext__(self) -> WorkflowEvent:
+        """Wait for the next change of state."""
+        while not self._closed:
+            state = await self._instance.get_state()
+            if state != self._state:
+                self._state = state
+                return state_changed(state)
+            await anyio.sleep(self._interval)
+        raise StopAsyncIteration
+
+    async def aclose(self) -> None:
+        """End the subscription, making any future iteration stop."""
+        self._closed = True
+
+
+class StatePoller:
+    """
+    Polls the state of a synchronous workflow instance on a background thread.
+
+    The callback is called with a ``STATE_CHANGED`` event for the current state when polling
+    starts and whenever the state changes after that. State changes that are shorter than the
+    polling interval may be missed.
+    """
+
+    def __init__(
+        self,
+        instance: IWorkflowInstance,
+        callback: EventCallback,
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        Initialize a new instance and start polling.
+
+        Parameters
+        ----------
+        instance : IWorkflowInstance
+            Workflow instance to poll.
+        callback : Callable[[WorkflowEvent], None]
+            Function to call with each event, on the polling thread.
+        interval : float
+            Delay between state queries, in seconds.
+        """
+        self._instance = instance
+        self._callback = callback
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+
+    def _poll(self) -> None:
+        state: Optional[WorkflowInstanceState] = None
+        while not self._stopped.is_set():
+            new_state = self._instance.get_state()
+            if new_state != state:
+                state = new_state
+                try:
+                    self._callback(state_changed(state))
+                except Exception:
+                    _LOGGER.exception("A workflow event subscriber raised an exception.")
+            self._stopped.wait(self._interval)
+
+    def stop(self) -> None:
+        """Stop polling. The callback is not called after this method returns."""
+        self._stopped.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
@@ -32,6 +32,35 @@ class EngineInternalError(Exception):
     """
 
 
+class RunFailedError(Exception):
+    """
+    Indicates that a workflow run has finished in the ``FAILED`` state.
+
+    An error of this type is raised when waiting for the outputs of a run that failed and the
+    original cause of the failure is not available, for example because the engine only reports
+    the state of the workflow instance.
+    """
+
+
+class RunCancelledError(Exception):
+    """
+    Indicates that a workflow run has been cancelled before it finished.
+
+    An error of this type is raised by a run that was stopped by a cancel token or by the
+    ``cancel`` method of its workflow instance or run handle. The workflow instance is then in
+    the ``CANCELLED`` state.
+    """
+
+
+class RunTimeoutError(RunCancelledError, TimeoutError):
+    """
+    Indicates that a workflow run has been cancelled because its deadline passed.
+
+    An error of this type is raised by a run whose ``timeout`` expired before it finished. It is
+    also a ``TimeoutError``.
+    """
+
+
 class NameCollisionError(ValueError):
     """
     Indicates that an operation has failed because of a name collision.
@@ -0,0 +1,128 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Datapin history export.
+
+This module copies the history of numeric datapins into NumPy arrays. The history is read with
+the ``iter_history`` method of the datapin interfaces, one chunk at a time, and each chunk is
+written into arrays that are allocated once, so that no more than one chunk of history entries
+is held as ``VariableState`` objects at any time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from ansys.tools.variableinterop import VariableState, VariableType
+import numpy as np
+
+from .iasyncworkflow import IAsyncDatapin
+from .iworkflow import IDatapin
+
+_DTYPES: Dict[VariableType, type] = {
+    VariableType.REAL: np.float64,
+    VariableType.INTEGER: np.int64,
+    VariableType.BOOLEAN: np.bool_,
+}
+
+
+@dataclass(frozen=True)
+class HistoryArrays:
+    """Stores the history of a numeric datapin as arrays, one element per history entry."""
+
+    hids: Tuple[str, ...]
+    """IDs of the history entries."""
+    values: np.ndarray
+    """Values of the datapin in each history entry."""
+    valid: np.ndarray
+    """Boolean array of the validity flag of the datapin in each history entry."""
+
+
+class _HistoryWriter:
+    def __init__(self, datapin_name: str, value_type: VariableType, hids: Sequence[str]):
+        dtype = _DTYPES.get(value_type)
+        if dtype is None:
+            raise ValueError(
+                f"The datapin {datapin_name!r} is of type {value_type}, which cannot be exported "
+                "to an array."
+            )
+        self.hids = tuple(hids)
+        self._values = np.zeros(len(self.hids), dtype=dtype)
+        self._valid = np.zeros(len(self.hids), dtype=np.bool_)
+        self._length = 0
+
+    def write(self, chunk: Sequence[Tuple[str, VariableState]]) -> None:
+        end = self._length + len(chunk)
+        self._values[self._length : end] = [state.value for _, state in chunk]
+        self._valid[self._length : end] = [state.is_valid for _, state in chunk]
+        self._length = end
+
+    def finish(self) -> HistoryArrays:
+        return HistoryArrays(self.hids, self._values, self._valid)
+
+
+def history_to_arrays(
+    datapin: IDatapin, hids: Optional[Sequence[str]] = None, chunk_size: int = 1000
+) -> HistoryArrays:
+    """
+    Copy the history of a real, integer, or boolean datapin into NumPy arrays.
+
+    Parameters
+    ----------
+    datapin : IDatapin
+        Datapin to export the history of.
+    hids : Optional[Sequence[str]]
+        IDs of the history entries to export, in order. If ``None``, all entries listed by the
+        ``get_history_ids`` method of the datapin are exported.
+    chunk_size : int, default: 1000
+        Maximum number of history entries to read at a time.
+
+    Raises
+    ------
+    ValueError
+        If the datapin is not of a supported type or one of the history IDs does not exist.
+    NotImplementedError
+        If ``hids`` is ``None`` and the engine cannot list the history of the datapin.
+    """
+    if hids is None:
+        hids = datapin.get_history_ids()
+    writer = _HistoryWriter(datapin.full_name, datapin.value_type, hids)
+    for chunk in datapin.iter_history(writer.hids, chunk_size):
+        writer.write(chunk)
+    return writer.finish()
+
+
+async def async_history_to_arrays(
+    datapin: IAsyncDatapin, hids: Optional[Sequence[str]] = None, chunk_size: int = 1000
+) -> HistoryArrays:
+    """
+    Copy the history of a real, integer, or boolean asynchronous datapin into NumPy arrays.
+
+    See the ``history_to_arrays`` function for a description of the parameters.
+    """
+    if hids is None:
+        hids = await datapin.get_history_ids()
+    writer = _HistoryWriter(datapin.full_name, datapin.value_type, hids)
+    async for chunk in datapin.iter_history(writer.hids, chunk_size):
+        writer.write(chunk)
+    return writer.finish()
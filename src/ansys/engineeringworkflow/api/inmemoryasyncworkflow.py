@@ -0,0 +1,437 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+In-memory reference engine, asynchronous style.
+
+This module exposes the engine from the ``inmemoryworkflow`` module through the
+``iasyncworkflow`` interfaces. Every object here wraps its synchronous counterpart. Because the
+in-memory engine never waits on I/O, calls are made directly on the event loop thread, except
+for reading workflow files and for calls that would otherwise block the event loop while a run
+started by ``start_run`` is in progress on another thread.
+"""
+
+from __future__ import annotations
+
+from os import PathLike
+from typing import (
+    AbstractSet,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ansys.tools.variableinterop import (
+    CommonVariableMetadata,
+    IVariableValue,
+    VariableState,
+    VariableType,
+)
+import anyio
+
+from .cancellation import run_sync_cancellable
+from .datatypes import (
+    DatapinLink,
+    Property,
+    RunStatistics,
+    WorkflowEngineInfo,
+    WorkflowInstanceState,
+)
+from .events import PushEventStream
+from .iasyncworkflow import (
+    IAsyncComponent,
+    IAsyncControlStatement,
+    IAsyncDatapin,
+    IAsyncElement,
+    IAsyncFileBasedWorkflowEngine,
+    IAsyncWorkflowInstance,
+)
+from .inmemoryworkflow import (
+    InMemoryComponent,
+    InMemoryControlStatement,
+    InMemoryDatapin,
+    InMemoryElement,
+    InMemoryWorkflowEngine,
+    InMemoryWorkflowInstance,
+    WorkflowDefinition,
+)
+from .linkgraph import LinkGraph
+from .runhandle import AsyncRunHandle
+
+T = TypeVar("T")
+
+
+class AsyncInMemoryWorkflowEngine(IAsyncFileBasedWorkflowEngine):
+    """Provides a workflow engine that runs workflows of Python callables in the current process."""
+
+    def __init__(self, engine: Optional[InMemoryWorkflowEngine] = None):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        engine : Optional[InMemoryWorkflowEngine]
+            Synchronous engine to wrap. If ``None``, a new engine is created.
+        """
+        self._engine = InMemoryWorkflowEngine() if engine is None else engine
+
+    async def get_server_info(self) -> WorkflowEngineInfo:
+        """Get information about the server that is serving the request."""
+        return self._engine.get_server_info()
+
+    async def load_workflow(self, file_name: Union[PathLike, str]) -> AsyncInMemoryWorkflowInstance:
+        """Load a workflow from a local file into the engine."""
+        return AsyncInMemoryWorkflowInstance(
+            await anyio.to_thread.run_sync(self._engine.load_workflow, file_name)
+        )
+
+    async def create_instance(
+        self, definition: WorkflowDefinition
+    ) -> AsyncInMemoryWorkflowInstance:
+        """
+        Create a workflow instance from an already parsed definition.
+
+        Parameters
+        ----------
+        definition : WorkflowDefinition
+            Definition of the workflow to instantiate.
+        """
+        return AsyncInMemoryWorkflowInstance(self._engine.create_instance(definition))
+
+
+class AsyncInMemoryWorkflowInstance(IAsyncWorkflowInstance):
+    """Represents an instantiated in-memory workflow."""
+
+    def __init__(self, instance: InMemoryWorkflowInstance):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : InMemoryWorkflowInstance
+            Synchronous workflow instance to wrap.
+        """
+        self._instance = instance
+        self._wrappers: Dict[str, AsyncInMemoryElement] = {}
+
+    @property
+    def instance(self) -> InMemoryWorkflowInstance:
+        """Synchronous workflow instance wrapped by this object."""
+        return self._instance
+
+    def _wrap(self, element: Optional[InMemoryElement]) -> Optional[AsyncInMemoryElement]:
+        """Get the asynchronous wrapper of an element, creating it on first use."""
+        if element is None:
+            return None
+        wrapper = self._wrappers.get(element.element_id)
+        if wrapper is None:
+            if isinstance(element, InMemoryControlStatement):
+                wrapper = AsyncInMemoryControlStatement(self, element)
+            elif isinstance(element, InMemoryComponent):
+                wrapper = AsyncInMemoryComponent(self, element)
+            else:
+                wrapper = AsyncInMemoryDatapin(self, element)
+            self._wrappers[element.element_id] = wrapper
+        return wrapper
+
+    async def _call(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Call a function that takes the instance lock.
+
+        The function is called on the event loop thread if the lock is free. Otherwise, it is
+        called on a worker thread so that the event loop keeps running until the lock is released.
+        """
+        lock = self._instance._lock
+        if lock.acquire(blocking=False):
+            try:
+                return function(*args)
+            finally:
+                lock.release()
+        return await anyio.to_thread.run_sync(function, *args)
+
+    async def get_state(self) -> WorkflowInstanceState:
+        """Get the state of the workflow instance."""
+        return self._instance.get_state()
+
+    async def subscribe(self, max_buffer_size: Optional[int] = None) -> PushEventStream:
+        """
+        Get a stream of the events of the workflow instance.
+
+        Events are pushed as they occur. See :meth:`.IAsyncWorkflowInstance.subscribe` for a
+        description of the parameters.
+        """
+        return self._instance._events.subscribe_stream(max_buffer_size)
+
+    async def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+    ) -> Mapping[str, VariableState]:
+        """
+        Set a workflow's input datapins and run it.
+
+        The workflow runs on a worker thread, so that the component callables do not block the
+        event loop. If the calling task is cancelled, the run is cancelled, and the cancellation
+        is raised once the run has stopped.
+        See :meth:`.IAsyncWorkflowInstance.run` for a description of the parameters.
+        """
+        arguments = (inputs, reset, validation_names, collect_names)
+        return await run_sync_cancellable(
+            lambda cancel_token: self._instance.run(*arguments, cancel_token=cancel_token)
+        )
+
+    async def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+    ) -> AsyncRunHandle:
+        """
+        Set a workflow's input datapins and start running the workflow.
+
+        The workflow runs on a background thread, which wakes the waiters on the returned handle
+        when the run finishes. See :meth:`.IAsyncWorkflowInstance.start_run` for a description of
+        the parameters.
+        """
+        handle = await self._call(
+            self._instance.start_run, inputs, reset, validation_names, collect_names, timeout
+        )
+        return AsyncRunHandle.from_run_handle(handle)
+
+    async def cancel(self) -> None:
+        """
+        Ask the current run of the workflow instance to stop.
+
+        See :meth:`.InMemoryWorkflowInstance.cancel`.
+        """
+        self._instance.cancel()
+
+    async def get_states(self, datapin_names: AbstractSet[str]) -> Mapping[str, VariableState]:
+        """
+        Get the states of several datapins in one call.
+
+        See :meth:`.IAsyncWorkflowInstance.get_states` for a description of the parameters.
+        """
+        return self._instance.get_states(datapin_names)
+
+    async def set_states(self, states: Mapping[str, VariableState]) -> None:
+        """
+        Set the states of several datapins as a single change.
+
+        See :meth:`.IAsyncWorkflowInstance.set_states` for a description of the parameters.
+        """
+        await self._call(self._instance.set_states, states)
+
+    async def get_root(self) -> AsyncInMemoryControlStatement:
+        """Get the root element of the workflow instance."""
+        return self._wrap(self._instance.get_root())
+
+    async def get_element_by_name(self, element_name: str) -> AsyncInMemoryElement:
+        """
+        Get an element of the workflow instance by name.
+
+        Parameters
+        ----------
+        element_name : str
+            Name of the element to retrieve in dotted notation. For example,
+            ``'Root.Component.Thing'``.
+        """
+        return self._wrap(self._instance.get_element_by_name(element_name))
+
+    async def get_links(self) -> Sequence[DatapinLink]:
+        """Get the links between the datapins of the workflow instance."""
+        return self._instance.get_links()
+
+    async def get_link_graph(self) -> LinkGraph:
+        """Get the links and component dependencies of the workflow instance as a graph."""
+        return self._instance.get_link_graph()
+
+    async def get_run_statistics(self) -> RunStatistics:
+        """Get what happened to each component of the workflow instance during its last run."""
+        return await self._call(self._instance.get_run_statistics)
+
+
+class AsyncInMemoryElement(IAsyncElement):
+    """Provides the common implementation of all asynchronous in-memory elements."""
+
+    def __init__(self, instance: AsyncInMemoryWorkflowInstance, element: InMemoryElement):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : AsyncInMemoryWorkflowInstance
+            Workflow instance that the element belongs to.
+        element : InMemoryElement
+            Synchronous element to wrap.
+        """
+        self._instance = instance
+        self._element = element
+
+    @property
+    def element_id(self) -> str:
+        """Unique ID for the element that is assigned by the system."""
+        return self._element.element_id
+
+    @property
+    def parent_element_id(self) -> str:
+        """Parent element's ID, or a blank string for the root element."""
+        return self._element.parent_element_id
+
+    async def get_parent_element(self) -> Optional[AsyncInMemoryElement]:
+        """Get the parent object of the element."""
+        return self._instance._wrap(self._element.get_parent_element())
+
+    @property
+    def name(self) -> str:
+        """Name of the element."""
+        return self._element.name
+
+    @property
+    def full_name(self) -> str:
+        """Full name of the element in dotted notation."""
+        return self._element.full_name
+
+    async def get_property(self, property_name: str) -> Property:
+        """Get a property by name."""
+        return self._element.get_property(property_name)
+
+    async def get_property_names(self) -> AbstractSet[str]:
+        """Get the names of all properties."""
+        return self._element.get_property_names()
+
+    async def get_properties(self) -> Mapping[str, Property]:
+        """Get all properties of the element."""
+        return self._element.get_properties()
+
+    async def set_property(self, property_name: str, property_value: IVariableValue) -> None:
+        """Create or set a property on the element."""
+        self._element.set_property(property_name, property_value)
+
+
+class AsyncInMemoryControlStatement(AsyncInMemoryElement, IAsyncControlStatement):
+    """Provides a control statement of an asynchronous in-memory workflow."""
+
+    _element: InMemoryControlStatement
+
+    @property
+    def control_type(self) -> str:
+        """Type of the control statement."""
+        return self._element.control_type
+
+    async def get_elements(self) -> Mapping[str, AsyncInMemoryElement]:
+        """Get all child elements of the control statement in execution order."""
+        return {
+            name: self._instance._wrap(element)
+            for name, element in self._element.get_elements().items()
+        }
+
+    async def get_datapins(self) -> Mapping[str, AsyncInMemoryDatapin]:
+        """Get the datapins of the control statement."""
+        return {
+            name: self._instance._wrap(datapin)
+            for name, datapin in self._element.get_datapins().items()
+        }
+
+
+class AsyncInMemoryComponent(AsyncInMemoryElement, IAsyncComponent):
+    """Provides a component of an asynchronous in-memory workflow."""
+
+    _element: InMemoryComponent
+
+    @property
+    def pacz_url(self) -> Optional[str]:
+        """URL to the PACZ file or directory, if the definition specifies one."""
+        return self._element.pacz_url
+
+    async def get_datapins(self) -> Mapping[str, AsyncInMemoryDatapin]:
+        """Get the datapins of the component, inputs first."""
+        return {
+            name: self._instance._wrap(datapin)
+            for name, datapin in self._element.get_datapins().items()
+        }
+
+
+class AsyncInMemoryDatapin(AsyncInMemoryElement, IAsyncDatapin):
+    """Provides a datapin of an asynchronous in-memory workflow."""
+
+    _element: InMemoryDatapin
+
+    async def get_metadata(self) -> CommonVariableMetadata:
+        """Get a copy of the metadata for the datapin."""
+        return self._element.get_metadata()
+
+    @property
+    def value_type(self) -> VariableType:
+        """Get the type of value that the datapin stores."""
+        return self._element.value_type
+
+    async def get_state(self, hid: Optional[str] = None) -> VariableState:
+        """Get the state of the datapin."""
+        return self._element.get_state(hid)
+
+    async def set_state(self, state: VariableState) -> None:
+        """Set the state of the datapin."""
+        await self._instance._call(self._element.set_state, state)
+
+    async def get_history_ids(self) -> Sequence[str]:
+        """Get the IDs of the recorded history entries of the datapin, oldest first."""
+        return self._element.get_history_ids()
+
+    async def iter_history(
+        self, hids: Optional[Sequence[str]] = None, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Tuple[str, VariableState]]]:
+        """
+        Get history entries of the datapin in chunks.
+
+        See :meth:`.IAsyncDatapin.iter_history` for a description of the parameters.
+        """
+        for chunk in self._element.iter_history(hids, chunk_size):
+            yield chunk
+
+    async def get_upstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """Get the datapins that this datapin depends on."""
+        return self._element.get_upstream_datapins(transitive)
+
+    async def get_downstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """Get the datapins that depend on this datapin."""
+        return self._element.get_downstream_datapins(transitive)
+
+    @property
+    def is_input_to_component(self) -> bool:
+        """Flag indicating if the datapin is an input in the context of the component it is on."""
+        return self._element.is_input_to_component
+
+    @property
+    def is_input_to_workflow(self) -> bool:
+        """Flag indicating if the datapin is an unlinked input in the context of the workflow."""
+        return self._element.is_input_to_workflow
@@ -0,0 +1,1472 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+In-memory reference engine.
+
+This module contains a pure-Python implementation of the synchronous API that runs
+entirely in the current process. It does not require any Ansys product to be installed
+and is intended as a fast local stand-in for testing, benchmarking, and load-testing
+code written against the ``iworkflow`` interfaces.
+
+Workflows are described by JSON files of this form::
+
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "datapins": {"x": {"type": "real", "is_input": true, "value": 2.0}},
+            "elements": [
+                {
+                    "name": "Square",
+                    "callable": "my_package.my_module:square",
+                    "inputs": {"a": {"type": "real"}},
+                    "outputs": {"b": {"type": "real"}}
+                }
+            ]
+        },
+        "links": [{"source": "Root.x", "target": "Root.Square.a"}]
+    }
+
+An element with a ``control_type`` key is a control statement. Any other element is a
+component whose ``callable`` is imported from the given ``module:attribute`` path. When a
+component runs, its callable is invoked with the values of its input datapins as keyword
+arguments and must return a mapping of output datapin names to values.
+
+Datapin definitions accept the ``type``, ``value``, ``is_input``, ``description``, ``units``,
+``lower_bound``, ``upper_bound``, and ``enumerated_values`` keys. Element and datapin names may
+not contain dots. Property values are plain JSON values whose variable type is inferred.
+
+Children of a control statement are run in the order in which they are defined, whatever the
+control type, unless the engine is given a ``ParallelExecutor`` object. The children of
+``parallel`` control statements then run concurrently.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+import importlib
+import json
+from os import PathLike
+import threading
+import time
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ansys.tools.variableinterop import (
+    BooleanArrayMetadata,
+    BooleanArrayValue,
+    BooleanMetadata,
+    BooleanValue,
+    CommonVariableMetadata,
+    IntegerArrayMetadata,
+    IntegerArrayValue,
+    IntegerMetadata,
+    IntegerValue,
+    IVariableValue,
+    NumericMetadata,
+    RealArrayMetadata,
+    RealArrayValue,
+    RealMetadata,
+    RealValue,
+    StringArrayMetadata,
+    StringArrayValue,
+    StringMetadata,
+    StringValue,
+    VariableState,
+    VariableType,
+)
+import anyio
+import numpy as np
+
+from . import __version__
+from .cancellation import cancel_scope, check_cancelled, deadline_after
+from .datatypes import (
+    CancelToken,
+    DatapinLink,
+    ElementRunStatus,
+    Property,
+    RunStatistics,
+    WorkflowEngineInfo,
+    WorkflowEvent,
+    WorkflowEventType,
+    WorkflowInstanceState,
+)
+from .dependencies import DependencyGraph, InputChangeTracker
+from .elementindex import ElementIndex
+from .events import EventBroadcaster, state_changed
+from .exceptions import NameCollisionError, RunCancelledError, ValueOutOfRangeError
+from .iworkflow import (
+    IComponent,
+    IControlStatement,
+    IDatapin,
+    IElement,
+    IFileBasedWorkflowEngine,
+    IWorkflowInstance,
+)
+from .linkgraph import LinkGraph
+from .loadercache import WorkflowLoaderCache
+from .parallelexecutor import ExecutionPlan, ParallelExecutor
+from .runhandle import RunHandle
+
+_METADATA_TYPES: Dict[VariableType, Callable[[], CommonVariableMetadata]] = {
+    VariableType.REAL: RealMetadata,
+    VariableType.INTEGER: IntegerMetadata,
+    VariableType.BOOLEAN: BooleanMetadata,
+    VariableType.STRING: StringMetadata,
+    VariableType.REAL_ARRAY: RealArrayMetadata,
+    VariableType.INTEGER_ARRAY: IntegerArrayMetadata,
+    VariableType.BOOLEAN_ARRAY: BooleanArrayMetadata,
+    VariableType.STRING_ARRAY: StringArrayMetadata,
+}
+
+_SCALAR_VALUE_TYPES: Dict[VariableType, Callable[[Any], IVariableValue]] = {
+    VariableType.REAL: RealValue,
+    VariableType.INTEGER: IntegerValue,
+    VariableType.BOOLEAN: BooleanValue,
+    VariableType.STRING: StringValue,
+}
+
+_ARRAY_VALUE_TYPES: Dict[VariableType, Callable[..., IVariableValue]] = {
+    VariableType.REAL_ARRAY: RealArrayValue,
+    VariableType.INTEGER_ARRAY: IntegerArrayValue,
+    VariableType.BOOLEAN_ARRAY: BooleanArrayValue,
+    VariableType.STRING_ARRAY: StringArrayValue,
+}
+
+
+def _to_value(value_type: VariableType, raw: Any) -> IVariableValue:
+    """Convert a plain Python value or an ``IVariableValue`` object to the given type."""
+    if isinstance(raw, IVariableValue):
+        if raw.variable_type == value_type:
+            return raw
+        return _METADATA_TYPES[value_type]().runtime_convert(raw)
+    if value_type in _SCALAR_VALUE_TYPES:
+        return _SCALAR_VALUE_TYPES[value_type](raw)
+    return _ARRAY_VALUE_TYPES[value_type](values=raw)
+
+
+def _default_value(value_type: VariableType, metadata: CommonVariableMetadata) -> IVariableValue:
+    """
+    Get the initial value of a datapin that has no value in its definition.
+
+    This follows the same rules as ``CommonVariableMetadata.get_default_value``, which is too
+    slow to call for every datapin of a large workflow.
+    """
+    if value_type in _ARRAY_VALUE_TYPES:
+        return _ARRAY_VALUE_TYPES[value_type](values=[])
+    enumerated_values = getattr(metadata, "enumerated_values", None)
+    if enumerated_values:
+        return enumerated_values[0]
+    value = _SCALAR_VALUE_TYPES[value_type]()
+    lower_bound = getattr(metadata, "lower_bound", None)
+    upper_bound = getattr(metadata, "upper_bound", None)
+    if lower_bound is not None and value < lower_bound:
+        return lower_bound
+    if upper_bound is not None and value > upper_bound:
+        return upper_bound
+    return value
+
+
+def _infer_value(raw: Any) -> IVariableValue:
+    """Convert a plain JSON value to an ``IVariableValue`` object of the matching type."""
+    if isinstance(raw, IVariableValue):
+        return raw
+    if isinstance(raw, bool):
+        return BooleanValue(raw)
+    if isinstance(raw, int):
+        return IntegerValue(raw)
+    if isinstance(raw, float):
+        return RealValue(raw)
+    if isinstance(raw, str):
+        return StringValue(raw)
+    if isinstance(raw, (list, tuple)) and len(raw) > 0:
+        element_type = _infer_value(raw[0]).variable_type
+        return _to_value(VariableType[element_type.name + "_ARRAY"], raw)
+    raise ValueError(f"Cannot infer a variable type for the value {raw!r}.")
+
+
+def _timed_call(
+    function: Callable[..., Mapping[str, Any]], arguments: Mapping[str, Any]
+) -> Tuple[float, Mapping[str, Any]]:
+    """Call a component callable and measure how long it takes, where the call runs."""
+    start = time.perf_counter()
+    results = function(**arguments)
+    return time.perf_counter() - start, results
+
+
+def _check_name(name: Any, what: str) -> str:
+    """Check that a name from a workflow definition is usable in dotted notation."""
+    if not isinstance(name, str) or name == "" or "." in name:
+        raise ValueError(f"Invalid {what} name {name!r}. Names must be non-empty and dot-free.")
+    return name
+
+
+def _check_unique(names: Iterable[str], owner: str) -> None:
+    """Raise a ``NameCollisionError`` if any name appears more than once."""
+    seen = set()
+    for name in names:
+        if name in seen:
+            raise NameCollisionError(f"The name {name!r} is used more than once in {owner!r}.")
+        seen.add(name)
+
+
+def _resolve_callable(spec: Union[str, Callable[..., Mapping[str, Any]]]) -> Callable:
+    """Import a component callable given as a ``module:attribute`` path."""
+    if callable(spec):
+        return spec
+    module_name, _, attribute_path = str(spec).partition(":")
+    if not attribute_path:
+        raise ValueError(f"Invalid callable {spec!r}. Expected the 'module:attribute' form.")
+    target: Any = importlib.import_module(module_name)
+    for attribute in attribute_path.split("."):
+        target = getattr(target, attribute)
+    if not callable(target):
+        raise ValueError(f"The object {spec!r} is not callable.")
+    return target
+
+
+@dataclass(frozen=True)
+class DatapinDefinition:
+    """Parsed definition of a datapin in an in-memory workflow."""
+
+    name: str
+    """Short name of the datapin."""
+    value_type: VariableType
+    """Type of value that the datapin stores."""
+    is_input: bool
+    """Flag indicating if the datapin is an input to its component or control statement."""
+    metadata: CommonVariableMetadata
+    """Metadata of the datapin. Instances hand out copies, so this object is never modified."""
+    default_value: IVariableValue
+    """Value that the datapin has when an instance is created."""
+    # The initial states are built on first use and then shared by all instances created from
+    # the definition, so that creating an instance from a cached definition does not construct a
+    # state object for every datapin.
+
+    @cached_property
+    def _valid_state(self) -> VariableState:
+        return VariableState(self.default_value, True)
+
+    @cached_property
+    def _invalid_state(self) -> VariableState:
+        return VariableState(self.default_value, False)
+
+    @classmethod
+    def from_dict(cls, name: str, data: Mapping[str, Any], is_input: bool) -> DatapinDefinition:
+        """
+        Parse a datapin definition.
+
+        Parameters
+        ----------
+        name : str
+            Short name of the datapin.
+        data : Mapping[str, Any]
+            Datapin definition as read from the workflow file.
+        is_input : bool
+            Default for the ``is_input`` flag if the definition does not specify it.
+        """
+        try:
+            value_type = VariableType[str(data["type"]).upper()]
+        except KeyError:
+            raise ValueError(f"Datapin {name!r} has a missing or unsupported type.") from None
+        if value_type not in _METADATA_TYPES:
+            raise ValueError(f"Datapin {name!r} has the unsupported type {value_type.name}.")
+        metadata = _METADATA_TYPES[value_type]()
+        metadata.description = str(data.get("description", ""))
+        if isinstance(metadata, NumericMetadata):
+            metadata.units = str(data.get("units", ""))
+        element_type = _element_type(value_type)
+        if "lower_bound" in data:
+            metadata.lower_bound = _to_value(element_type, data["lower_bound"])
+        if "upper_bound" in data:
+            metadata.upper_bound = _to_value(element_type, data["upper_bound"])
+        if "enumerated_values" in data:
+            metadata.enumerated_values = [
+                _to_value(element_type, raw) for raw in data["enumerated_values"]
+            ]
+        if "value" in data:
+            default_value = _to_value(value_type, data["value"])
+        else:
+            default_value = _default_value(value_type, metadata)
+        return cls(
+            _check_name(name, "datapin"),
+            value_type,
+            bool(data.get("is_input", is_input)),
+            metadata,
+            default_value,
+        )
+
+
+@dataclass(frozen=True)
+class ComponentDefinition:
+    """Parsed definition of a component in an in-memory workflow."""
+
+    name: str
+    """Short name of the component."""
+    function: Callable[..., Mapping[str, Any]]
+    """Callable that computes the output values from the input values."""
+    datapins: Tuple[DatapinDefinition, ...]
+    """Input datapins followed by output datapins."""
+    properties: Mapping[str, IVariableValue] = field(default_factory=dict)
+    """Initial properties of the component."""
+    pacz_url: Optional[str] = None
+    """URL to the PACZ definition of the component, if any."""
+
+
+@dataclass(frozen=True)
+class ControlStatementDefinition:
+    """Parsed definition of a control statement in an in-memory workflow."""
+
+    name: str
+    """Short name of the control statement."""
+    control_type: str
+    """Type of the control statement."""
+    datapins: Tuple[DatapinDefinition, ...]
+    """Datapins that belong to the control statement itself."""
+    elements: Tuple[Union[ControlStatementDefinition, ComponentDefinition], ...]
+    """Child elements in execution order."""
+    properties: Mapping[str, IVariableValue] = field(default_factory=dict)
+    """Initial properties of the control statement."""
+
+
+ElementDefinition = Union[ControlStatementDefinition, ComponentDefinition]
+
+
+def _element_type(value_type: VariableType) -> VariableType:
+    """Get the scalar type of the elements of an array type."""
+    return VariableType[value_type.name.replace("_ARRAY", "")]
+
+
+def _parse_properties(data: Mapping[str, Any]) -> Mapping[str, IVariableValue]:
+    return {name: _infer_value(raw) for name, raw in data.get("properties", {}).items()}
+
+
+def _parse_element(data: Mapping[str, Any]) -> ElementDefinition:
+    name = _check_name(data.get("name"), "element")
+    if "control_type" in data:
+        datapins = tuple(
+            DatapinDefinition.from_dict(pin_name, pin_data, is_input=False)
+            for pin_name, pin_data in data.get("datapins", {}).items()
+        )
+        elements = tuple(_parse_element(child) for child in data.get("elements", ()))
+        _check_unique([pin.name for pin in datapins] + [child.name for child in elements], name)
+        return ControlStatementDefinition(
+            name, str(data["control_type"]), datapins, elements, _parse_properties(data)
+        )
+    if "callable" not in data:
+        raise ValueError(f"Element {name!r} has neither a 'control_type' nor a 'callable'.")
+    datapins = tuple(
+        DatapinDefinition.from_dict(pin_name, pin_data, is_input=True)
+        for pin_name, pin_data in data.get("inputs", {}).items()
+    ) + tuple(
+        DatapinDefinition.from_dict(pin_name, pin_data, is_input=False)
+        for pin_name, pin_data in data.get("outputs", {}).items()
+    )
+    _check_unique([pin.name for pin in datapins], name)
+    return ComponentDefinition(
+        name,
+        _resolve_callable(data["callable"]),
+        datapins,
+        _parse_properties(data),
+        data.get("pacz_url"),
+    )
+
+
+@dataclass(frozen=True)
+class WorkflowDefinition:
+    """
+    Parsed in-memory workflow.
+
+    A definition is immutable and may be shared by any number of workflow instances.
+    """
+
+    root: ControlStatementDefinition
+    """Root control statement of the workflow."""
+    links: Tuple[Tuple[str, str], ...] = ()
+    """Pairs of full datapin names, in ``(source, target)`` order."""
+
+    @cached_property
+    def _component_datapins(self) -> Mapping[str, Tuple[List[str], List[str]]]:
+        """Full names of the input and output datapins of each component, in run order."""
+        components: Dict[str, Tuple[List[str], List[str]]] = {}
+        pending: List[Tuple[str, ElementDefinition]] = [("", self.root)]
+        while pending:
+            prefix, definition = pending.pop()
+            name = prefix + definition.name
+            if isinstance(definition, ControlStatementDefinition):
+                # Reversed so that components are found in execution order.
+                pending.extend((name + ".", child) for child in reversed(definition.elements))
+            else:
+                inputs, outputs = components[name] = ([], [])
+                for datapin in definition.datapins:
+                    (inputs if datapin.is_input else outputs).append(f"{name}.{datapin.name}")
+        return components
+
+    @cached_property
+    def _control_statements(self) -> Mapping[str, Tuple[str, List[str]]]:
+        """Control type and full names of the children of each control statement."""
+        control_statements: Dict[str, Tuple[str, List[str]]] = {}
+        pending: List[Tuple[str, ControlStatementDefinition]] = [("", self.root)]
+        while pending:
+            prefix, definition = pending.pop()
+            name = prefix + definition.name
+            control_statements[name] = (
+                definition.control_type,
+                [f"{name}.{child.name}" for child in definition.elements],
+            )
+            pending.extend(
+                (name + ".", child)
+                for child in definition.elements
+                if isinstance(child, ControlStatementDefinition)
+            )
+        return control_statements
+
+    @cached_property
+    def execution_plan(self) -> ExecutionPlan:
+        """Order in which a ``ParallelExecutor`` object runs the components of the workflow."""
+        return ExecutionPlan.build(self.root.name, self._control_statements, self.dependency_graph)
+
+    @cached_property
+    def dependency_graph(self) -> DependencyGraph:
+        """Data dependencies between the components, shared by all instances of the workflow."""
+        return DependencyGraph(self._component_datapins, self.links)
+
+    @cached_property
+    def link_graph(self) -> LinkGraph:
+        """Links and component dependencies, shared by all instances of the workflow."""
+        return LinkGraph(self.links, self._component_datapins)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> WorkflowDefinition:
+        """
+        Parse a workflow definition from its JSON representation.
+
+        Component callables may be given as callable objects instead of ``module:attribute``
+        strings, which makes it possible to build workflows programmatically.
+
+        Parameters
+        ----------
+        data : Mapping[str, Any]
+            Workflow definition in the form documented by this module.
+        """
+        root = _parse_element(data["root"])
+        if not isinstance(root, ControlStatementDefinition):
+            raise ValueError("The root element of a workflow must be a control statement.")
+        links = tuple((str(link["source"]), str(link["target"])) for link in data.get("links", ()))
+        return cls(root, links)
+
+    @classmethod
+    def from_json(cls, text: Union[str, bytes]) -> WorkflowDefinition:
+        """
+        Parse a workflow definition from JSON text.
+
+        Parameters
+        ----------
+        text : Union[str, bytes]
+            JSON workflow definition. Bytes must be UTF-8 encoded.
+        """
+        return cls.from_dict(json.loads(text))
+
+    @classmethod
+    def from_file(cls, file_name: Union[PathLike, str]) -> WorkflowDefinition:
+        """
+        Read and parse a workflow definition file.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the JSON workflow definition.
+        """
+        with open(file_name, "r", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
+
+
+class InMemoryWorkflowEngine(IFileBasedWorkflowEngine):
+    """Provides a workflow engine that runs workflows of Python callables in the current process."""
+
+    def __init__(
+        self,
+        record_history: bool = False,
+        loader_cache: Optional[WorkflowLoaderCache[WorkflowDefinition]] = None,
+        executor: Optional[ParallelExecutor] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        record_history : bool, default: False
+            Whether the workflow instances created by the engine record the states of all of
+            their datapins after each successful run. See the ``InMemoryWorkflowInstance`` class.
+        loader_cache : Optional[WorkflowLoaderCache[WorkflowDefinition]], default: None
+            Cache of parsed workflow files to use in the ``load_workflow`` method, which may be
+            shared by several engines. Its parse function should be the
+            ``WorkflowDefinition.from_json`` method. If ``None``, each load parses the file.
+        executor : Optional[ParallelExecutor], default: None
+            Executor that the workflow instances created by the engine use to run the children
+            of parallel control statements concurrently. If ``None``, all components run one
+            after the other on the thread that runs the workflow.
+        """
+        self._record_history = record_history
+        self._loader_cache = loader_cache
+        self._executor = executor
+
+    def get_server_info(self) -> WorkflowEngineInfo:
+        """
+        Get information about the server that is serving the request.
+
+        Returns
+        -------
+        WorkflowEngineInfo
+            Object with information about the in-memory engine.
+        """
+        return WorkflowEngineInfo(
+            release_year=0,
+            release_id=0,
+            build=0,
+            is_release_build=False,
+            build_type="in-memory",
+            version_as_string=f"In-memory reference engine {__version__}",
+            server_type="InMemory",
+            install_location=None,
+            base_url=None,
+        )
+
+    def load_workflow(self, file_name: Union[PathLike, str]) -> InMemoryWorkflowInstance:
+        """Load a workflow from a local file into the engine."""
+        if self._loader_cache is None:
+            return self.create_instance(WorkflowDefinition.from_file(file_name))
+        return self.create_instance(self._loader_cache.load(file_name))
+
+    def create_instance(self, definition: WorkflowDefinition) -> InMemoryWorkflowInstance:
+        """
+        Create a workflow instance from an already parsed definition.
+
+        Parameters
+        ----------
+        definition : WorkflowDefinition
+            Definition of the workflow to instantiate.
+        """
+        return InMemoryWorkflowInstance(definition, self._record_history, self._executor)
+
+
+class InMemoryWorkflowInstance(IWorkflowInstance):
+    """
+    Represents an instantiated in-memory workflow.
+
+    Runs are serialized: while one run is in progress, other calls to ``run`` block until
+    it has finished.
+
+    If history recording is enabled, the states of all datapins are recorded after each
+    successful run. The history ID of each record is the number of earlier records, as a string.
+    """
+
+    def __init__(
+        self,
+        definition: WorkflowDefinition,
+        record_history: bool = False,
+        executor: Optional[ParallelExecutor] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        definition : WorkflowDefinition
+            Definition of the workflow to instantiate.
+        record_history : bool, default: False
+            Whether to record the states of all datapins after each successful run.
+        executor : Optional[ParallelExecutor], default: None
+            Executor to run the children of parallel control statements concurrently with.
+            Runs then start an event loop of their own, so the synchronous methods of the
+            instance must not be called from a thread that runs an event loop.
+        """
+        self._definition = definition
+        self._executor = executor
+        self._lock = threading.RLock()
+        self._run_started = threading.Condition(self._lock)
+        self._starting_run = False
+        self._state = WorkflowInstanceState.INVALID
+        self._run_token: Optional[CancelToken] = None
+        self._events = EventBroadcaster()
+        self._index: ElementIndex[InMemoryElement] = ElementIndex()
+        self._components: List[InMemoryComponent] = []
+        self._input_changes: InputChangeTracker[Tuple[VariableState, ...]] = InputChangeTracker()
+        self._root = self._build(definition.root, None)
+        self._link_sources: Dict[InMemoryDatapin, InMemoryDatapin] = {}
+        self._link_targets: Dict[InMemoryDatapin, List[InMemoryDatapin]] = {}
+        for source_name, target_name in definition.links:
+            self._add_link(source_name, target_name)
+        for target in self._link_sources:
+            target._state = target._definition._invalid_state
+        self._record_history = record_history
+        self._history_ids: List[str] = []
+        self._history_indices: Dict[str, int] = {}
+        self._datapins = [
+            element for element in self._index if isinstance(element, InMemoryDatapin)
+        ]
+        self._linked_container_pins = [
+            pin
+            for pin in self._link_sources
+            if not isinstance(pin.get_parent_element(), InMemoryComponent)
+        ]
+        self._start_statistics(())
+
+    def _build(
+        self, definition: ElementDefinition, parent: Optional[InMemoryControlStatement]
+    ) -> Any:
+        element: Union[InMemoryControlStatement, InMemoryComponent]
+        if isinstance(definition, ControlStatementDefinition):
+            element = InMemoryControlStatement(self, definition, parent)
+            self._register(element)
+            for pin_definition in definition.datapins:
+                element._datapins[pin_definition.name] = self._register(
+                    InMemoryDatapin(self, pin_definition, element)
+                )
+            for child_definition in definition.elements:
+                element._elements[child_definition.name] = self._build(child_definition, element)
+        else:
+            element = InMemoryComponent(self, definition, parent)
+            self._register(element)
+            self._components.append(element)
+            for pin_definition in definition.datapins:
+                datapin = self._register(InMemoryDatapin(self, pin_definition, element))
+                element._datapins[pin_definition.name] = datapin
+                if pin_definition.is_input:
+                    element._input_datapins.append(datapin)
+                else:
+                    element._output_datapins.append(datapin)
+        return element
+
+    def _register(self, element: Any) -> Any:
+        self._index.add(element)
+        return element
+
+    def _add_link(self, source_name: str, target_name: str) -> None:
+        source = self._get_datapin(source_name)
+        target = self._get_datapin(target_name)
+        if target in self._link_sources:
+            raise ValueError(f"The datapin {target_name!r} is the target of more than one link.")
+        self._link_sources[target] = source
+        self._link_targets.setdefault(source, []).append(target)
+
+    def _get_datapin(self, datapin_name: str) -> InMemoryDatapin:
+        element = self.get_element_by_name(datapin_name)
+        if not isinstance(element, InMemoryDatapin):
+            raise ValueError(f"The element {datapin_name!r} is not a datapin.")
+        return element
+
+    @property
+    def definition(self) -> WorkflowDefinition:
+        """Definition that the instance was created from."""
+        return self._definition
+
+    def get_state(self) -> WorkflowInstanceState:
+        """Get the state of the workflow instance."""
+        return self._state
+
+    def _set_state(self, state: WorkflowInstanceState) -> None:
+        if state != self._state:
+            self._state = state
+            if self._events.has_subscribers:
+                self._events.publish(state_changed(state))
+
+    def subscribe(self, callback: Callable[[WorkflowEvent], None]) -> Callable[[], None]:
+        """
+        Call a function with the events of the workflow instance until unsubscribed.
+
+        Events are pushed as they occur, on the thread that causes them, while the instance
+        lock is held. See :meth:`.IWorkflowInstance.subscribe` for a description of the
+        parameters.
+        """
+        return self._events.subscribe(callback)
+
+    def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Mapping[str, VariableState]:
+        """
+        Set a workflow's input datapins and run it.
+
+        If ``validation_names`` is not empty, only the invalid components that the named
+        elements depend on are run. The workflow instance then ends in the ``INVALID`` state if
+        any other component is still invalid. Components whose inputs are equal to those of
+        their last run are made valid without running them, unless ``reset`` is ``True``.
+
+        Cancellation and deadlines are checked before each component starts. Components that
+        are already running are not interrupted, because Python threads cannot be stopped, and
+        keep their outputs when they finish. See :meth:`.IWorkflowInstance.run` for a description of
+        the parameters.
+        """
+        deadline = deadline_after(timeout)
+        with self._lock:
+            self._wait_for_started_run()
+            self._prepare_run(inputs, reset)
+            components = self._required_components(validation_names)
+            self._execute(components, CancelToken(), deadline, cancel_token)
+            return self._collect(collect_names)
+
+    def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> RunHandle:
+        """
+        Set a workflow's input datapins and start running the workflow.
+
+        The inputs are set before this method returns. The workflow then runs on a background
+        thread, which completes the returned handle when the run finishes. Other calls that
+        change the instance wait until that thread has taken over the run, so that they cannot
+        change its inputs. Components are chosen, and cancellation is checked, as in the ``run``
+        method.
+        See :meth:`.IWorkflowInstance.start_run` for a description of the parameters.
+        """
+        deadline = deadline_after(timeout)
+        run_token = CancelToken()
+        handle = RunHandle(run_token.cancel)
+        with self._lock:
+            self._wait_for_started_run()
+            components = self._required_components(validation_names)
+            self._prepare_run(inputs, reset)
+            self._set_state(WorkflowInstanceState.RUNNING)
+            self._run_token = run_token
+            self._starting_run = True
+            thread = threading.Thread(
+                target=self._run_in_background,
+                args=(handle, components, collect_names, run_token, deadline, cancel_token),
+                daemon=True,
+            )
+            thread.start()
+        return handle
+
+    def _run_in_background(
+        self,
+        handle: RunHandle,
+        components: Sequence[InMemoryComponent],
+        collect_names: AbstractSet[str],
+        run_token: CancelToken,
+        deadline: Optional[float],
+        cancel_token: Optional[CancelToken],
+    ) -> None:
+        with self._lock:
+            self._starting_run = False
+            self._run_started.notify_all()
+            try:
+                self._execute(components, run_token, deadline, cancel_token)
+                outputs = self._collect(collect_names)
+            except Exception as error:
+                handle.set_exception(error)
+                return
+        handle.set_result(outputs)
+
+    def _wait_for_started_run(self) -> None:
+        """
+        Wait until the background thread of a started run has taken over the instance lock.
+
+        The caller must hold the instance lock, which is released while waiting.
+        """
+        while self._starting_run:
+            self._run_started.wait()
+
+    def cancel(self) -> None:
+        """
+        Ask the current run of the workflow instance to stop.
+
+        Components that are running finish, but no other component starts.
+        See :meth:`.IWorkflowInstance.cancel` for the behavior of cancelled runs.
+        """
+        run_token = self._run_token
+        if run_token is not None:
+            run_token.cancel()
+
+    def get_root(self) -> InMemoryControlStatement:
+        """Get the root element of the workflow instance."""
+        return self._root
+
+    def get_element_by_name(self, element_name: str) -> InMemoryElement:
+        """
+        Get an element of the workflow instance by name.
+
+        Parameters
+        ----------
+        element_name : str
+            Name of the element to retrieve in dotted notation. For example,
+            ``'Root.Component.Thing'``.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given name.
+        """
+        return self._index.get_by_name(element_name)
+
+    def get_element_by_id(self, element_id: str) -> InMemoryElement:
+        """
+        Get an element of the workflow instance by element ID.
+
+        Parameters
+        ----------
+        element_id : str
+            ID of the element.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with the given ID.
+        """
+        return self._index.get_by_id(element_id)
+
+    def get_links(self) -> Sequence[DatapinLink]:
+        """Get the links between the datapins of the workflow instance."""
+        return [DatapinLink(source, target) for source, target in self._definition.links]
+
+    def get_link_graph(self) -> LinkGraph:
+        """
+        Get the links and component dependencies of the workflow instance as a graph.
+
+        The graph is shared by all instances of the same workflow definition.
+        """
+        return self._definition.link_graph
+
+    def get_run_statistics(self) -> RunStatistics:
+        """
+        Get what happened to each component of the workflow instance during its last run.
+
+        Components are listed in the order in which they are defined. If a run is in progress,
+        this method waits for it to finish.
+        """
+        with self._lock:
+            self._wait_for_started_run()
+            statuses = tuple(self._statuses)
+            return RunStatistics(
+                element_names=tuple(component.full_name for component in self._components),
+                wall_times=tuple(self._wall_times),
+                queue_waits=tuple(self._queue_waits),
+                execution_counts=tuple(
+                    int(status in (ElementRunStatus.EXECUTED, ElementRunStatus.FAILED))
+                    for status in statuses
+                ),
+                statuses=statuses,
+            )
+
+    def get_states(self, datapin_names: AbstractSet[str]) -> Mapping[str, VariableState]:
+        """
+        Get the states of several datapins in one call.
+
+        See :meth:`.IWorkflowInstance.get_states` for a description of the parameters.
+        """
+        datapins = [self._get_datapin(name) for name in datapin_names]
+        return {datapin.full_name: datapin._state for datapin in datapins}
+
+    def set_states(self, states: Mapping[str, VariableState]) -> None:
+        """
+        Set the states of several datapins as a single change.
+
+        All states are validated before any is changed, and dependent components are invalidated
+        in a single pass. See :meth:`.IWorkflowInstance.set_states` for a description of the
+        parameters.
+        """
+        with self._lock:
+            self._wait_for_started_run()
+            self._assign_all(states)
+
+    def _prepare_run(self, inputs: Mapping[str, VariableState], reset: bool) -> None:
+        """Set the inputs of a run, validating all of them before any is changed."""
+        self._assign_all(inputs)
+        if reset:
+            self._input_changes.clear()
+            self._invalidate(components=self._components)
+            self._set_state(WorkflowInstanceState.INVALID)
+
+    def _validate(self, datapin: InMemoryDatapin, state: VariableState) -> VariableState:
+        """Convert a state to the type of a datapin and check it against the metadata."""
+        metadata = datapin._definition.metadata
+        value = state.value
+        if value.variable_type != datapin.value_type:
+            value = metadata.runtime_convert(value)
+        lower_bound = getattr(metadata, "lower_bound", None)
+        upper_bound = getattr(metadata, "upper_bound", None)
+        enumerated_values = getattr(metadata, "enumerated_values", None)
+        if (
+            (lower_bound is not None and np.any(value < lower_bound))
+            or (upper_bound is not None and np.any(value > upper_bound))
+            or (enumerated_values and not np.all(np.isin(value, enumerated_values)))
+        ):
+            raise ValueOutOfRangeError(
+                f"The value {value!r} is out of range for the datapin {datapin.full_name!r}."
+            )
+        if value is state.value:
+            return state
+        return VariableState(value, state.is_valid)
+
+    def _assign_all(self, states: Mapping[str, VariableState]) -> None:
+        """Set the states of datapins, validating all of them before any is changed."""
+        validated = {}
+        for name, state in states.items():
+            datapin = self._get_datapin(name)
+            validated[datapin] = self._validate(datapin, state)
+        if validated:
+            self._assign(validated)
+
+    def _assign(self, states: Mapping[InMemoryDatapin, VariableState]) -> None:
+        """Set the states of datapins and invalidate everything that depends on them."""
+        components = []
+        datapins = []
+        for datapin, state in states.items():
+            datapin._state = state
+            owner = datapin._parent
+            if isinstance(owner, InMemoryComponent) and datapin.is_input_to_component:
+                components.append(owner)
+            else:
+                datapins.append(datapin)
+        self._invalidate(components, datapins)
+        if self._state != WorkflowInstanceState.RUNNING:
+            self._set_state(WorkflowInstanceState.INVALID)
+
+    def _invalidate(
+        self,
+        components: Iterable[InMemoryComponent] = (),
+        datapins: Iterable[InMemoryDatapin] = (),
+    ) -> None:
+        """
+        Invalidate components and everything downstream of them and of the given datapins.
+
+        The traversal is iterative so that long chains of linked components do not exhaust the
+        interpreter's recursion limit.
+        """
+        pending_components = list(components)
+        pending_datapins = list(datapins)
+        while pending_components or pending_datapins:
+            if pending_components:
+                component = pending_components.pop()
+                if component._is_valid:
+                    component._is_valid = False
+                    for datapin in component._output_datapins:
+                        datapin._state = VariableState(datapin._state.value, False)
+                        pending_datapins.append(datapin)
+                continue
+            for target in self._link_targets.get(pending_datapins.pop(), ()):
+                owner = target._parent
+                if isinstance(owner, InMemoryComponent):
+                    pending_components.append(owner)
+                elif target._state.is_valid:
+                    target._state = VariableState(target._state.value, False)
+                    pending_datapins.append(target)
+
+    def _pull(self, datapin: InMemoryDatapin) -> None:
+        """Copy the state of the linked source datapin, if any, to the given datapin."""
+        source = self._link_sources.get(datapin)
+        if source is not None:
+            self._pull(source)
+            datapin._state = source._state
+
+    def _required_components(self, validation_names: AbstractSet[str]) -> List[InMemoryComponent]:
+        """Get the components that the given elements depend on, in run order."""
+        if not validation_names:
+            return self._components
+        for name in validation_names:
+            self.get_element_by_name(name)
+        names = self._definition.dependency_graph.required_components(validation_names)
+        return [self._index.get_by_name(name) for name in names]  # type: ignore[misc]
+
+    def _execute(
+        self,
+        components: Sequence[InMemoryComponent],
+        run_token: CancelToken,
+        deadline: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> None:
+        """
+        Run components, stopping when the run token is cancelled or the deadline passes.
+
+        The run token is cancelled by the ``cancel`` method and by the caller's cancel token.
+        """
+        self._run_token = run_token
+        unlink = None
+        if cancel_token is not None:
+            unlink = cancel_token.add_callback(run_token.cancel)
+        self._set_state(WorkflowInstanceState.RUNNING)
+        try:
+            self._start_statistics(components)
+            if self._executor is None:
+                for component in components:
+                    check_cancelled(run_token, deadline)
+                    self._run_component(component)
+            else:
+                anyio.run(self._execute_concurrently, components, run_token, deadline)
+            for datapin in self._linked_container_pins:
+                self._pull(datapin)
+        except RunCancelledError:
+            self._set_state(WorkflowInstanceState.CANCELLED)
+            raise
+        except BaseException:
+            self._set_state(WorkflowInstanceState.FAILED)
+            raise
+        finally:
+            self._run_token = None
+            if unlink is not None:
+                unlink()
+        if self._record_history:
+            self._add_history_record()
+        if components is self._components or all(c._is_valid for c in self._components):
+            self._set_state(WorkflowInstanceState.SUCCESS)
+        else:
+            self._set_state(WorkflowInstanceState.INVALID)
+
+    def _reuse_outputs(self, component: InMemoryComponent) -> bool:
+        """Make a component valid without running it if its inputs are unchanged."""
+        for datapin in component._input_datapins:
+            self._pull(datapin)
+        outputs = self._input_changes.unchanged_outputs(component, component._input_states())
+        if outputs is None:
+            return False
+        for datapin, state in zip(component._output_datapins, outputs):
+            datapin._state = state
+        component._is_valid = True
+        self._invalidate(datapins=component._output_datapins)
+        return True
+
+    def _add_history_record(self) -> None:
+        hid = str(len(self._history_ids))
+        self._history_indices[hid] = len(self._history_ids)
+        self._history_ids.append(hid)
+        for datapin in self._datapins:
+            datapin._history.append(datapin._state)
+
+    async def _execute_concurrently(
+        self,
+        components: Sequence[InMemoryComponent],
+        run_token: CancelToken,
+        deadline: Optional[float],
+    ) -> None:
+        """
+        Run components with the executor of the instance.
+
+        Only the component callables run on worker threads or processes. Datapin states are
+        read and written on the thread of the event loop, which holds the instance lock. A
+        cancelled run stops waiting for components to start, and waits for the running ones.
+        """
+        assert self._executor is not None
+        required = set(components)
+
+        async def run_component(name: str) -> None:
+            queued = time.perf_counter()
+            component: InMemoryComponent = self._index.get_by_name(name)  # type: ignore[assignment]
+            if component not in required or not self._needs_execution(component):
+                return
+            arguments = {
+                "function": component._definition.function,
+                "arguments": self._component_arguments(component),
+            }
+            publish = self._events.has_subscribers
+            if publish:
+                self._publish_component_event(component, WorkflowEventType.COMPONENT_STARTED)
+            try:
+                wall_time, results = await self._executor.call(  # type: ignore[union-attr]
+                    _timed_call, arguments
+                )
+            except anyio.get_cancelled_exc_class():
+                raise
+            except BaseException:
+                # The time spent waiting for a worker is not known, so it counts as execution.
+                self._record_execution(
+                    component, ElementRunStatus.FAILED, 0.0, time.perf_counter() - queued
+                )
+                if publish:
+                    self._publish_component_event(component, WorkflowEventType.COMPONENT_FAILED)
+                raise
+            queue_wait = time.perf_counter() - queued - wall_time
+            self._record_execution(component, ElementRunStatus.EXECUTED, queue_wait, wall_time)
+            self._apply_results(component, results)
+            if publish:
+                self._publish_component_event(component, WorkflowEventType.COMPONENT_FINISHED)
+
+        with cancel_scope(run_token, deadline):
+            await self._executor.run(self._definition.execution_plan, run_component)
+
+    def _publish_component_event(
+        self, component: InMemoryComponent, event_type: WorkflowEventType
+    ) -> None:
+        event = WorkflowEvent(event_type, time.time(), element_name=component.full_name)
+        self._events.publish(event)
+
+    def _start_statistics(self, components: Sequence[InMemoryComponent]) -> None:
+        """Forget the statistics of the last run and mark the components of this one."""
+        count = len(self._components)
+        self._statuses = [ElementRunStatus.SKIPPED] * count
+        self._wall_times = [0.0] * count
+        self._queue_waits = [0.0] * count
+        for component in components:
+            self._statuses[component._position] = ElementRunStatus.NOT_RUN
+
+    def _record_execution(
+        self,
+        component: InMemoryComponent,
+        status: ElementRunStatus,
+        queue_wait: float,
+        wall_time: float,
+    ) -> None:
+        position = component._position
+        self._statuses[position] = status
+        self._queue_waits[position] = queue_wait
+        self._wall_times[position] = wall_time
+
+    def _needs_execution(self, component: InMemoryComponent) -> bool:
+        """Check if a component must execute, recording why not otherwise."""
+        if component._is_valid:
+            self._statuses[component._position] = ElementRunStatus.SKIPPED
+            return False
+        if self._reuse_outputs(component):
+            self._statuses[component._position] = ElementRunStatus.CACHED
+            return False
+        return True
+
+    def _run_component(self, component: InMemoryComponent) -> None:
+        queued = time.perf_counter()
+        if not self._needs_execution(component):
+            return
+        arguments = self._component_arguments(component)
+        publish = self._events.has_subscribers
+        if publish:
+            self._publish_component_event(component, WorkflowEventType.COMPONENT_STARTED)
+        started = time.perf_counter()
+        try:
+            results = component._definition.function(**arguments)
+        except BaseException:
+            wall_time = time.perf_counter() - started
+            self._record_execution(component, ElementRunStatus.FAILED, started - queued, wall_time)
+            if publish:
+                self._publish_component_event(component, WorkflowEventType.COMPONENT_FAILED)
+            raise
+        wall_time = time.perf_counter() - started
+        self._record_execution(component, ElementRunStatus.EXECUTED, started - queued, wall_time)
+        self._apply_results(component, results)
+        if publish:
+            self._publish_component_event(component, WorkflowEventType.COMPONENT_FINISHED)
+
+    def _component_arguments(self, component: InMemoryComponent) -> Dict[str, IVariableValue]:
+        arguments = {}
+        for datapin in component._input_datapins:
+            self._pull(datapin)
+            arguments[datapin.name] = datapin._state.value
+        return arguments
+
+    def _apply_results(self, component: InMemoryComponent, results: Mapping[str, Any]) -> None:
+        outputs = component._output_datapins
+        for datapin in outputs:
+            if datapin.name in results:
+                value = _to_value(datapin.value_type, results[datapin.name])
+                datapin._state = VariableState(value, True)
+        component._is_valid = True
+        self._input_changes.record(
+            component, component._input_states(), tuple(datapin._state for datapin in outputs)
+        )
+        self._invalidate(datapins=outputs)
+
+    def _collect(self, collect_names: AbstractSet[str]) -> Dict[str, VariableState]:
+        results: Dict[str, VariableState] = {}
+        for name in collect_names:
+            element = self.get_element_by_name(name)
+            if isinstance(element, InMemoryDatapin):
+                results[element.full_name] = element._state
+            else:
+                for datapin in element._descendant_datapins():
+                    results[datapin.full_name] = datapin._state
+        return results
+
+
+class InMemoryElement(IElement):
+    """Provides the common implementation of all in-memory elements."""
+
+    def __init__(
+        self,
+        instance: InMemoryWorkflowInstance,
+        element_id: str,
+        name: str,
+        parent: Optional[InMemoryControlStatement],
+        properties: Mapping[str, IVariableValue],
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : InMemoryWorkflowInstance
+            Workflow instance that the element belongs to.
+        element_id : str
+            Unique ID of the element within the workflow instance.
+        name : str
+            Short name of the element.
+        parent : Optional[InMemoryControlStatement]
+            Parent of the element, or ``None`` for the root element.
+        properties : Mapping[str, IVariableValue]
+            Initial properties of the element.
+        """
+        self._instance = instance
+        self._element_id = element_id
+        self._name = name
+        self._parent = parent
+        self._full_name = name if parent is None else parent.full_name + "." + name
+        self._properties = {
+            property_name: Property(element_id, property_name, value)
+            for property_name, value in properties.items()
+        }
+
+    @property
+    def element_id(self) -> str:
+        """Unique ID for the element."""
+        return self._element_id
+
+    @property
+    def parent_element_id(self) -> str:
+        """Parent element's ID, or a blank string for the root element."""
+        return "" if self._parent is None else self._parent.element_id
+
+    def get_parent_element(self) -> Optional[InMemoryControlStatement]:
+        """Get the parent object of the element."""
+        return self._parent
+
+    @property
+    def name(self) -> str:
+        """Name of the element."""
+        return self._name
+
+    @property
+    def full_name(self) -> str:
+        """Full name of the element in dotted notation."""
+        return self._full_name
+
+    def get_property(self, property_name: str) -> Property:
+        """
+        Get a property by name.
+
+        Raises
+        ------
+        ValueError
+            If the element has no property with the given name.
+        """
+        try:
+            return self._properties[property_name]
+        except KeyError:
+            raise ValueError(
+                f"The element {self._full_name!r} has no property named {property_name!r}."
+            ) from None
+
+    def get_property_names(self) -> AbstractSet[str]:
+        """Get the names of all properties."""
+        return set(self._properties)
+
+    def get_properties(self) -> Mapping[str, Property]:
+        """Get all properties of the element."""
+        return dict(self._properties)
+
+    def set_property(self, property_name: str, property_value: IVariableValue) -> None:
+        """Create or set a property on the element."""
+        self._properties[property_name] = Property(self._element_id, property_name, property_value)
+
+    def _descendant_datapins(self) -> Iterable[InMemoryDatapin]:
+        return ()
+
+
+class InMemoryControlStatement(InMemoryElement, IControlStatement):
+    """Provides a control statement of an in-memory workflow."""
+
+    def __init__(
+        self,
+        instance: InMemoryWorkflowInstance,
+        definition: ControlStatementDefinition,
+        parent: Optional[InMemoryControlStatement],
+    ):
+        """Initialize a new instance."""
+        super().__init__(
+            instance, str(len(instance._index)), definition.name, parent, definition.properties
+        )
+        self._definition = definition
+        self._datapins: Dict[str, InMemoryDatapin] = {}
+        self._elements: Dict[str, InMemoryElement] = {}
+
+    @property
+    def control_type(self) -> str:
+        """Type of the control statement."""
+        return self._definition.control_type
+
+    def get_elements(self) -> Mapping[str, InMemoryElement]:
+        """Get all child elements of the control statement in execution order."""
+        return dict(self._elements)
+
+    def get_datapins(self) -> Mapping[str, InMemoryDatapin]:
+        """Get the datapins of the control statement."""
+        return dict(self._datapins)
+
+    def _descendant_datapins(self) -> Iterable[InMemoryDatapin]:
+        yield from self._datapins.values()
+        for element in self._elements.values():
+            yield from element._descendant_datapins()
+
+
+class InMemoryComponent(InMemoryElement, IComponent):
+    """Provides a component of an in-memory workflow."""
+
+    def __init__(
+        self,
+        instance: InMemoryWorkflowInstance,
+        definition: ComponentDefinition,
+        parent: Optional[InMemoryControlStatement],
+    ):
+        """Initialize a new instance."""
+        super().__init__(
+            instance, str(len(instance._index)), definition.name, parent, definition.properties
+        )
+        self._definition = definition
+        self._position = len(instance._components)
+        self._datapins: Dict[str, InMemoryDatapin] = {}
+        self._input_datapins: List[InMemoryDatapin] = []
+        self._output_datapins: List[InMemoryDatapin] = []
+        self._is_valid = False
+
+    @property
+    def pacz_url(self) -> Optional[str]:
+        """URL to the PACZ file or directory, if the definition specifies one."""
+        return self._definition.pacz_url
+
+    def get_datapins(self) -> Mapping[str, InMemoryDatapin]:
+        """Get the datapins of the component, inputs first."""
+        return dict(self._datapins)
+
+    def _descendant_datapins(self) -> Iterable[InMemoryDatapin]:
+        return self._datapins.values()
+
+    def _input_states(self) -> Dict[str, VariableState]:
+        return {datapin.name: datapin._state for datapin in self._input_datapins}
+
+
+class InMemoryDatapin(InMemoryElement, IDatapin):
+    """Provides a datapin of an in-memory workflow."""
+
+    def __init__(
+        self,
+        instance: InMemoryWorkflowInstance,
+        definition: DatapinDefinition,
+        parent: Union[InMemoryControlStatement, InMemoryComponent],
+    ):
+        """Initialize a new instance."""
+        super().__init__(instance, str(len(instance._index)), definition.name, parent, {})
+        self._definition = definition
+        if definition.is_input or not isinstance(parent, InMemoryComponent):
+            self._state = definition._valid_state
+        else:
+            self._state = definition._invalid_state
+        self._history: List[VariableState] = []
+
+    def get_metadata(self) -> CommonVariableMetadata:
+        """Get a copy of the metadata for the datapin."""
+        return self._definition.metadata.clone()
+
+    @property
+    def value_type(self) -> VariableType:
+        """Get the type of value that the datapin stores."""
+        return self._definition.value_type
+
+    def get_state(self, hid: Optional[str] = None) -> VariableState:
+        """
+        Get the state of the datapin.
+
+        Parameters
+        ----------
+        hid : Optional[str]
+            ID of the history record to get the state from, or ``None`` for the current state.
+
+        Raises
+        ------
+        ValueError
+            If there is no history record with the given ID.
+        """
+        if hid is None:
+            return self._state
+        index = self._instance._history_indices.get(hid)
+        if index is None:
+            raise ValueError(f"There is no history record with the ID {hid!r}.")
+        return self._history[index]
+
+    def get_history_ids(self) -> Sequence[str]:
+        """Get the IDs of the recorded history entries of the datapin, oldest first."""
+        return tuple(self._instance._history_ids)
+
+    def set_state(self, state: VariableState) -> None:
+        """
+        Set the state of the datapin.
+
+        Raises
+        ------
+        ValueOutOfRangeError
+            If the value violates the datapin's bounds or enumerated values.
+        """
+        with self._instance._lock:
+            self._instance._wait_for_started_run()
+            self._instance._assign({self: self._instance._validate(self, state)})
+
+    def get_upstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """
+        Get the datapins that this datapin depends on.
+
+        See :meth:`.IDatapin.get_upstream_datapins` for a description of the parameters.
+        """
+        return self._instance._definition.link_graph.upstream({self.full_name}, transitive)
+
+    def get_downstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """
+        Get the datapins that depend on this datapin.
+
+        See :meth:`.IDatapin.get_downstream_datapins` for a description of the parameters.
+        """
+        return self._instance._definition.link_graph.downstream({self.full_name}, transitive)
+
+    @property
+    def is_input_to_component(self) -> bool:
+        """Flag indicating if the datapin is an input in the context of the component it is on."""
+        return self._definition.is_input
+
+    @property
+    def is_input_to_workflow(self) -> bool:
+        """Flag indicating if the datapin is an unlinked input in the context of the workflow."""
+        return self._definition.is_input and self not in self._instance._link_sources
@@ -0,0 +1,761 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Pools of pre-warmed workflow instances.
+
+Loading a workflow can take a long time when its components start slow tools. The pools in
+this module keep loaded workflow instances, per workflow file, so that they can be checked out,
+used, and checked back in instead of being loaded again.
+
+When an instance is checked in, its workflow inputs are restored to the states they had when
+it was loaded, and the first run after its next checkout is made with ``reset=True``. The next
+user therefore gets the same results as from a freshly loaded instance. Instances that are still
+running when they are checked in are discarded.
+
+A pool has a minimum and maximum number of instances per workflow file. Instances that have
+been idle for longer than the idle timeout are evicted whenever an instance of the same file is
+checked out or in, as long as the minimum is kept. Pools do not start background threads, and
+instances are only created on checkout or by the ``prewarm`` method.
+
+Engines may hold resources for each instance, such as a license or a remote session. Because
+the workflow interfaces have no method to close an instance, pools call an ``on_discard``
+function with every instance that they drop, which can release it.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+import logging
+import os
+from os import PathLike
+import threading
+import time
+from typing import (
+    AbstractSet,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ansys.tools.variableinterop import VariableState
+import anyio
+
+from .datatypes import (
+    BatchRunResult,
+    CancelToken,
+    ElementKind,
+    TreeSnapshot,
+    WorkflowInstanceState,
+)
+from .iasyncworkflow import IAsyncFileBasedWorkflowEngine, IAsyncRunHandle, IAsyncWorkflowInstance
+from .instancewrapper import AsyncWorkflowInstanceWrapper, WorkflowInstanceWrapper
+from .iworkflow import IFileBasedWorkflowEngine, IRunHandle, IWorkflowInstance
+
+_BUSY_STATES = (WorkflowInstanceState.RUNNING, WorkflowInstanceState.PAUSED)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    """Pooled instance and the workflow input states to restore when it is checked in."""
+
+    instance: Union[IWorkflowInstance, IAsyncWorkflowInstance]
+    initial_states: Mapping[str, VariableState]
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class _FilePool:
+    """Provides the bookkeeping of the instances of one workflow file."""
+
+    def __init__(self) -> None:
+        self.idle: Deque[_Entry] = deque()
+        # Idle, checked out, and currently loading instances.
+        self.size = 0
+
+
+class _CreateInstance:
+    """Marker returned by ``_Pools.reserve`` when the caller should load a new instance."""
+
+
+_CREATE = _CreateInstance()
+
+
+class _Pools:
+    """Provides the bookkeeping shared by the synchronous and asynchronous pools."""
+
+    def __init__(self, min_size: int, max_size: int, idle_timeout: float):
+        if min_size < 0:
+            raise ValueError("The minimum size must not be negative.")
+        if max_size < max(min_size, 1):
+            raise ValueError("The maximum size must be at least 1 and the minimum size.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.closed = False
+        self._pools: Dict[str, _FilePool] = {}
+        # Dropped instances whose discard hook has not been called yet.
+        self._discarded: List[_Entry] = []
+
+    def get(self, path: str) -> _FilePool:
+        return self._pools.setdefault(path, _FilePool())
+
+    def reserve(self, path: str) -> Union[_Entry, _CreateInstance, None]:
+        """Take an idle instance, reserve room for a new one, or return ``None`` if full."""
+        if self.closed:
+            raise RuntimeError("The pool is closed.")
+        pool = self.get(path)
+        self.evict_idle(pool)
+        if pool.idle:
+            # The most recently used instance is taken so that the others can expire.
+            return pool.idle.pop()
+        if pool.size < self.max_size:
+            pool.size += 1
+            return _CREATE
+        return None
+
+    def release(self, path: str, entry: Optional[_Entry], reusable: bool = True) -> None:
+        """Return an instance to the pool, or give up its place if it is not reusable."""
+        pool = self.get(path)
+        if entry is None or not reusable or self.closed:
+            pool.size -= 1
+            if entry is not None:
+                self._discarded.append(entry)
+        else:
+            entry.last_used = time.monotonic()
+            pool.idle.append(entry)
+            self.evict_idle(pool)
+
+    def evict_idle(self, pool: _FilePool) -> int:
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = 0
+        while pool.idle and pool.size > self.min_size and pool.idle[0].last_used <= deadline:
+            self._discarded.append(pool.idle.popleft())
+            pool.size -= 1
+            evicted += 1
+        return evicted
+
+    def evict_all_idle(self) -> int:
+        return sum(self.evict_idle(pool) for pool in self._pools.values())
+
+    def close(self) -> None:
+        self.closed = True
+        for pool in self._pools.values():
+            pool.size -= len(pool.idle)
+            self._discarded.extend(pool.idle)
+            pool.idle.clear()
+
+    def take_discarded(self) -> List[_Entry]:
+        discarded, self._discarded = self._discarded, []
+        return discarded
+
+
+def _workflow_input_names(snapshot: TreeSnapshot) -> AbstractSet[str]:
+    return {
+        element.full_name
+        for element in snapshot
+        if element.kind == ElementKind.DATAPIN and element.is_input_to_workflow
+    }
+
+
+class PooledWorkflowInstance(WorkflowInstanceWrapper):
+    """
+    Provides a workflow instance that is checked out of a ``WorkflowInstancePool`` object.
+
+    The instance must not be used after it has been checked in.
+    """
+
+    def __init__(self, path: str, entry: _Entry, reset_pending: bool):
+        """Initialize a new instance."""
+        super().__init__(entry.instance)  # type: ignore[arg-type]
+        self._path = path
+        self._entry: Optional[_Entry] = entry
+        self._reset_pending = reset_pending
+
+    def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Mapping[str, VariableState]:
+        """Set a workflow's input datapins and run it."""
+        reset, self._reset_pending = reset or self._reset_pending, False
+        return self._wrapped.run(
+            inputs, reset, validation_names, collect_names, timeout, cancel_token
+        )
+
+    def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> IRunHandle:
+        """Set a workflow's input datapins and start running the workflow."""
+        reset, self._reset_pending = reset or self._reset_pending, False
+        return self._wrapped.start_run(
+            inputs, reset, validation_names, collect_names, timeout, cancel_token
+        )
+
+    def run_batch(
+        self,
+        inputs: Sequence[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        max_concurrency: int = 1,
+    ) -> Iterator[BatchRunResult]:
+        """Run the workflow once for each design."""
+        if self._reset_pending:
+            # The default implementation calls the run method, which resets the workflow before
+            # the first design only.
+            return IWorkflowInstance.run_batch(
+                self, inputs, reset, validation_names, collect_names, ordered, max_concurrency
+            )
+        return super().run_batch(
+            inputs, reset, validation_names, collect_names, ordered, max_concurrency
+        )
+
+
+class AsyncPooledWorkflowInstance(AsyncWorkflowInstanceWrapper):
+    """
+    Provides a workflow instance that is checked out of an ``AsyncWorkflowInstancePool`` object.
+
+    The instance must not be used after it has been checked in.
+    """
+
+    def __init__(self, path: str, entry: _Entry, reset_pending: bool):
+        """Initialize a new instance."""
+        super().__init__(entry.instance)  # type: ignore[arg-type]
+        self._path = path
+        self._entry: Optional[_Entry] = entry
+        self._reset_pending = reset_pending
+
+    async def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+    ) -> Mapping[str, VariableState]:
+        """Set a workflow's input datapins and run it."""
+        reset, self._reset_pending = reset or self._reset_pending, False
+        return await self._wrapped.run(inputs, reset, validation_names, collect_names)
+
+    async def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+    ) -> IAsyncRunHandle:
+        """Set a workflow's input datapins and start running the workflow."""
+        reset, self._reset_pending = reset or self._reset_pending, False
+        return await self._wrapped.start_run(
+            inputs, reset, validation_names, collect_names, timeout
+        )
+
+    def run_batch(
+        self,
+        inputs: Sequence[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        max_concurrency: int = 1,
+    ) -> AsyncIterator[BatchRunResult]:
+        """Run the workflow once for each design."""
+        if self._reset_pending:
+            # The default implementation calls the run method, which resets the workflow before
+            # the first design only.
+            return IAsyncWorkflowInstance.run_batch(
+                self, inputs, reset, validation_names, collect_names, ordered, max_concurrency
+            )
+        return super().run_batch(
+            inputs, reset, validation_names, collect_names, ordered, max_concurrency
+        )
+
+
+class WorkflowInstancePool:
+    """
+    Provides a thread-safe pool of workflow instances loaded by a file-based engine.
+
+    The pool is a context manager that closes it on exit.
+    """
+
+    def __init__(
+        self,
+        engine: IFileBasedWorkflowEngine,
+        min_size: int = 0,
+        max_size: int = 4,
+        idle_timeout: float = 600.0,
+        reset_on_return: bool = True,
+        on_discard: Optional[Callable[[IWorkflowInstance], None]] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        engine : IFileBasedWorkflowEngine
+            Engine to load workflow instances with.
+        min_size : int, default: 0
+            Number of instances per workflow file that are never evicted for being idle, and
+            that the ``prewarm`` method loads.
+        max_size : int, default: 4
+            Maximum number of instances per workflow file, including checked-out instances.
+            Checkouts wait while all of them are checked out.
+        idle_timeout : float, default: 600.0
+            Time in seconds after which idle instances above the minimum are evicted.
+        reset_on_return : bool, default: True
+            Whether to restore the workflow inputs of instances when they are checked in and
+            to reset the workflow on the first run after the next checkout.
+        on_discard : Optional[Callable[[IWorkflowInstance], None]], default: None
+            Function to call with each instance that the pool drops, to close or release it.
+            Instances are dropped when they are evicted, when the pool is closed, and when
+            they are checked in while still running or after the pool is closed. The function
+            is called without holding the lock of the pool. Exceptions that it raises are
+            logged and otherwise ignored.
+        """
+        self._engine = engine
+        self._pools = _Pools(min_size, max_size, idle_timeout)
+        self._reset_on_return = reset_on_return
+        self._on_discard = on_discard
+        self._condition = threading.Condition()
+
+    def check_out(
+        self, file_name: Union[PathLike, str], timeout: Optional[float] = None
+    ) -> PooledWorkflowInstance:
+        """
+        Check out an instance of a workflow, loading it if no idle instance is available.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+        timeout : Optional[float], default: None
+            Maximum time in seconds to wait for an instance to be checked in when the pool is
+            full. If ``None``, there is no limit.
+
+        Returns
+        -------
+        PooledWorkflowInstance
+            Checked-out instance, which must be returned with the ``check_in`` method.
+
+        Raises
+        ------
+        TimeoutError
+            If no instance became available within the timeout.
+        """
+        path = os.path.realpath(file_name)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while (reserved := self._pools.reserve(path)) is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No instance of {path!r} became available.")
+                self._condition.wait(remaining)
+        self._discard()
+        if isinstance(reserved, _Entry):
+            return PooledWorkflowInstance(path, reserved, self._reset_on_return)
+        try:
+            entry = self._load(path)
+        except BaseException:
+            self._release(path, None)
+            raise
+        return PooledWorkflowInstance(path, entry, False)
+
+    def check_in(self, instance: PooledWorkflowInstance) -> None:
+        """
+        Return a checked-out instance to the pool.
+
+        Parameters
+        ----------
+        instance : PooledWorkflowInstance
+            Instance returned by the ``check_out`` method.
+        """
+        entry, instance._entry = instance._entry, None
+        if entry is None:
+            raise ValueError("The instance has already been checked in.")
+        reusable = True
+        try:
+            if entry.instance.get_state() in _BUSY_STATES:
+                reusable = False
+            elif self._reset_on_return:
+                entry.instance.set_states(entry.initial_states)
+        except Exception:
+            # An instance that cannot be restored is not given to anyone else.
+            reusable = False
+        self._release(instance._path, entry, reusable)
+
+    @contextmanager
+    def instance(
+        self, file_name: Union[PathLike, str], timeout: Optional[float] = None
+    ) -> Iterator[PooledWorkflowInstance]:
+        """
+        Check out an instance for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+        timeout : Optional[float], default: None
+            Maximum time in seconds to wait for an instance. See the ``check_out`` method.
+        """
+        instance = self.check_out(file_name, timeout)
+        try:
+            yield instance
+        finally:
+            self.check_in(instance)
+
+    def prewarm(self, file_name: Union[PathLike, str]) -> None:
+        """
+        Load instances of a workflow until the pool holds its minimum number of them.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+        """
+        path = os.path.realpath(file_name)
+        while True:
+            with self._condition:
+                pool = self._pools.get(path)
+                if pool.size >= self._pools.min_size or self._pools.closed:
+                    return
+                pool.size += 1
+            try:
+                entry = self._load(path)
+            except BaseException:
+                self._release(path, None)
+                raise
+            self._release(path, entry)
+
+    def evict_idle(self) -> int:
+        """
+        Evict the instances that have been idle for longer than the idle timeout.
+
+        Returns
+        -------
+        int
+            Number of evicted instances.
+        """
+        with self._condition:
+            evicted = self._pools.evict_all_idle()
+            self._condition.notify_all()
+        self._discard()
+        return evicted
+
+    def size(self, file_name: Union[PathLike, str]) -> int:
+        """Get the number of idle and checked-out instances of a workflow."""
+        with self._condition:
+            return self._pools.get(os.path.realpath(file_name)).size
+
+    def idle_count(self, file_name: Union[PathLike, str]) -> int:
+        """Get the number of idle instances of a workflow."""
+        with self._condition:
+            return len(self._pools.get(os.path.realpath(file_name)).idle)
+
+    def close(self) -> None:
+        """Evict all idle instances and discard checked-out instances when they are returned."""
+        with self._condition:
+            self._pools.close()
+            self._condition.notify_all()
+        self._discard()
+
+    def __enter__(self) -> WorkflowInstancePool:
+        """Enter a context in which the pool is open."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the pool."""
+        self.close()
+
+    def _load(self, path: str) -> _Entry:
+        instance = self._engine.load_workflow(path)
+        initial_states: Mapping[str, VariableState] = {}
+        if self._reset_on_return:
+            names = _workflow_input_names(instance.get_tree_snapshot())
+            initial_states = instance.get_states(names)
+        return _Entry(instance, initial_states)
+
+    def _release(self, path: str, entry: Optional[_Entry], reusable: bool = True) -> None:
+        with self._condition:
+            self._pools.release(path, entry, reusable)
+            self._condition.notify()
+        self._discard()
+
+    def _discard(self) -> None:
+        """Call the discard hook with the instances that the pool has dropped."""
+        with self._condition:
+            discarded = self._pools.take_discarded()
+        if self._on_discard is None:
+            return
+        for entry in discarded:
+            try:
+                self._on_discard(entry.instance)  # type: ignore[arg-type]
+            except Exception:
+                _LOGGER.exception(
+                    "The discard hook of a workflow instance pool raised an exception."
+                )
+
+
+class AsyncWorkflowInstancePool:
+    """
+    Provides a pool of workflow instances loaded by an asynchronous file-based engine.
+
+    The pool must be used from a single event loop. It is an asynchronous context manager that
+    closes it on exit.
+    """
+
+    def __init__(
+        self,
+        engine: IAsyncFileBasedWorkflowEngine,
+        min_size: int = 0,
+        max_size: int = 4,
+        idle_timeout: float = 600.0,
+        reset_on_return: bool = True,
+        on_discard: Optional[Callable[[IAsyncWorkflowInstance], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        engine : IAsyncFileBasedWorkflowEngine
+            Engine to load workflow instances with.
+        min_size : int, default: 0
+            Number of instances per workflow file that are never evicted for being idle, and
+            that the ``prewarm`` method loads.
+        max_size : int, default: 4
+            Maximum number of instances per workflow file, including checked-out instances.
+            Checkouts wait while all of them are checked out.
+        idle_timeout : float, default: 600.0
+            Time in seconds after which idle instances above the minimum are evicted.
+        reset_on_return : bool, default: True
+            Whether to restore the workflow inputs of instances when they are checked in and
+            to reset the workflow on the first run after the next checkout.
+        on_discard : Optional[Callable[[IAsyncWorkflowInstance], Awaitable[None]]], default: None
+            Asynchronous function to call with each instance that the pool drops, to close or
+            release it. See the ``WorkflowInstancePool`` class.
+        """
+        self._engine = engine
+        self._pools = _Pools(min_size, max_size, idle_timeout)
+        self._reset_on_return = reset_on_return
+        self._on_discard = on_discard
+        self._condition = anyio.Condition()
+
+    async def check_out(
+        self, file_name: Union[PathLike, str], timeout: Optional[float] = None
+    ) -> AsyncPooledWorkflowInstance:
+        """
+        Check out an instance of a workflow, loading it if no idle instance is available.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+        timeout : Optional[float], default: None
+            Maximum time in seconds to wait for an instance to be checked in when the pool is
+            full. If ``None``, there is no limit.
+
+        Returns
+        -------
+        AsyncPooledWorkflowInstance
+            Checked-out instance, which must be returned with the ``check_in`` method.
+
+        Raises
+        ------
+        TimeoutError
+            If no instance became available within the timeout.
+        """
+        path = os.path.realpath(file_name)
+        with anyio.fail_after(timeout):
+            async with self._condition:
+                while (reserved := self._pools.reserve(path)) is None:
+                    await self._condition.wait()
+        await self._discard()
+        if isinstance(reserved, _Entry):
+            return AsyncPooledWorkflowInstance(path, reserved, self._reset_on_return)
+        try:
+            entry = await self._load(path)
+        except BaseException:
+            await self._release(path, None)
+            raise
+        return AsyncPooledWorkflowInstance(path, entry, False)
+
+    async def check_in(self, instance: AsyncPooledWorkflowInstance) -> None:
+        """
+        Return a checked-out instance to the pool.
+
+        Parameters
+        ----------
+        instance : AsyncPooledWorkflowInstance
+            Instance returned by the ``check_out`` method.
+        """
+        entry, instance._entry = instance._entry, None
+        if entry is None:
+            raise ValueError("The instance has already been checked in.")
+        reusable = True
+        try:
+            with anyio.CancelScope(shield=True):
+                if await entry.instance.get_state() in _BUSY_STATES:
+                    reusable = False
+                elif self._reset_on_return:
+                    await entry.instance.set_states(entry.initial_states)
+        except Exception:
+            # An instance that cannot be restored is not given to anyone else.
+            reusable = False
+        await self._release(instance._path, entry, reusable)
+
+    @asynccontextmanager
+    async def instance(
+        self, file_name: Union[PathLike, str], timeout: Optional[float] = None
+    ) -> AsyncIterator[AsyncPooledWorkflowInstance]:
+        """
+        Check out an instance for the duration of an ``async with`` block.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+        timeout : Optional[float], default: None
+            Maximum time in seconds to wait for an instance. See the ``check_out`` method.
+        """
+        instance = await self.check_out(file_name, timeout)
+        try:
+            yield instance
+        finally:
+            await self.check_in(instance)
+
+    async def prewarm(self, file_name: Union[PathLike, str]) -> None:
+        """
+        Load instances of a workflow until the pool holds its minimum number of them.
+
+        The instances are loaded concurrently.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+        """
+        path = os.path.realpath(file_name)
+        async with self._condition:
+            pool = self._pools.get(path)
+            count = 0 if self._pools.closed else max(self._pools.min_size - pool.size, 0)
+            pool.size += count
+
+        async def load() -> None:
+            try:
+                entry = await self._load(path)
+            except BaseException:
+                await self._release(path, None)
+                raise
+            await self._release(path, entry)
+
+        async with anyio.create_task_group() as task_group:
+            for _ in range(count):
+                task_group.start_soon(load)
+
+    async def evict_idle(self) -> int:
+        """
+        Evict the instances that have been idle for longer than the idle timeout.
+
+        Returns
+        -------
+        int
+            Number of evicted instances.
+        """
+        async with self._condition:
+            evicted = self._pools.evict_all_idle()
+            self._condition.notify_all()
+        await self._discard()
+        return evicted
+
+    def size(self, file_name: Union[PathLike, str]) -> int:
+        """Get the number of idle and checked-out instances of a workflow."""
+        return self._pools.get(os.path.realpath(file_name)).size
+
+    def idle_count(self, file_name: Union[PathLike, str]) -> int:
+        """Get the number of idle instances of a workflow."""
+        return len(self._pools.get(os.path.realpath(file_name)).idle)
+
+    async def aclose(self) -> None:
+        """Evict all idle instances and discard checked-out instances when they are returned."""
+        async with self._condition:
+            self._pools.close()
+            self._condition.notify_all()
+        await self._discard()
+
+    async def __aenter__(self) -> AsyncWorkflowInstancePool:
+        """Enter a context in which the pool is open."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the pool."""
+        await self.aclose()
+
+    async def _load(self, path: str) -> _Entry:
+        instance = await self._engine.load_workflow(path)
+        initial_states: Mapping[str, VariableState] = {}
+        if self._reset_on_return:
+            names = _workflow_input_names(await instance.get_tree_snapshot())
+            initial_states = await instance.get_states(names)
+        return _Entry(instance, initial_states)
+
+    async def _release(self, path: str, entry: Optional[_Entry], reusable: bool = True) -> None:
+        with anyio.CancelScope(shield=True):
+            async with self._condition:
+                self._pools.release(path, entry, reusable)
+                self._condition.notify()
+            await self._discard()
+
+    async def _discard(self) -> None:
+        """Call the discard hook with the instances that the pool has dropped."""
+        discarded = self._pools.take_discarded()
+        if self._on_discard is None:
+            return
+        for entry in discarded:
+            try:
+                with anyio.CancelScope(shield=True):
+                    await self._on_discard(entry.instance)  # type: ignore[arg-type]
+            except Exception:
+                _LOGGER.exception(
+                    "The discard hook of a workflow instance pool raised an exception."
+                )
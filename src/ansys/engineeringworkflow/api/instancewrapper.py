@@ -0,0 +1,306 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Workflow instance wrappers.
+
+This module contains workflow instances that forward every call to another workflow instance.
+They are base classes for wrappers that add behavior to some calls, such as caching the results
+of runs, and leave the others unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    AbstractSet,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ansys.tools.variableinterop import IVariableValue, VariableState
+
+from .datatypes import (
+    BatchRunResult,
+    CancelToken,
+    DatapinLink,
+    Property,
+    RunStatistics,
+    TreeSnapshot,
+    WorkflowEvent,
+    WorkflowInstanceState,
+)
+from .events import EventStream
+from .iasyncworkflow import (
+    IAsyncControlStatement,
+    IAsyncElement,
+    IAsyncRunHandle,
+    IAsyncWorkflowInstance,
+)
+from .iworkflow import IControlStatement, IElement, IRunHandle, IWorkflowInstance
+from .linkgraph import LinkGraph
+
+
+class WorkflowInstanceWrapper(IWorkflowInstance):
+    """Provides a workflow instance that forwards every call to another workflow instance."""
+
+    def __init__(self, wrapped: IWorkflowInstance):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        wrapped : IWorkflowInstance
+            Workflow instance to forward calls to.
+        """
+        self._wrapped = wrapped
+
+    @property
+    def wrapped(self) -> IWorkflowInstance:
+        """Workflow instance that calls are forwarded to."""
+        return self._wrapped
+
+    def get_state(self) -> WorkflowInstanceState:
+        """Get the state of the workflow instance."""
+        return self._wrapped.get_state()
+
+    def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Mapping[str, VariableState]:
+        """Set a workflow's input datapins and run it."""
+        return self._wrapped.run(
+            inputs, reset, validation_names, collect_names, timeout, cancel_token
+        )
+
+    def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> IRunHandle:
+        """Set a workflow's input datapins and start running the workflow."""
+        return self._wrapped.start_run(
+            inputs, reset, validation_names, collect_names, timeout, cancel_token
+        )
+
+    def run_batch(
+        self,
+        inputs: Sequence[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        max_concurrency: int = 1,
+    ) -> Iterator[BatchRunResult]:
+        """Run the workflow once for each design."""
+        return self._wrapped.run_batch(
+            inputs, reset, validation_names, collect_names, ordered, max_concurrency
+        )
+
+    def cancel(self) -> None:
+        """Ask the current run of the workflow instance to stop."""
+        self._wrapped.cancel()
+
+    def subscribe(self, callback: Callable[[WorkflowEvent], None]) -> Callable[[], None]:
+        """Call a function with the events of the workflow instance until unsubscribed."""
+        return self._wrapped.subscribe(callback)
+
+    def get_root(self) -> IControlStatement:
+        """Get the root element of the workflow instance."""
+        return self._wrapped.get_root()
+
+    def get_element_by_name(self, element_name: str) -> IElement:
+        """Get an element of the workflow instance by name."""
+        return self._wrapped.get_element_by_name(element_name)
+
+    def get_metadata_version(self) -> int:
+        """Get a number that changes whenever the structure or datapin metadata changes."""
+        return self._wrapped.get_metadata_version()
+
+    def get_states(self, datapin_names: AbstractSet[str]) -> Mapping[str, VariableState]:
+        """Get the states of several datapins in one call."""
+        return self._wrapped.get_states(datapin_names)
+
+    def set_states(self, states: Mapping[str, VariableState]) -> None:
+        """Set the states of several datapins as a single change."""
+        self._wrapped.set_states(states)
+
+    def get_properties_bulk(
+        self,
+        element_names: AbstractSet[str],
+        property_names: Optional[AbstractSet[str]] = None,
+    ) -> Mapping[str, Mapping[str, Property]]:
+        """Get properties of several elements in one call."""
+        return self._wrapped.get_properties_bulk(element_names, property_names)
+
+    def set_properties_bulk(self, values: Mapping[Tuple[str, str], IVariableValue]) -> None:
+        """Create or set properties on several elements in one call."""
+        self._wrapped.set_properties_bulk(values)
+
+    def get_tree_snapshot(
+        self, max_depth: Optional[int] = None, name_filter: Optional[str] = None
+    ) -> TreeSnapshot:
+        """Get a description of the whole element tree of the workflow instance in one call."""
+        return self._wrapped.get_tree_snapshot(max_depth, name_filter)
+
+    def get_links(self) -> Sequence[DatapinLink]:
+        """Get the links between the datapins of the workflow instance."""
+        return self._wrapped.get_links()
+
+    def get_link_graph(self) -> LinkGraph:
+        """Get the links and component dependencies of the workflow instance as a graph."""
+        return self._wrapped.get_link_graph()
+
+    def get_run_statistics(self) -> RunStatistics:
+        """Get what happened to each component of the workflow instance during its last run."""
+        return self._wrapped.get_run_statistics()
+
+
+class AsyncWorkflowInstanceWrapper(IAsyncWorkflowInstance):
+    """Provides a workflow instance that forwards every call to another workflow instance."""
+
+    def __init__(self, wrapped: IAsyncWorkflowInstance):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        wrapped : IAsyncWorkflowInstance
+            Workflow instance to forward calls to.
+        """
+        self._wrapped = wrapped
+
+    @property
+    def wrapped(self) -> IAsyncWorkflowInstance:
+        """Workflow instance that calls are forwarded to."""
+        return self._wrapped
+
+    async def get_state(self) -> WorkflowInstanceState:
+        """Get the state of the workflow instance."""
+        return await self._wrapped.get_state()
+
+    async def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+    ) -> Mapping[str, VariableState]:
+        """Set a workflow's input datapins and run it."""
+        return await self._wrapped.run(inputs, reset, validation_names, collect_names)
+
+    async def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+    ) -> IAsyncRunHandle:
+        """Set a workflow's input datapins and start running the workflow."""
+        return await self._wrapped.start_run(
+            inputs, reset, validation_names, collect_names, timeout
+        )
+
+    def run_batch(
+        self,
+        inputs: Sequence[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        max_concurrency: int = 1,
+    ) -> AsyncIterator[BatchRunResult]:
+        """Run the workflow once for each design."""
+        return self._wrapped.run_batch(
+            inputs, reset, validation_names, collect_names, ordered, max_concurrency
+        )
+
+    async def cancel(self) -> None:
+        """Ask the current run of the workflow instance to stop."""
+        await self._wrapped.cancel()
+
+    async def subscribe(self, max_buffer_size: Optional[int] = None) -> EventStream:
+        """Get a stream of the events of the workflow instance."""
+        return await self._wrapped.subscribe(max_buffer_size)
+
+    async def get_root(self) -> IAsyncControlStatement:
+        """Get the root element of the workflow instance."""
+        return await self._wrapped.get_root()
+
+    async def get_element_by_name(self, element_name: str) -> IAsyncElement:
+        """Get an element of the workflow instance by name."""
+        return await self._wrapped.get_element_by_name(element_name)
+
+    async def get_metadata_version(self) -> int:
+        """Get a number that changes whenever the structure or datapin metadata changes."""
+        return await self._wrapped.get_metadata_version()
+
+    async def get_states(self, datapin_names: AbstractSet[str]) -> Mapping[str, VariableState]:
+        """Get the states of several datapins in one call."""
+        return await self._wrapped.get_states(datapin_names)
+
+    async def set_states(self, states: Mapping[str, VariableState]) -> None:
+        """Set the states of several datapins as a single change."""
+        await self._wrapped.set_states(states)
+
+    async def get_properties_bulk(
+        self,
+        element_names: AbstractSet[str],
+        property_names: Optional[AbstractSet[str]] = None,
+    ) -> Mapping[str, Mapping[str, Property]]:
+        """Get properties of several elements in one call."""
+        return await self._wrapped.get_properties_bulk(element_names, property_names)
+
+    async def set_properties_bulk(self, values: Mapping[Tuple[str, str], IVariableValue]) -> None:
+        """Create or set properties on several elements in one call."""
+        await self._wrapped.set_properties_bulk(values)
+
+    async def get_tree_snapshot(
+        self, max_depth: Optional[int] = None, name_filter: Optional[str] = None
+    ) -> TreeSnapshot:
+        """Get a description of the whole element tree of the workflow instance in one call."""
+        return await self._wrapped.get_tree_snapshot(max_depth, name_filter)
+
+    async def get_links(self) -> Sequence[DatapinLink]:
+        """Get the links between the datapins of the workflow instance."""
+        return await self._wrapped.get_links()
+
+    async def get_link_graph(self) -> LinkGraph:
+        """Get the links and component dependencies of the workflow instance as a graph."""
+        return await self._wrapped.get_link_graph()
+
+    async def get_run_statistics(self) -> RunStatistics:
+        """Get what happened to each component of the workflow instance during its last run."""
+        return await self._wrapped.get_run_statistics()
@@ -0,0 +1,641 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Call instrumentation of workflow engines.
+
+This module contains the ``Instrumentation`` class, which wraps a synchronous or asynchronous
+workflow engine, and every instance, run handle, and element that it returns, in proxies that
+time each call. For each interface method, it records:
+
+- The number of calls.
+- A histogram of call durations, from which the 50th, 95th, and 99th percentiles are estimated.
+- The number of errors, by exception type.
+- The payload size, which is the number of items in the mappings, sets, and sequences passed to
+  and returned by the calls, such as datapin states and names.
+
+Statistics are exported in the Prometheus text format. Calls can also be reported as spans with
+the fields of OpenTelemetry spans, whose parents follow the nesting of calls in each thread or
+task. Recording a call takes a few microseconds, and spans are only created if a span exporter
+is given.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Mapping, Set
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import inspect
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import weakref
+
+from .iasyncworkflow import (
+    IAsyncComponent,
+    IAsyncControlStatement,
+    IAsyncDatapin,
+    IAsyncElement,
+    IAsyncFileBasedWorkflowEngine,
+    IAsyncRunHandle,
+    IAsyncWorkflowEngine,
+    IAsyncWorkflowInstance,
+)
+from .iworkflow import (
+    IComponent,
+    IControlStatement,
+    IDatapin,
+    IElement,
+    IFileBasedWorkflowEngine,
+    IRunHandle,
+    IWorkflowEngine,
+    IWorkflowInstance,
+)
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = tuple(
+    float(f"{10 ** (exponent / 8):.3g}") for exponent in range(-48, 25)
+)
+"""Upper bounds of the latency histogram buckets, in seconds: eight per decade up to 1000 s."""
+
+_INTERFACES: Tuple[type, ...] = (
+    IFileBasedWorkflowEngine,
+    IWorkflowEngine,
+    IWorkflowInstance,
+    IRunHandle,
+    IControlStatement,
+    IComponent,
+    IDatapin,
+    IElement,
+    IAsyncFileBasedWorkflowEngine,
+    IAsyncWorkflowEngine,
+    IAsyncWorkflowInstance,
+    IAsyncRunHandle,
+    IAsyncControlStatement,
+    IAsyncComponent,
+    IAsyncDatapin,
+    IAsyncElement,
+)
+"""Interfaces whose implementations are wrapped, most specific first."""
+
+_MAPPING = "mapping"
+_COLLECTION = "collection"
+
+_kinds: Dict[type, Union[type, str, None]] = {}
+"""Interface of each type that was wrapped, or the kind of container that it is, if any."""
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """
+    Stores the description of one call, with the fields of an OpenTelemetry span.
+
+    Spans are passed to the span exporter of an ``Instrumentation`` object when their call ends.
+    """
+
+    name: str
+    """Name of the interface method, such as ``'IWorkflowInstance.run'``."""
+    trace_id: str
+    """Hexadecimal ID of the trace, shared by a span and its descendants."""
+    span_id: str
+    """Hexadecimal ID of the span."""
+    parent_span_id: Optional[str]
+    """ID of the span of the enclosing call, or ``None`` for a root span."""
+    start_time_unix_nano: int
+    """Time at which the call started, in nanoseconds since the epoch."""
+    end_time_unix_nano: int = 0
+    """Time at which the call ended, in nanoseconds since the epoch."""
+    status_code: str = "UNSET"
+    """``'OK'`` if the call succeeded, ``'ERROR'`` otherwise."""
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    """
+    Attributes of the call: ``'ewapi.element'`` for the full name of the element called, if
+    any, ``'ewapi.payload_items'``, and ``'exception.type'`` and ``'exception.message'`` if the
+    call failed.
+    """
+
+
+@dataclass(frozen=True)
+class MethodStatistics:
+    """Stores the statistics of the calls to one interface method."""
+
+    method: str
+    """Name of the interface method, such as ``'IWorkflowInstance.run'``."""
+    calls: int
+    """Number of calls, including failed calls."""
+    errors: Mapping[str, int]
+    """Number of failed calls, by the class name of the exception raised."""
+    total_seconds: float
+    """Total duration of the calls, in seconds."""
+    p50_seconds: float
+    """Estimated median duration of the calls, in seconds."""
+    p95_seconds: float
+    """Estimated 95th percentile of the durations of the calls, in seconds."""
+    p99_seconds: float
+    """Estimated 99th percentile of the durations of the calls, in seconds."""
+    payload_items: int
+    """Total number of items passed to and returned by the calls."""
+    max_payload_items: int
+    """Largest number of items passed to and returned by one call."""
+
+
+class _MethodRecorder:
+    """Accumulates the statistics of the calls to one interface method."""
+
+    def __init__(self, bucket_count: int):
+        self.lock = threading.Lock()
+        self.bucket_count = bucket_count
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.buckets = [0] * (self.bucket_count + 1)
+        self.total_seconds = 0.0
+        self.min_seconds = float("inf")
+        self.max_seconds = 0.0
+        self.errors: Dict[str, int] = {}
+        self.payload_items = 0
+        self.max_payload_items = 0
+
+
+class Instrumentation:
+    """
+    Records statistics and spans of the calls to workflow engines.
+
+    Use the ``wrap`` method to instrument an engine. The statistics of all objects wrapped by
+    one instance are recorded together. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        span_exporter: Optional[Callable[[Span], None]] = None,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        span_exporter : Optional[Callable[[Span], None]], default: None
+            Function to call with the span of each call when the call ends, on the thread that
+            made the call. It must return quickly. If ``None``, no spans are created.
+        latency_buckets : Sequence[float], default: DEFAULT_LATENCY_BUCKETS
+            Increasing upper bounds of the latency histogram buckets, in seconds. Finer buckets
+            give more accurate percentiles.
+        """
+        if list(latency_buckets) != sorted(set(latency_buckets)) or not latency_buckets:
+            raise ValueError("The latency buckets must be increasing.")
+        self._span_exporter = span_exporter
+        self._bounds = tuple(latency_buckets)
+        self._recorders: Dict[str, _MethodRecorder] = {}
+        self._recorders_lock = threading.Lock()
+        self._classes: Dict[type, type] = {}
+        # Proxies by the ID of the object that they wrap, so that an object keeps one proxy
+        # while the proxy is in use. The proxy holds the object, which keeps the ID valid.
+        self._proxies: weakref.WeakValueDictionary[int, Any] = weakref.WeakValueDictionary()
+
+    def wrap(self, value: Any) -> Any:
+        """
+        Wrap an object in a proxy that records its calls, if it implements a workflow interface.
+
+        Engines, workflow instances, run handles, and elements are wrapped. Elements in mappings
+        and collections are wrapped one by one. Other values are returned as they are.
+
+        Parameters
+        ----------
+        value : Any
+            Object to wrap, typically an ``IWorkflowEngine`` or ``IAsyncWorkflowEngine``
+            object.
+
+        Returns
+        -------
+        Any
+            Proxy that implements the same interface as the object, and forwards other
+            attributes to it.
+        """
+        interface = _kind(type(value))
+        if interface is None or isinstance(value, _InstrumentedProxy):
+            return value
+        if isinstance(interface, str):
+            return self._wrap_elements(value, interface)
+        proxy = self._proxies.get(id(value))
+        if proxy is None or proxy._wrapped is not value:
+            proxy = self._proxy_class(interface)(value)
+            self._proxies[id(value)] = proxy
+        return proxy
+
+    def statistics(self) -> Dict[str, MethodStatistics]:
+        """Get the statistics of the methods that were called, by method name."""
+        with self._recorders_lock:
+            recorders = sorted(self._recorders.items())
+        statistics = {}
+        for method, recorder in recorders:
+            with recorder.lock:
+                if recorder.calls == 0:
+                    continue
+                buckets = list(recorder.buckets)
+                bounds = (recorder.min_seconds, recorder.max_seconds)
+                statistics[method] = MethodStatistics(
+                    method=method,
+                    calls=recorder.calls,
+                    errors=dict(recorder.errors),
+                    total_seconds=recorder.total_seconds,
+                    p50_seconds=self._quantile(buckets, 0.5, *bounds),
+                    p95_seconds=self._quantile(buckets, 0.95, *bounds),
+                    p99_seconds=self._quantile(buckets, 0.99, *bounds),
+                    payload_items=recorder.payload_items,
+                    max_payload_items=recorder.max_payload_items,
+                )
+        return statistics
+
+    def reset(self) -> None:
+        """Forget the statistics recorded so far."""
+        with self._recorders_lock:
+            recorders = list(self._recorders.values())
+        for recorder in recorders:
+            with recorder.lock:
+                recorder.reset()
+
+    def to_prometheus(self, prefix: str = "ewapi") -> str:
+        """
+        Export the statistics in the Prometheus text exposition format.
+
+        The metrics are a ``<prefix>_calls_total`` counter, a ``<prefix>_call_duration_seconds``
+        histogram, a ``<prefix>_call_duration_quantile_seconds`` gauge with the estimated
+        percentiles, a ``<prefix>_call_errors_total`` counter by exception type, and a
+        ``<prefix>_call_payload_items`` summary. All are labeled by method.
+
+        Parameters
+        ----------
+        prefix : str, default: "ewapi"
+            Prefix of the metric names.
+        """
+        statistics = self.statistics()
+        with self._recorders_lock:
+            recorders = {method: self._recorders[method] for method in statistics}
+        bounds = [_format_float(bound) for bound in self._bounds] + ["+Inf"]
+        calls = [f"# HELP {prefix}_calls_total Number of calls to workflow engine methods."]
+        calls.append(f"# TYPE {prefix}_calls_total counter")
+        durations = [f"# HELP {prefix}_call_duration_seconds Duration of the calls."]
+        durations.append(f"# TYPE {prefix}_call_duration_seconds histogram")
+        quantiles = [
+            f"# HELP {prefix}_call_duration_quantile_seconds Estimated percentiles of the "
+            "durations of the calls."
+        ]
+        quantiles.append(f"# TYPE {prefix}_call_duration_quantile_seconds gauge")
+        errors = [f"# HELP {prefix}_call_errors_total Number of failed calls."]
+        errors.append(f"# TYPE {prefix}_call_errors_total counter")
+        payloads = [
+            f"# HELP {prefix}_call_payload_items Number of items passed to and returned by "
+            "the calls."
+        ]
+        payloads.append(f"# TYPE {prefix}_call_payload_items summary")
+        for method, method_statistics in statistics.items():
+            label = f'method="{method}"'
+            calls.append(f"{prefix}_calls_total{{{label}}} {method_statistics.calls}")
+            with recorders[method].lock:
+                buckets = list(recorders[method].buckets)
+            cumulative = 0
+            for bound, count in zip(bounds, buckets):
+                cumulative += count
+                durations.append(
+                    f'{prefix}_call_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}'
+                )
+            durations.append(
+                f"{prefix}_call_duration_seconds_sum{{{label}}} "
+                f"{_format_float(method_statistics.total_seconds)}"
+            )
+            durations.append(
+                f"{prefix}_call_duration_seconds_count{{{label}}} {method_statistics.calls}"
+            )
+            for quantile, seconds in (
+                ("0.5", method_statistics.p50_seconds),
+                ("0.95", method_statistics.p95_seconds),
+                ("0.99", method_statistics.p99_seconds),
+            ):
+                quantiles.append(
+                    f'{prefix}_call_duration_quantile_seconds{{{label},quantile="{quantile}"}} '
+                    f"{_format_float(seconds)}"
+                )
+            for exception_type, count in sorted(method_statistics.errors.items()):
+                errors.append(
+                    f'{prefix}_call_errors_total{{{label},exception="{exception_type}"}} {count}'
+                )
+            payloads.append(
+                f"{prefix}_call_payload_items_sum{{{label}}} {method_statistics.payload_items}"
+            )
+            payloads.append(
+                f"{prefix}_call_payload_items_count{{{label}}} {method_statistics.calls}"
+            )
+        return "\n".join(calls + durations + quantiles + errors + payloads) + "\n"
+
+    def _recorder(self, method: str) -> _MethodRecorder:
+        with self._recorders_lock:
+            recorder = self._recorders.get(method)
+            if recorder is None:
+                recorder = self._recorders[method] = _MethodRecorder(len(self._bounds))
+            return recorder
+
+    def _record(
+        self,
+        recorder: _MethodRecorder,
+        seconds: float,
+        payload_items: int,
+        error: Optional[BaseException],
+    ) -> None:
+        index = bisect_left(self._bounds, seconds)
+        with recorder.lock:
+            recorder.calls += 1
+            recorder.buckets[index] += 1
+            recorder.total_seconds += seconds
+            if seconds < recorder.min_seconds:
+                recorder.min_seconds = seconds
+            if seconds > recorder.max_seconds:
+                recorder.max_seconds = seconds
+            recorder.payload_items += payload_items
+            if payload_items > recorder.max_payload_items:
+                recorder.max_payload_items = payload_items
+            if error is not None:
+                name = type(error).__name__
+                recorder.errors[name] = recorder.errors.get(name, 0) + 1
+
+    def _quantile(
+        self, buckets: List[int], quantile: float, min_seconds: float, max_seconds: float
+    ) -> float:
+        """Estimate a quantile by linear interpolation within its histogram bucket."""
+        rank = quantile * sum(buckets)
+        cumulative = 0
+        for index, count in enumerate(buckets):
+            if count and cumulative + count >= rank:
+                lower = self._bounds[index - 1] if index > 0 else 0.0
+                upper = self._bounds[index] if index < len(self._bounds) else max_seconds
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(max(estimate, min_seconds), max_seconds)
+            cumulative += count
+        return 0.0
+
+    def _start_span(self, method: str, wrapped: Any, is_element: bool) -> Span:
+        parent = _current_span.get()
+        span = Span(
+            name=method,
+            trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_span_id=parent.span_id if parent else None,
+            start_time_unix_nano=time.time_ns(),
+        )
+        if is_element:
+            span.attributes["ewapi.element"] = wrapped.full_name
+        return span
+
+    def _end_span(self, span: Span, payload_items: int, error: Optional[BaseException]) -> None:
+        span.end_time_unix_nano = time.time_ns()
+        span.attributes["ewapi.payload_items"] = payload_items
+        if error is None:
+            span.status_code = "OK"
+        else:
+            span.status_code = "ERROR"
+            span.attributes["exception.type"] = type(error).__name__
+            span.attributes["exception.message"] = str(error)
+        self._span_exporter(span)  # type: ignore[misc]
+
+    def _wrap_elements(self, value: Any, kind: str) -> Any:
+        """Wrap the elements returned by ``get_elements`` and ``get_datapins`` methods."""
+        if kind == _MAPPING:
+            first = next(iter(value.values()), None)
+            if isinstance(first, (IElement, IAsyncElement)):
+                return {name: self.wrap(element) for name, element in value.items()}
+        else:
+            first = next(iter(value), None)
+            if isinstance(first, IAsyncElement):
+                return [self.wrap(element) for element in value]
+        return value
+
+    def _proxy_class(self, interface: type) -> type:
+        proxy_class = self._classes.get(interface)
+        if proxy_class is None:
+            proxy_class = self._create_proxy_class(interface)
+            self._classes[interface] = proxy_class
+        return proxy_class
+
+    def _create_proxy_class(self, interface: type) -> type:
+        namespace: Dict[str, Any] = {}
+        is_element = issubclass(interface, (IElement, IAsyncElement))
+        for name in dir(interface):
+            if name.startswith("_"):
+                continue
+            attribute = inspect.getattr_static(interface, name)
+            if isinstance(attribute, property):
+                namespace[name] = _forwarding_property(name)
+                continue
+            label = f"{interface.__name__}.{name}"
+            recorder = self._recorder(label)
+            if inspect.isasyncgenfunction(attribute):
+                namespace[name] = self._async_generator_method(name, label, recorder, is_element)
+            elif inspect.iscoroutinefunction(attribute):
+                namespace[name] = self._coroutine_method(name, label, recorder, is_element)
+            elif inspect.isgeneratorfunction(attribute):
+                namespace[name] = self._generator_method(name, label, recorder, is_element)
+            elif callable(attribute):
+                namespace[name] = self._method(name, label, recorder, is_element)
+        namespace["__doc__"] = f"Records the calls to an ``{interface.__name__}`` object."
+        return type(f"Instrumented{interface.__name__}", (_InstrumentedProxy, interface), namespace)
+
+    def _method(
+        self, name: str, label: str, recorder: _MethodRecorder, is_element: bool
+    ) -> Callable[..., Any]:
+        instrumentation = self
+
+        def method(proxy: _InstrumentedProxy, *args: Any, **kwargs: Any) -> Any:
+            span = token = None
+            if instrumentation._span_exporter is not None:
+                span = instrumentation._start_span(label, proxy._wrapped, is_element)
+                token = _current_span.set(span)
+            payload_items = _count_items(args, kwargs)
+            start = time.perf_counter()
+            try:
+                result = getattr(proxy._wrapped, name)(*args, **kwargs)
+            except BaseException as error:
+                instrumentation._record(recorder, time.perf_counter() - start, payload_items, error)
+                if span is not None:
+                    _current_span.reset(token)  # type: ignore[arg-type]
+                    instrumentation._end_span(span, payload_items, error)
+                raise
+            seconds = time.perf_counter() - start
+            payload_items += _size(result)
+            instrumentation._record(recorder, seconds, payload_items, None)
+            if span is not None:
+                _current_span.reset(token)  # type: ignore[arg-type]
+                instrumentation._end_span(span, payload_items, None)
+            return instrumentation.wrap(result)
+
+        method.__name__ = name
+        return method
+
+    def _coroutine_method(
+        self, name: str, label: str, recorder: _MethodRecorder, is_element: bool
+    ) -> Callable[..., Any]:
+        instrumentation = self
+
+        async def method(proxy: _InstrumentedProxy, *args: Any, **kwargs: Any) -> Any:
+            span = token = None
+            if instrumentation._span_exporter is not None:
+                span = instrumentation._start_span(label, proxy._wrapped, is_element)
+                token = _current_span.set(span)
+            payload_items = _count_items(args, kwargs)
+            start = time.perf_counter()
+            try:
+                result = await getattr(proxy._wrapped, name)(*args, **kwargs)
+            except BaseException as error:
+                instrumentation._record(recorder, time.perf_counter() - start, payload_items, error)
+                if span is not None:
+                    _current_span.reset(token)  # type: ignore[arg-type]
+                    instrumentation._end_span(span, payload_items, error)
+                raise
+            seconds = time.perf_counter() - start
+            payload_items += _size(result)
+            instrumentation._record(recorder, seconds, payload_items, None)
+            if span is not None:
+                _current_span.reset(token)  # type: ignore[arg-type]
+                instrumentation._end_span(span, payload_items, None)
+            return instrumentation.wrap(result)
+
+        method.__name__ = name
+        return method
+
+    def _generator_method(
+        self, name: str, label: str, recorder: _MethodRecorder, is_element: bool
+    ) -> Callable[..., Any]:
+        instrumentation = self
+
+        def method(proxy: _InstrumentedProxy, *args: Any, **kwargs: Any) -> Any:
+            # The call is timed from the first item request until the iterator is exhausted or
+            # closed, and each item counts toward the payload.
+            span = None
+            if instrumentation._span_exporter is not None:
+                span = instrumentation._start_span(label, proxy._wrapped, is_element)
+            payload_items = _count_items(args, kwargs)
+            start = time.perf_counter()
+            error: Optional[BaseException] = None
+            try:
+                for item in getattr(proxy._wrapped, name)(*args, **kwargs):
+                    payload_items += 1
+                    yield item
+            except GeneratorExit:
+                raise
+            except BaseException as caught:
+                error = caught
+                raise
+            finally:
+                instrumentation._record(recorder, time.perf_counter() - start, payload_items, error)
+                if span is not None:
+                    instrumentation._end_span(span, payload_items, error)
+
+        method.__name__ = name
+        return method
+
+    def _async_generator_method(
+        self, name: str, label: str, recorder: _MethodRecorder, is_element: bool
+    ) -> Callable[..., Any]:
+        instrumentation = self
+
+        async def method(proxy: _InstrumentedProxy, *args: Any, **kwargs: Any) -> Any:
+            span = None
+            if instrumentation._span_exporter is not None:
+                span = instrumentation._start_span(label, proxy._wrapped, is_element)
+            payload_items = _count_items(args, kwargs)
+            start = time.perf_counter()
+            error: Optional[BaseException] = None
+            try:
+                async for item in getattr(proxy._wrapped, name)(*args, **kwargs):
+                    payload_items += 1
+                    yield item
+            except GeneratorExit:
+                raise
+            except BaseException as caught:
+                error = caught
+                raise
+            finally:
+                instrumentation._record(recorder, time.perf_counter() - start, payload_items, error)
+                if span is not None:
+                    instrumentation._end_span(span, payload_items, error)
+
+        method.__name__ = name
+        return method
+
+
+class _InstrumentedProxy:
+    """Base class of the proxies created by an ``Instrumentation`` object."""
+
+    def __init__(self, wrapped: Any):
+        self._wrapped = wrapped
+
+    @property
+    def wrapped(self) -> Any:
+        """Object that calls are forwarded to."""
+        return self._wrapped
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward the attributes that are not part of the interface, without recording."""
+        return getattr(self._wrapped, name)
+
+
+def _forwarding_property(name: str) -> property:
+    return property(lambda proxy: getattr(proxy._wrapped, name))
+
+
+def _kind(value_type: type) -> Union[type, str, None]:
+    """Get the interface that a type implements, or the kind of container that it is, if any."""
+    try:
+        return _kinds[value_type]
+    except KeyError:
+        pass
+    kind: Union[type, str, None] = None
+    for interface in _INTERFACES:
+        if issubclass(value_type, interface):
+            kind = interface
+            break
+    else:
+        if issubclass(value_type, Mapping):
+            kind = _MAPPING
+        elif issubclass(value_type, (Set, list, tuple)):
+            kind = _COLLECTION
+    _kinds[value_type] = kind
+    return kind
+
+
+def _size(value: Any) -> int:
+    return len(value) if isinstance(_kind(type(value)), str) else 0
+
+
+def _count_items(args: Tuple[Any, ...], kwargs: Mapping[str, Any]) -> int:
+    count = 0
+    for value in args:
+        count += _size(value)
+    for value in kwargs.values():
+        count += _size(value)
+    return count
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
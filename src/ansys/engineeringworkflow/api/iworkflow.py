@@ -36,7 +36,19 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from os import PathLike
-from typing import AbstractSet, Mapping, Optional, Union
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from ansys.tools.variableinterop import (
     CommonVariableMetadata,
@@ -44,8 +56,21 @@ from ansys.tools.variableinterop import (
     VariableState,
     VariableType,
 )
-
-from .datatypes import Property, WorkflowEngineInfo, WorkflowInstanceState
+import anyio
+
+from .datatypes import (
+    BatchRunResult,
+    CancelToken,
+    DatapinLink,
+    Property,
+    RunStatistics,
+    TreeSnapshot,
+    WorkflowEngineInfo,
+    WorkflowEvent,
+    WorkflowInstanceState,
+)
+from .events import StatePoller
+from .linkgraph import LinkGraph
 
 
 class IWorkflowEngine(ABC):
@@ -97,10 +122,15 @@ class IWorkflowInstance(ABC):
         reset: bool = False,
         validation_names: AbstractSet[str] = set(),
         collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
     ) -> Mapping[str, VariableState]:
         """
         Set a workflow's input datapins and run it.
 
+        A run that is stopped by its ``timeout``, its ``cancel_token`` or the ``cancel`` method
+        leaves the workflow instance in the ``CANCELLED`` state. See the ``cancel`` method.
+
         Parameters
         ----------
         inputs : Mapping[str, VariableState]
@@ -122,6 +152,11 @@ class IWorkflowInstance(ABC):
             Names of the specific datapins or elements that are to cause the method
             to return these values after running. If an element is specified, all
             child datapins are recursively included.
+        timeout : Optional[float], default: None
+            Maximum duration of the run in seconds. If the run has not finished when it
+            expires, the run is cancelled. If ``None``, the run has no deadline.
+        cancel_token : Optional[CancelToken], default: None
+            Token that another thread can cancel to stop the run.
 
         Returns
         -------
@@ -133,16 +168,30 @@ class IWorkflowInstance(ABC):
         ------
         ValueOutOfRangeError
             If one of the input values violates its datapin's bounds or enumerated values.
+        RunTimeoutError
+            If the run was cancelled because its timeout expired.
+        RunCancelledError
+            If the run was cancelled by its cancel token or the ``cancel`` method.
         """
         ...
 
     @abstractmethod
     def start_run(
-        self, inputs: Mapping[str, VariableState], reset: bool, validation_names: AbstractSet[str]
-    ) -> None:
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> IRunHandle:
         """
         Set a workflow's input datapins and start running the workflow.
 
+        The workflow instance must be in the ``RUNNING`` state when this method returns, unless
+        the run has already finished. The run can be stopped with the ``cancel`` method of the
+        returned handle, in addition to the ways described for the ``run`` method.
+
         Parameters
         ----------
         inputs : Mapping[str, VariableState]
@@ -160,6 +209,23 @@ class IWorkflowInstance(ABC):
             workflow. If the set is non-empty, the workflow engine may choose which
             portions of the workflow are run to satisfy the given datapins with the
             minimum runtime.
+        collect_names : AbstractSet[str]
+            Names of the specific datapins or elements whose values the returned handle is to
+            provide once the run has finished. If an element is specified, all child datapins
+            are recursively included.
+        timeout : Optional[float], default: None
+            Maximum duration of the run in seconds, counted from the call. See the ``run``
+            method.
+        cancel_token : Optional[CancelToken], default: None
+            Token that another thread can cancel to stop the run.
+
+        Returns
+        -------
+        IRunHandle
+            Handle for waiting on the run and getting its outputs. Engines that are notified
+            when a run finishes should return a handle that wakes waiters directly, like the
+            ``runhandle.RunHandle`` class. Other engines may return a
+            ``runhandle.PollingRunHandle`` object.
 
         Raises
         ------
@@ -168,7 +234,99 @@ class IWorkflowInstance(ABC):
         """
         ...
 
-    # TODO: How to wait for finish in second case?
+    def run_batch(
+        self,
+        inputs: Sequence[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        max_concurrency: int = 1,
+    ) -> Iterator[BatchRunResult]:
+        """
+        Set the inputs of each design in turn and run the workflow for it.
+
+        Each run starts from the state that the previous run left the workflow instance in, so
+        inputs that a design does not set keep the value of the previous design. An error raised
+        by one run is reported in its result and does not stop the batch.
+
+        The default implementation calls the ``run`` method for one design at a time, as each
+        result is requested, because all designs share the datapins of this workflow instance.
+        Engines that can pipeline or distribute runs should override it.
+
+        Parameters
+        ----------
+        inputs : Sequence[Mapping[str, VariableState]]
+            Map of datapin names to ``VariableState`` objects for each design.
+        reset : bool, default: False
+            Whether to reset the workflow before running each design.
+        validation_names : AbstractSet[str]
+            Names of the specific datapins or components that are required to be valid.
+            See the ``run`` method.
+        collect_names : AbstractSet[str]
+            Names of the specific datapins or elements whose values are to be returned for each
+            design. See the ``run`` method.
+        ordered : bool, default: True
+            Whether to return the results in the order of the designs. If this parameter is set
+            to ``False``, engines that run several designs at the same time may return each result
+            as soon as it is available.
+        max_concurrency : int, default: 1
+            Maximum number of designs that the engine may run at the same time.
+
+        Returns
+        -------
+        Iterator[BatchRunResult]
+            Result of each design. Runs may be deferred until their results are requested.
+        """
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency must be at least 1.")
+        for index, design in enumerate(inputs):
+            try:
+                outputs = self.run(design, reset, validation_names, collect_names)
+            except Exception as error:
+                yield BatchRunResult(index, exception=error)
+            else:
+                yield BatchRunResult(index, outputs)
+
+    def cancel(self) -> None:
+        """
+        Ask the current run of the workflow instance to stop.
+
+        The method returns without waiting for the run to stop. It does nothing if the workflow
+        instance is not running. Engines must stop the run as soon as possible and release the
+        compute resources that it uses. Components that finished before the cancellation keep
+        their outputs, while the components that were running or had not started remain
+        invalid. The run then raises a ``RunCancelledError``, or completes its handle with one,
+        and the workflow instance is in the ``CANCELLED`` state.
+
+        The default implementation raises a ``NotImplementedError``.
+        """
+        raise NotImplementedError("This engine cannot cancel runs.")
+
+    def subscribe(self, callback: Callable[[WorkflowEvent], None]) -> Callable[[], None]:
+        """
+        Call a function with the events of the workflow instance until unsubscribed.
+
+        Events report changes of the workflow instance state and, for engines that support it,
+        the start and end of each component's execution. To receive events in a queue, pass the
+        queue's ``put`` method as the callback.
+
+        The default implementation polls the ``get_state`` method on a background thread and
+        only reports ``STATE_CHANGED`` events, starting with the current state. Engines that are
+        notified of changes should override it to push events as they occur.
+
+        Parameters
+        ----------
+        callback : Callable[[WorkflowEvent], None]
+            Function to call with each event. It may be called from any thread and must return
+            quickly. Exceptions that it raises are logged and otherwise ignored.
+
+        Returns
+        -------
+        Callable[[], None]
+            Function that ends the subscription.
+        """
+        return StatePoller(self, callback).stop
 
     @abstractmethod
     def get_root(self) -> IControlStatement:
@@ -188,6 +346,330 @@ class IWorkflowInstance(ABC):
         """
         ...
 
+    def get_metadata_version(self) -> int:
+        """
+        Get a number that changes whenever the structure or datapin metadata changes.
+
+        Callers that cache elements or metadata compare the numbers returned by successive calls
+        to detect that their caches are stale.
+
+        The default implementation always returns ``0``, which is correct for engines whose
+        workflows do not change after they are loaded. Engines that can add, remove, or rename
+        elements or change datapin metadata must override it.
+        """
+        return 0
+
+    def get_states(self, datapin_names: AbstractSet[str]) -> Mapping[str, VariableState]:
+        """
+        Get the states of several datapins in one call.
+
+        The default implementation looks up each datapin and gets its state. Engines that can
+        read many datapins in one request should override it.
+
+        Parameters
+        ----------
+        datapin_names : AbstractSet[str]
+            Full names of the datapins to get the states of.
+
+        Returns
+        -------
+        Mapping[str, VariableState]
+            Map of datapin names to their states.
+
+        Raises
+        ------
+        ValueError
+            If one of the names is not the name of a datapin.
+        """
+        datapins = [self._get_datapin(name) for name in datapin_names]
+        return {datapin.full_name: datapin.get_state() for datapin in datapins}
+
+    def set_states(self, states: Mapping[str, VariableState]) -> None:
+        """
+        Set the states of several datapins as a single change.
+
+        All datapins are checked before any of them is changed. Components that depend on the
+        datapins are invalidated once for the whole change rather than once per datapin.
+
+        The default implementation looks up all datapins and then sets their states one at a time.
+        If setting a state fails, it restores the states of the datapins that it has already set
+        before raising the error. Engines should override it to make the change atomic.
+
+        Parameters
+        ----------
+        states : Mapping[str, VariableState]
+            Map of datapin names to their new states.
+
+        Raises
+        ------
+        ValueError
+            If one of the names is not the name of a datapin.
+        ValueOutOfRangeError
+            If one of the values violates its datapin's bounds or enumerated values.
+        """
+        datapins = [(self._get_datapin(name), state) for name, state in states.items()]
+        previous_states = []
+        try:
+            for datapin, state in datapins:
+                previous_states.append((datapin, datapin.get_state()))
+                datapin.set_state(state)
+        except BaseException:
+            for datapin, previous_state in reversed(previous_states):
+                datapin.set_state(previous_state)
+            raise
+
+    def _get_datapin(self, datapin_name: str) -> IDatapin:
+        element = self.get_element_by_name(datapin_name)
+        if not isinstance(element, IDatapin):
+            raise ValueError(f"The element {datapin_name!r} is not a datapin.")
+        return element
+
+    def get_properties_bulk(
+        self,
+        element_names: AbstractSet[str],
+        property_names: Optional[AbstractSet[str]] = None,
+    ) -> Mapping[str, Mapping[str, Property]]:
+        """
+        Get properties of several elements in one call.
+
+        The default implementation looks up each element and gets its properties. Engines that
+        can read the properties of many elements in one request should override it.
+
+        Parameters
+        ----------
+        element_names : AbstractSet[str]
+            Full names of the elements to get the properties of.
+        property_names : Optional[AbstractSet[str]]
+            Names of the properties to get from each element. If ``None``, all properties of
+            each element are returned.
+
+        Returns
+        -------
+        Mapping[str, Mapping[str, Property]]
+            Map of element names to maps of property names to properties.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with one of the names, or if one of the elements has no
+            property with one of the property names.
+        """
+        elements = [self.get_element_by_name(name) for name in element_names]
+        results: Dict[str, Mapping[str, Property]] = {}
+        for element in elements:
+            properties = element.get_properties()
+            if property_names is not None:
+                missing = property_names - properties.keys()
+                if missing:
+                    raise ValueError(
+                        f"The element {element.full_name!r} has no property named "
+                        f"{sorted(missing)[0]!r}."
+                    )
+                properties = {name: properties[name] for name in property_names}
+            results[element.full_name] = properties
+        return results
+
+    def set_properties_bulk(self, values: Mapping[Tuple[str, str], IVariableValue]) -> None:
+        """
+        Create or set properties on several elements in one call.
+
+        All elements are looked up before any property is set.
+
+        The default implementation sets the properties one at a time. Engines that can set the
+        properties of many elements in one request should override it.
+
+        Parameters
+        ----------
+        values : Mapping[Tuple[str, str], IVariableValue]
+            Map of element name and property name pairs to property values.
+
+        Raises
+        ------
+        ValueError
+            If there is no element with one of the names.
+        """
+        elements = {name: self.get_element_by_name(name) for name in {key[0] for key in values}}
+        for (element_name, property_name), property_value in values.items():
+            elements[element_name].set_property(property_name, property_value)
+
+    def get_tree_snapshot(
+        self, max_depth: Optional[int] = None, name_filter: Optional[str] = None
+    ) -> TreeSnapshot:
+        """
+        Get a description of the whole element tree of the workflow instance in one call.
+
+        The snapshot includes the properties of every element and the metadata of every datapin.
+        It does not change when the workflow instance does.
+
+        The default implementation walks the tree from the root element with one call per element
+        and datapin. Engines that can describe their tree in one request should override it.
+
+        Parameters
+        ----------
+        max_depth : Optional[int]
+            Maximum depth of the elements to include, where the root element has a depth of
+            ``0``. If ``None``, all elements are included.
+        name_filter : Optional[str]
+            Shell-style wildcard pattern, such as ``'Root.Solver.*'``, that the full names of the
+            elements to include must match. The ancestors of matching elements are always
+            included. If ``None``, all elements are included.
+
+        Returns
+        -------
+        TreeSnapshot
+            Description of the element tree.
+
+        Raises
+        ------
+        ValueError
+            If the maximum depth is negative.
+        """
+        from .snapshot import take_snapshot  # Imported here because it imports this module.
+
+        return take_snapshot(self, max_depth, name_filter)
+
+    def get_links(self) -> Sequence[DatapinLink]:
+        """
+        Get the links between the datapins of the workflow instance.
+
+        A datapin whose value is computed by an equation of several datapins is the target of
+        one link from each of them.
+
+        The default implementation raises ``NotImplementedError``. Engines that can list links
+        should override it.
+
+        Returns
+        -------
+        Sequence[DatapinLink]
+            All links of the workflow instance.
+
+        Raises
+        ------
+        NotImplementedError
+            If the engine cannot list the links of the workflow instance.
+        """
+        raise NotImplementedError("This engine cannot list the links of workflow instances.")
+
+    def get_link_graph(self) -> LinkGraph:
+        """
+        Get the links and component dependencies of the workflow instance as a graph.
+
+        The graph answers transitive upstream and downstream queries without further calls to
+        the engine. It does not change when the workflow instance does.
+
+        The default implementation builds the graph from the results of the ``get_links`` and
+        ``get_tree_snapshot`` methods.
+
+        Returns
+        -------
+        LinkGraph
+            Graph of the datapins of the workflow instance.
+
+        Raises
+        ------
+        NotImplementedError
+            If the engine cannot list the links of the workflow instance.
+        """
+        return LinkGraph.from_snapshot(self.get_links(), self.get_tree_snapshot())
+
+    def get_run_statistics(self) -> RunStatistics:
+        """
+        Get what happened to each component of the workflow instance during its last run.
+
+        The statistics include the time that each component spent executing and waiting to
+        execute, how many times it executed, and whether its outputs were reused instead.
+
+        The default implementation raises ``NotImplementedError``. Engines that time the
+        execution of components should override it.
+
+        Returns
+        -------
+        RunStatistics
+            Statistics of the components, in run order. Components are reported as skipped if
+            the workflow instance has not run yet.
+
+        Raises
+        ------
+        NotImplementedError
+            If the engine does not time the execution of components.
+        """
+        raise NotImplementedError("This engine does not record run statistics.")
+
+
+class IRunHandle(ABC):
+    """
+    Provides a handle on a workflow run started by the ``IWorkflowInstance.start_run`` method.
+
+    The handle can also be awaited from asynchronous code, which waits for the run to finish on a
+    worker thread and then returns the collected outputs.
+    """
+
+    @abstractmethod
+    def done(self) -> bool:
+        """Get whether the run has finished, either successfully or not."""
+        ...
+
+    @abstractmethod
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the run to finish.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Maximum time to wait in seconds. If ``None``, the method waits until the run has
+            finished.
+
+        Returns
+        -------
+        bool
+            ``True`` if the run has finished, ``False`` if the timeout expired first.
+        """
+        ...
+
+    @abstractmethod
+    def result(self, timeout: Optional[float] = None) -> Mapping[str, VariableState]:
+        """
+        Wait for the run to finish and get its outputs.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Maximum time to wait in seconds. If ``None``, the method waits until the run has
+            finished.
+
+        Returns
+        -------
+        Mapping[str, VariableState]
+            Map of output datapin names to ``VariableState`` objects for each datapin specified by
+            the ``collect_names`` parameter of the ``start_run`` call.
+
+        Raises
+        ------
+        TimeoutError
+            If the timeout expired before the run finished.
+        RunFailedError
+            If the run failed. Engines that know the original error raise that error instead.
+        RunCancelledError
+            If the run was cancelled.
+        """
+        ...
+
+    def cancel(self) -> None:
+        """
+        Ask the run to stop.
+
+        The method returns without waiting for the run to stop. It does nothing if the run has
+        already finished. See the ``IWorkflowInstance.cancel`` method.
+
+        The default implementation raises a ``NotImplementedError``.
+        """
+        raise NotImplementedError("This run cannot be cancelled.")
+
+    def __await__(self) -> Generator[Any, None, Mapping[str, VariableState]]:
+        """Wait for the run to finish on a worker thread and get its outputs."""
+        return anyio.to_thread.run_sync(self.result, abandon_on_cancel=True).__await__()
+
 
 class IElement(ABC):
     """Provides a component, control statement, or datapin."""
@@ -385,6 +867,109 @@ class IDatapin(IElement, ABC):
         """Set the state of the datapin."""
         ...
 
+    def get_history_ids(self) -> Sequence[str]:
+        """
+        Get the IDs of the recorded history entries of the datapin, oldest first.
+
+        The IDs can be passed to the ``get_state`` method as the ``hid`` parameter.
+
+        The default implementation raises ``NotImplementedError``. Engines that record history
+        should override it.
+
+        Raises
+        ------
+        NotImplementedError
+            If the engine cannot list the history of the datapin.
+        """
+        raise NotImplementedError("This engine cannot list the history of datapins.")
+
+    def iter_history(
+        self, hids: Optional[Sequence[str]] = None, chunk_size: int = 1000
+    ) -> Iterator[Sequence[Tuple[str, VariableState]]]:
+        """
+        Get history entries of the datapin in chunks.
+
+        Only one chunk needs to be held in memory at a time.
+
+        The default implementation gets the state of each history entry with the ``get_state``
+        method. Engines that can fetch many history entries in one request should override it.
+
+        Parameters
+        ----------
+        hids : Optional[Sequence[str]]
+            IDs of the history entries to get, in the order in which to return them. If ``None``,
+            all entries listed by the ``get_history_ids`` method are returned.
+        chunk_size : int, default: 1000
+            Maximum number of entries in each chunk.
+
+        Returns
+        -------
+        Iterator[Sequence[Tuple[str, VariableState]]]
+            Chunks of history ID and state pairs.
+
+        Raises
+        ------
+        ValueError
+            If the chunk size is not positive or one of the history IDs does not exist.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+        if hids is None:
+            hids = self.get_history_ids()
+        for start in range(0, len(hids), chunk_size):
+            yield [(hid, self.get_state(hid)) for hid in hids[start : start + chunk_size]]
+
+    def get_upstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """
+        Get the datapins that this datapin depends on.
+
+        The default implementation raises ``NotImplementedError``. Engines that can list links
+        should override it.
+
+        Parameters
+        ----------
+        transitive : bool, default: False
+            Whether to get all the datapins that this datapin depends on, through links and
+            components. If ``False``, only the sources of the links to this datapin are returned.
+
+        Returns
+        -------
+        Sequence[str]
+            Full names of the datapins, nearest first.
+
+        Raises
+        ------
+        NotImplementedError
+            If the engine cannot list the links of datapins.
+        """
+        raise NotImplementedError("This engine cannot list the links of datapins.")
+
+    def get_downstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """
+        Get the datapins that depend on this datapin.
+
+        The default implementation raises ``NotImplementedError``. Engines that can list links
+        should override it.
+
+        Parameters
+        ----------
+        transitive : bool, default: False
+            Whether to get all the datapins that depend on this datapin, through links and
+            components. If ``False``, only the targets of the links from this datapin are
+            returned.
+
+        Returns
+        -------
+        Sequence[str]
+            Full names of the datapins, nearest first.
+
+        Raises
+        ------
+        NotImplementedError
+            If the engine cannot list the links of datapins.
+        """
+        raise NotImplementedError("This engine cannot list the links of datapins.")
+
     @property
     @abstractmethod
     def is_input_to_component(self) -> bool:
@@ -0,0 +1,246 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Datapin link graphs.
+
+A ``LinkGraph`` object stores the links between the datapins of a workflow, and the dependencies
+of the outputs of each component on its inputs, as compressed sparse row (CSR) adjacency arrays.
+Transitive queries traverse the arrays a whole breadth-first level at a time with NumPy, so they
+take milliseconds even for workflows with hundreds of thousands of datapins.
+
+Each component is a node of the graph that has an edge from each of its input datapins and an
+edge to each of its output datapins. Component nodes are never reported by queries, but they
+let transitive queries follow data through components without an edge from every input to
+every output.
+"""
+
+from __future__ import annotations
+
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .datatypes import DatapinLink, ElementKind, TreeSnapshot
+
+_VECTORIZE_THRESHOLD = 64
+"""Minimum number of nodes in a breadth-first level for it to be expanded with NumPy."""
+
+
+class _Adjacency:
+    """Provides the CSR arrays of the edges of a graph in one direction."""
+
+    def __init__(self, sources: np.ndarray, targets: np.ndarray, node_count: int):
+        order = np.argsort(sources, kind="stable")
+        self.indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=node_count), out=self.indptr[1:])
+        self.indices = targets[order]
+        self._lists: Optional[Tuple[List[int], List[int]]] = None
+
+    @property
+    def lists(self) -> Tuple[List[int], List[int]]:
+        """CSR arrays as lists, which are faster than arrays to index one element at a time."""
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist())
+        return self._lists
+
+
+class LinkGraph:
+    """
+    Provides the links between the datapins of a workflow as CSR adjacency arrays.
+
+    A graph is immutable and may be shared by all instances of a workflow.
+    """
+
+    def __init__(
+        self,
+        links: Iterable[Union[DatapinLink, Tuple[str, str]]],
+        components: Mapping[str, Tuple[Sequence[str], Sequence[str]]] = {},
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        links : Iterable[Union[DatapinLink, Tuple[str, str]]]
+            Links between datapins, as ``DatapinLink`` objects or pairs of full datapin names
+            in ``(source, target)`` order.
+        components : Mapping[str, Tuple[Sequence[str], Sequence[str]]], default: {}
+            Full names of the input and output datapins of each component, by the full name of
+            the component.
+        """
+        ids: Dict[str, int] = {}
+        sources: List[int] = []
+        targets: List[int] = []
+        for link in links:
+            source, target = (
+                (link.source_name, link.target_name) if isinstance(link, DatapinLink) else link
+            )
+            sources.append(ids.setdefault(source, len(ids)))
+            targets.append(ids.setdefault(target, len(ids)))
+        component_nodes = []
+        for inputs, outputs in components.values():
+            for name in [*inputs, *outputs]:
+                ids.setdefault(name, len(ids))
+            component_nodes.append((inputs, outputs))
+        self._datapin_count = len(ids)
+        for index, (inputs, outputs) in enumerate(component_nodes, len(ids)):
+            for name in inputs:
+                sources.append(ids[name])
+                targets.append(index)
+            for name in outputs:
+                sources.append(index)
+                targets.append(ids[name])
+        self._ids = ids
+        self._names = list(ids)
+        self._name_array = np.array(self._names, dtype=object)
+        node_count = self._datapin_count + len(component_nodes)
+        source_array = np.asarray(sources, dtype=np.int64)
+        target_array = np.asarray(targets, dtype=np.int64)
+        self._forward = _Adjacency(source_array, target_array, node_count)
+        self._backward = _Adjacency(target_array, source_array, node_count)
+
+    @classmethod
+    def from_snapshot(
+        cls, links: Iterable[Union[DatapinLink, Tuple[str, str]]], snapshot: TreeSnapshot
+    ) -> LinkGraph:
+        """
+        Create a graph from the links of a workflow and a snapshot of its element tree.
+
+        Parameters
+        ----------
+        links : Iterable[Union[DatapinLink, Tuple[str, str]]]
+            Links between datapins. See the constructor.
+        snapshot : TreeSnapshot
+            Snapshot of the element tree, which the components and their datapins are taken
+            from. Datapins must not be filtered out of it.
+        """
+        components: Dict[str, Tuple[List[str], List[str]]] = {}
+        for element in snapshot:
+            parent = snapshot.get_parent(element)
+            if (
+                element.kind == ElementKind.DATAPIN
+                and parent is not None
+                and parent.kind == ElementKind.COMPONENT
+            ):
+                inputs, outputs = components.setdefault(parent.full_name, ([], []))
+                (inputs if element.is_input_to_component else outputs).append(element.full_name)
+        return cls(links, components)
+
+    @property
+    def datapin_names(self) -> Sequence[str]:
+        """
+        Full names of the datapins in the graph.
+
+        The position of each name is the index of its datapin in the adjacency arrays. Indices
+        after the last datapin are those of the components.
+        """
+        return tuple(self._names)
+
+    @property
+    def csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Downstream adjacency of the graph, as ``(indptr, indices)`` CSR arrays.
+
+        The nodes that node ``i`` feeds are ``indices[indptr[i]:indptr[i + 1]]``. The arrays are
+        shared and must not be modified.
+        """
+        return self._forward.indptr, self._forward.indices
+
+    def upstream(self, names: AbstractSet[str], transitive: bool = False) -> Sequence[str]:
+        """
+        Get the datapins that the given datapins depend on.
+
+        Parameters
+        ----------
+        names : AbstractSet[str]
+            Full names of datapins. Names that the graph does not contain have no links.
+        transitive : bool, default: False
+            Whether to get all the datapins that the given datapins depend on, through links
+            and components. If ``False``, only the sources of the links to the given datapins
+            are returned.
+
+        Returns
+        -------
+        Sequence[str]
+            Full names of the datapins, nearest first, excluding the given datapins.
+        """
+        return self._reach(names, self._backward, transitive)
+
+    def downstream(self, names: AbstractSet[str], transitive: bool = False) -> Sequence[str]:
+        """
+        Get the datapins that depend on the given datapins.
+
+        Parameters
+        ----------
+        names : AbstractSet[str]
+            Full names of datapins. Names that the graph does not contain have no links.
+        transitive : bool, default: False
+            Whether to get all the datapins that depend on the given datapins, through links and
+            components. If ``False``, only the targets of the links from the given datapins are
+            returned.
+
+        Returns
+        -------
+        Sequence[str]
+            Full names of the datapins, nearest first, excluding the given datapins.
+        """
+        return self._reach(names, self._forward, transitive)
+
+    def _reach(
+        self, names: AbstractSet[str], adjacency: _Adjacency, transitive: bool
+    ) -> Sequence[str]:
+        visited = bytearray(len(adjacency.indptr) - 1)
+        visited_array = np.frombuffer(visited, dtype=np.uint8)
+        frontier = [self._ids[name] for name in names if name in self._ids]
+        for node in frontier:
+            visited[node] = 1
+        found: List[np.ndarray] = []
+        while frontier:
+            if len(frontier) < _VECTORIZE_THRESHOLD:
+                # Small frontiers, such as those of long chains, are cheaper to expand one node
+                # at a time than with a round of NumPy calls.
+                indptr, indices = adjacency.lists
+                next_frontier = []
+                for node in frontier:
+                    for neighbor in indices[indptr[node] : indptr[node + 1]]:
+                        if not visited[neighbor]:
+                            visited[neighbor] = 1
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+                level = np.asarray(frontier, dtype=np.int64)
+            else:
+                nodes = np.asarray(frontier, dtype=np.int64)
+                starts = adjacency.indptr[nodes]
+                counts = adjacency.indptr[nodes + 1] - starts
+                # Positions of all neighbors of the frontier in the indices array.
+                offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+                level = np.unique(adjacency.indices[offsets + np.arange(offsets.size)])
+                level = level[visited_array[level] == 0]
+                visited_array[level] = 1
+                frontier = level.tolist()
+            # Component nodes are traversed but not reported.
+            found.append(level[level < self._datapin_count])
+            if not transitive:
+                break
+        if not found:
+            return ()
+        return tuple(self._name_array[np.concatenate(found)].tolist())
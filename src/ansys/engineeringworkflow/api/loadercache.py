@@ -0,0 +1,212 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Cache of parsed workflow files.
+
+Engines that load the same workflow file many times can keep the parsed form of the file in a
+``WorkflowLoaderCache`` object and create each new workflow instance from it, instead of
+reading and parsing the file again.
+
+A cached entry is reused while the modification time and size of its file are unchanged. When
+either changes, the file is read again and hashed, and it is parsed again only if its content
+has changed. Files with identical content share a single entry.
+
+Entries are evicted in least-recently-used order when the cache holds more than its maximum
+number of entries or when the total size of the cached files exceeds its memory cap. The size of
+a file is used as the measure of the memory used by its parsed form.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import os
+from os import PathLike
+import threading
+from typing import Callable, Dict, Generic, Set, Tuple, TypeVar, Union
+
+D = TypeVar("D")
+
+
+@dataclass
+class _Entry(Generic[D]):
+    """Parsed form of a file's content, and the paths it was loaded from."""
+
+    definition: D
+    size: int
+    paths: Set[str]
+
+
+class WorkflowLoaderCache(Generic[D]):
+    """
+    Provides a thread-safe cache of parsed workflow files.
+
+    The cached objects are shared by all callers and must not be modified.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[bytes], D],
+        max_entries: int = 64,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        parse : Callable[[bytes], D]
+            Function that parses the content of a workflow file.
+        max_entries : int, default: 64
+            Maximum number of distinct file contents to keep.
+        max_bytes : int, default: 256 MiB
+            Maximum total size of the cached files, in bytes. A file larger than this is parsed
+            on every load and never cached.
+        """
+        if max_entries < 1:
+            raise ValueError("The maximum number of entries must be at least 1.")
+        if max_bytes < 0:
+            raise ValueError("The maximum number of bytes must not be negative.")
+        self._parse = parse
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, _Entry[D]] = OrderedDict()
+        # Maps each resolved path to the modification time and size it had when it was last
+        # read, and to the digest of its content at that time.
+        self._paths: Dict[str, Tuple[int, int, bytes]] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        """Number of loads served without parsing a file."""
+        self.misses = 0
+        """Number of loads that parsed a file."""
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of distinct file contents to keep."""
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of the cached files, in bytes."""
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached files, in bytes."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        """Get the number of distinct file contents in the cache."""
+        return len(self._entries)
+
+    def load(self, file_name: Union[PathLike, str]) -> D:
+        """
+        Get the parsed form of a workflow file.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+
+        Returns
+        -------
+        D
+            Parsed form of the file's current content.
+        """
+        path = os.path.realpath(file_name)
+        stat = os.stat(path)
+        with self._lock:
+            known = self._paths.get(path)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                entry = self._entries.get(known[2])
+                if entry is not None:
+                    return self._hit(known[2], entry)
+
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            content = file.read()
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        with self._lock:
+            self._forget_path(path)
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._paths[path] = (stat.st_mtime_ns, stat.st_size, digest)
+                entry.paths.add(path)
+                return self._hit(digest, entry)
+            self.misses += 1
+
+        # Parse outside the lock so that loads of other files are not held up. Two threads that
+        # miss on the same content at once both parse it, and the first result is kept.
+        definition = self._parse(content)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                if len(content) > self._max_bytes:
+                    return definition
+                entry = _Entry(definition, len(content), set())
+                self._entries[digest] = entry
+                self._total_bytes += entry.size
+                self._evict()
+            self._forget_path(path)
+            self._paths[path] = (stat.st_mtime_ns, stat.st_size, digest)
+            entry.paths.add(path)
+            return entry.definition
+
+    def invalidate(self, file_name: Union[PathLike, str]) -> None:
+        """
+        Make the next load of a file read it again.
+
+        Parameters
+        ----------
+        file_name : Union[PathLike, str]
+            Path to the workflow file.
+        """
+        with self._lock:
+            self._forget_path(os.path.realpath(file_name))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self._total_bytes = 0
+
+    def _hit(self, digest: bytes, entry: _Entry[D]) -> D:
+        self.hits += 1
+        self._entries.move_to_end(digest)
+        return entry.definition
+
+    def _forget_path(self, path: str) -> None:
+        known = self._paths.pop(path, None)
+        if known is not None:
+            entry = self._entries.get(known[2])
+            if entry is not None:
+                entry.paths.discard(path)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            for path in entry.paths:
+                del self._paths[path]
@@ -0,0 +1,476 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Run memoization.
+
+This module contains workflow instance wrappers that remember the outputs of runs and return
+them again, without running the workflow, when a run with the same inputs is requested. They
+are meant for optimizers that re-evaluate designs they have already seen.
+
+Memoization assumes that the workflow is deterministic: its outputs must depend only on the
+values of its inputs, on its properties, and on its structure. Results are keyed on:
+
+- A hash of the states of all workflow inputs, which are the unlinked input datapins, after
+  the ``inputs`` of the run are applied. Real values can be rounded to a tolerance first.
+- The ``validation_names`` and ``collect_names`` of the run.
+- A fingerprint of the workflow structure and properties, which is recomputed whenever the
+  ``get_metadata_version`` method of the wrapped instance returns a new number.
+
+On a hit, the ``inputs`` of the run are set on the wrapped instance, but no component runs, so
+its other datapins keep the values of the last run that actually ran. Failed runs are not
+remembered.
+
+Outputs are remembered in memory. To share them with other processes and keep them across
+restarts, also pass a ``resultstore.ResultStore`` object, which is consulted when the outputs
+are not in memory.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import replace
+import hashlib
+import threading
+from typing import AbstractSet, Dict, Mapping, Optional, Tuple
+
+from ansys.tools.variableinterop import IVariableValue, VariableState, VariableType
+import anyio
+import numpy as np
+
+from .datatypes import CancelToken, ElementKind, ElementRunStatus, RunStatistics, TreeSnapshot
+from .iasyncworkflow import IAsyncWorkflowInstance
+from .instancewrapper import AsyncWorkflowInstanceWrapper, WorkflowInstanceWrapper
+from .iworkflow import IWorkflowInstance
+from .resultstore import ResultStore
+
+_REAL_TYPES = (VariableType.REAL, VariableType.REAL_ARRAY)
+
+
+def workflow_fingerprint(snapshot: TreeSnapshot) -> str:
+    """
+    Compute a hash of the structure and properties of a workflow.
+
+    Two workflows have the same fingerprint if they have the same elements, with the same names,
+    kinds, control types, PACZ URLs, datapin types, and property values.
+
+    Parameters
+    ----------
+    snapshot : TreeSnapshot
+        Snapshot of the whole element tree of the workflow.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for element in snapshot:
+        fields = [
+            element.full_name,
+            element.kind.name,
+            str(element.control_type),
+            str(element.pacz_url),
+            element.value_type.name if element.value_type is not None else "",
+            str(element.is_input_to_workflow),
+        ]
+        for name in sorted(element.properties):
+            fields.append(name)
+            fields.append(_encode_value(element.properties[name].property_value, None))
+        digest.update("\0".join(fields).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _encode_value(value: IVariableValue, float_tolerance: Optional[float]) -> str:
+    value_type = value.variable_type
+    if float_tolerance is not None and value_type in _REAL_TYPES:
+        steps = np.rint(np.asarray(value, dtype=np.float64) / float_tolerance)
+        return f"{value_type.name}:{steps.shape}:{steps.astype(np.int64).tobytes().hex()}"
+    return f"{value_type.name}:{value.to_api_string()}"
+
+
+def run_key(
+    fingerprint: str,
+    inputs: Mapping[str, VariableState],
+    validation_names: AbstractSet[str],
+    collect_names: AbstractSet[str],
+    float_tolerance: Optional[float] = None,
+) -> str:
+    """
+    Compute the key under which the outputs of a run are remembered.
+
+    The key does not depend on the order of the inputs or names.
+
+    Parameters
+    ----------
+    fingerprint : str
+        Fingerprint of the workflow, as computed by the ``workflow_fingerprint`` function.
+    inputs : Mapping[str, VariableState]
+        States of the workflow inputs.
+    validation_names : AbstractSet[str]
+        Validation names of the run.
+    collect_names : AbstractSet[str]
+        Collect names of the run.
+    float_tolerance : Optional[float]
+        If not ``None``, real values are rounded to the nearest multiple of this value, so that
+        values that round to the same multiple have the same key.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    digest = hashlib.blake2b(fingerprint.encode(), digest_size=16)
+    for name in sorted(inputs):
+        state = inputs[name]
+        encoded = _encode_value(state.value, float_tolerance)
+        digest.update(f"I\0{name}\0{state.is_valid}\0{encoded}\n".encode())
+    for name in sorted(validation_names):
+        digest.update(f"V\0{name}\n".encode())
+    for name in sorted(collect_names):
+        digest.update(f"C\0{name}\n".encode())
+    return digest.hexdigest()
+
+
+class _RunCache:
+    """Provides the bookkeeping shared by the synchronous and asynchronous wrappers."""
+
+    def __init__(
+        self, max_size: int, float_tolerance: Optional[float], store: Optional[ResultStore]
+    ):
+        if max_size < 1:
+            raise ValueError("The maximum size must be at least 1.")
+        if float_tolerance is not None and float_tolerance <= 0.0:
+            raise ValueError("The floating-point tolerance must be positive.")
+        self.max_size = max_size
+        self.float_tolerance = float_tolerance
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._entries: OrderedDict[str, Dict[str, VariableState]] = OrderedDict()
+        # Metadata version, fingerprint, and workflow input names of the wrapped instance.
+        self.workflow: Optional[Tuple[int, str, Tuple[str, ...]]] = None
+
+    @property
+    def last_run_memoized(self) -> bool:
+        """Whether the outputs of the last run on this thread came from memory or the store."""
+        return getattr(self._local, "memoized", False)
+
+    @last_run_memoized.setter
+    def last_run_memoized(self, value: bool) -> None:
+        self._local.memoized = value
+
+    def get(self, key: str) -> Optional[Dict[str, VariableState]]:
+        """Get outputs from memory."""
+        with self._lock:
+            outputs = self._entries.get(key)
+            if outputs is not None:
+                self._entries.move_to_end(key)
+                return dict(outputs)
+            return None
+
+    def get_from_store(self, key: str) -> Optional[Dict[str, VariableState]]:
+        """Get outputs from the store, remembering them in memory, and count the lookup."""
+        outputs = self.store.get(key) if self.store is not None else None
+        with self._lock:
+            if outputs is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self.put(key, outputs)
+        return outputs
+
+    def count_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def put(self, key: str, outputs: Mapping[str, VariableState]) -> None:
+        with self._lock:
+            self._entries[key] = dict(outputs)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def put_in_store(self, key: str, outputs: Mapping[str, VariableState]) -> None:
+        if self.store is not None:
+            try:
+                self.store.put(key, outputs)
+            except ValueError:
+                # Outputs that cannot be stored on disk are still remembered in memory.
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def memoized_statistics(statistics: RunStatistics) -> RunStatistics:
+        """Report all components as cached, for a run whose outputs were remembered."""
+        count = len(statistics)
+        return replace(
+            statistics,
+            wall_times=(0.0,) * count,
+            queue_waits=(0.0,) * count,
+            execution_counts=(0,) * count,
+            statuses=(ElementRunStatus.CACHED,) * count,
+        )
+
+    @staticmethod
+    def describe(version: int, snapshot: TreeSnapshot) -> Tuple[int, str, Tuple[str, ...]]:
+        input_names = tuple(
+            element.full_name
+            for element in snapshot
+            if element.kind == ElementKind.DATAPIN and element.is_input_to_workflow
+        )
+        return version, workflow_fingerprint(snapshot), input_names
+
+
+class MemoizingWorkflowInstance(WorkflowInstanceWrapper):
+    """
+    Provides a workflow instance wrapper that remembers the outputs of runs.
+
+    Only the ``run`` method is memoized, which includes the default implementation of the
+    ``run_batch`` method. The wrapper is thread-safe. Whether the last run was memoized is
+    tracked per thread, so the ``get_run_statistics`` method describes the last run made on the
+    calling thread.
+    """
+
+    def __init__(
+        self,
+        wrapped: IWorkflowInstance,
+        max_size: int = 1024,
+        float_tolerance: Optional[float] = None,
+        store: Optional[ResultStore] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        wrapped : IWorkflowInstance
+            Workflow instance to run.
+        max_size : int, default: 1024
+            Maximum number of runs whose outputs are remembered. The least recently used outputs
+            are forgotten first.
+        float_tolerance : Optional[float]
+            If not ``None``, real input values are rounded to the nearest multiple of this value
+            before they are compared, so that nearly equal designs share their outputs.
+        store : Optional[ResultStore]
+            Persistent store to look up outputs that are not in memory and to save the outputs
+            of new runs to. Outputs that cannot be serialized are only remembered in memory.
+
+        Raises
+        ------
+        ValueError
+            If the maximum size is less than 1 or the tolerance is not positive.
+        """
+        super().__init__(wrapped)
+        self._cache = _RunCache(max_size, float_tolerance, store)
+
+    @property
+    def hits(self) -> int:
+        """Number of runs whose outputs were returned from memory or from the store."""
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of runs that had to run the workflow."""
+        return self._cache.misses
+
+    def __len__(self) -> int:
+        """Get the number of remembered runs."""
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Forget the outputs of all runs."""
+        self._cache.clear()
+
+    def refresh(self) -> None:
+        """
+        Recompute the fingerprint of the workflow before the next run.
+
+        Call this method after changing properties of elements other than through the
+        ``set_properties_bulk`` method of this wrapper.
+        """
+        self._cache.workflow = None
+
+    def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Mapping[str, VariableState]:
+        """
+        Set a workflow's input datapins and run it, unless the outputs are already known.
+
+        The ``reset`` parameter is not part of the key because it does not change the outputs of
+        a deterministic workflow. If the outputs are known, the inputs are still set on the
+        wrapped instance, so that later runs that only set some inputs keep the others.
+        See :meth:`.IWorkflowInstance.run` for a description of the parameters.
+        """
+        cache = self._cache
+        version = self._wrapped.get_metadata_version()
+        if cache.workflow is None or cache.workflow[0] != version:
+            cache.workflow = cache.describe(version, self._wrapped.get_tree_snapshot())
+        _, fingerprint, input_names = cache.workflow
+        states = {**self._wrapped.get_states(set(input_names) - inputs.keys()), **inputs}
+        key = run_key(fingerprint, states, validation_names, collect_names, cache.float_tolerance)
+        outputs = cache.get(key)
+        if outputs is not None:
+            cache.count_hit()
+        else:
+            outputs = cache.get_from_store(key)
+        cache.last_run_memoized = outputs is not None
+        if outputs is None:
+            outputs = self._wrapped.run(
+                inputs, reset, validation_names, collect_names, timeout, cancel_token
+            )
+            cache.put(key, outputs)
+            cache.put_in_store(key, outputs)
+        elif inputs:
+            self._wrapped.set_states(inputs)
+        return outputs
+
+    def get_run_statistics(self) -> RunStatistics:
+        """
+        Get what happened to each component of the workflow instance during its last run.
+
+        If the outputs of the last run made on the calling thread were remembered, all
+        components are reported as cached.
+        """
+        statistics = self._wrapped.get_run_statistics()
+        if self._cache.last_run_memoized:
+            return self._cache.memoized_statistics(statistics)
+        return statistics
+
+    def set_properties_bulk(self, values: Mapping[Tuple[str, str], IVariableValue]) -> None:
+        """Create or set properties on several elements and recompute the fingerprint."""
+        try:
+            super().set_properties_bulk(values)
+        finally:
+            self.refresh()
+
+
+class AsyncMemoizingWorkflowInstance(AsyncWorkflowInstanceWrapper):
+    """
+    Provides an asynchronous workflow instance wrapper that remembers the outputs of runs.
+
+    Only the ``run`` method is memoized, which includes the default implementation of the
+    ``run_batch`` method.
+    """
+
+    def __init__(
+        self,
+        wrapped: IAsyncWorkflowInstance,
+        max_size: int = 1024,
+        float_tolerance: Optional[float] = None,
+        store: Optional[ResultStore] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        The store is accessed on worker threads. See the ``MemoizingWorkflowInstance`` class for
+        a description of the parameters.
+        """
+        super().__init__(wrapped)
+        self._cache = _RunCache(max_size, float_tolerance, store)
+
+    @property
+    def hits(self) -> int:
+        """Number of runs whose outputs were returned from memory or from the store."""
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of runs that had to run the workflow."""
+        return self._cache.misses
+
+    def __len__(self) -> int:
+        """Get the number of remembered runs."""
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Forget the outputs of all runs."""
+        self._cache.clear()
+
+    def refresh(self) -> None:
+        """Recompute the fingerprint of the workflow before the next run."""
+        self._cache.workflow = None
+
+    async def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+    ) -> Mapping[str, VariableState]:
+        """
+        Set a workflow's input datapins and run it, unless the outputs are already known.
+
+        If the outputs are known, the inputs are still set on the wrapped instance.
+        See :meth:`.IAsyncWorkflowInstance.run` for a description of the parameters.
+        """
+        cache = self._cache
+        version = await self._wrapped.get_metadata_version()
+        if cache.workflow is None or cache.workflow[0] != version:
+            cache.workflow = cache.describe(version, await self._wrapped.get_tree_snapshot())
+        _, fingerprint, input_names = cache.workflow
+        states = {**await self._wrapped.get_states(set(input_names) - inputs.keys()), **inputs}
+        key = run_key(fingerprint, states, validation_names, collect_names, cache.float_tolerance)
+        outputs = cache.get(key)
+        if outputs is not None:
+            cache.count_hit()
+        else:
+            outputs = await anyio.to_thread.run_sync(cache.get_from_store, key)
+        cache.last_run_memoized = outputs is not None
+        if outputs is None:
+            outputs = await self._wrapped.run(inputs, reset, validation_names, collect_names)
+            cache.put(key, outputs)
+            await anyio.to_thread.run_sync(cache.put_in_store, key, outputs)
+        elif inputs:
+            await self._wrapped.set_states(inputs)
+        return outputs
+
+    async def get_run_statistics(self) -> RunStatistics:
+        """
+        Get what happened to each component of the workflow instance during its last run.
+
+        If the outputs of the last run were remembered, all components are reported as cached.
+        """
+        statistics = await self._wrapped.get_run_statistics()
+        if self._cache.last_run_memoized:
+            return self._cache.memoized_statistics(statistics)
+        return statistics
+
+    async def set_properties_bulk(self, values: Mapping[Tuple[str, str], IVariableValue]) -> None:
+        """Create or set properties on several elements and recompute the fingerprint."""
+        try:
+            await super().set_properties_bulk(values)
+        finally:
+            self.refresh()
@@ -0,0 +1,237 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Datapin metadata caches.
+
+This module contains opt-in caches of datapin metadata for code that validates many values, such
+as optimizers that check bounds before each run. Metadata is cached per element ID, with
+least-recently-used eviction. A cache is cleared whenever the ``get_metadata_version`` method of
+its workflow instance returns a new number. That method is called at most once per version check
+interval, so that lookups do not cost a round trip to the engine each.
+
+The cached metadata objects are shared by all callers and must not be modified.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Optional
+
+from ansys.tools.variableinterop import CommonVariableMetadata
+
+from .iasyncworkflow import IAsyncDatapin, IAsyncWorkflowInstance
+from .iworkflow import IDatapin, IWorkflowInstance
+
+DEFAULT_VERSION_CHECK_INTERVAL = 1.0
+"""Default minimum time between metadata version checks of the caches, in seconds."""
+
+
+class _MetadataStore:
+    """Provides the bookkeeping shared by the synchronous and asynchronous caches."""
+
+    def __init__(self, max_size: int, version_check_interval: float):
+        if max_size < 1:
+            raise ValueError("The maximum size must be at least 1.")
+        self.max_size = max_size
+        self.version_check_interval = version_check_interval
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CommonVariableMetadata] = OrderedDict()
+        self._version: Optional[int] = None
+        self._version_checked = float("-inf")
+        # Incremented whenever the entries are cleared, so that metadata fetched before a
+        # version change is not stored after it.
+        self.generation = 0
+
+    def version_is_due(self) -> bool:
+        return time.monotonic() - self._version_checked >= self.version_check_interval
+
+    def set_version(self, version: int) -> None:
+        self._version_checked = time.monotonic()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+            self.generation += 1
+
+    def get(self, element_id: str) -> Optional[CommonVariableMetadata]:
+        metadata = self._entries.get(element_id)
+        if metadata is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(element_id)
+        return metadata
+
+    def put(self, element_id: str, metadata: CommonVariableMetadata, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[element_id] = metadata
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._version = None
+        self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MetadataCache:
+    """
+    Caches the metadata of the datapins of a workflow instance.
+
+    The cache is thread-safe.
+    """
+
+    def __init__(
+        self,
+        instance: IWorkflowInstance,
+        max_size: int = 10_000,
+        version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : IWorkflowInstance
+            Workflow instance that the datapins belong to.
+        max_size : int, default: 10_000
+            Maximum number of datapins whose metadata is kept.
+        version_check_interval : float, default: DEFAULT_VERSION_CHECK_INTERVAL
+            Minimum time between calls to the ``get_metadata_version`` method of the instance, in
+            seconds. Metadata may be stale for that long after it changes. Set ``0.0`` to check
+            the version on every lookup, or call the ``clear`` method after changing metadata.
+
+        Raises
+        ------
+        ValueError
+            If the maximum size is less than 1.
+        """
+        self._instance = instance
+        self._store = _MetadataStore(max_size, version_check_interval)
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that were answered from the cache."""
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that had to get the metadata from the datapin."""
+        return self._store.misses
+
+    def __len__(self) -> int:
+        """Get the number of datapins whose metadata is cached."""
+        return len(self._store)
+
+    def get_metadata(self, datapin: IDatapin) -> CommonVariableMetadata:
+        """
+        Get the metadata of a datapin, from the cache if possible.
+
+        Parameters
+        ----------
+        datapin : IDatapin
+            Datapin of the workflow instance to get the metadata of.
+        """
+        store = self._store
+        if store.version_is_due():
+            version = self._instance.get_metadata_version()
+            with self._lock:
+                store.set_version(version)
+        with self._lock:
+            metadata = store.get(datapin.element_id)
+            generation = store.generation
+        if metadata is None:
+            metadata = datapin.get_metadata()
+            with self._lock:
+                store.put(datapin.element_id, metadata, generation)
+        return metadata
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._store.clear()
+
+
+class AsyncMetadataCache:
+    """
+    Caches the metadata of the datapins of an asynchronous workflow instance.
+
+    The cache must only be used from one event loop.
+    """
+
+    def __init__(
+        self,
+        instance: IAsyncWorkflowInstance,
+        max_size: int = 10_000,
+        version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL,
+    ):
+        """
+        Initialize a new instance.
+
+        See the ``MetadataCache`` class for a description of the parameters.
+        """
+        self._instance = instance
+        self._store = _MetadataStore(max_size, version_check_interval)
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that were answered from the cache."""
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that had to get the metadata from the datapin."""
+        return self._store.misses
+
+    def __len__(self) -> int:
+        """Get the number of datapins whose metadata is cached."""
+        return len(self._store)
+
+    async def get_metadata(self, datapin: IAsyncDatapin) -> CommonVariableMetadata:
+        """
+        Get the metadata of a datapin, from the cache if possible.
+
+        Parameters
+        ----------
+        datapin : IAsyncDatapin
+            Datapin of the workflow instance to get the metadata of.
+        """
+        store = self._store
+        if store.version_is_due():
+            store.set_version(await self._instance.get_metadata_version())
+        metadata = store.get(datapin.element_id)
+        if metadata is None:
+            generation = store.generation
+            metadata = await datapin.get_metadata()
+            store.put(datapin.element_id, metadata, generation)
+        return metadata
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._store.clear()
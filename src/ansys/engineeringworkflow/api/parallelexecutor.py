@@ -0,0 +1,309 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Concurrent execution of parallel control statements.
+
+Engines that run components locally can use a ``ParallelExecutor`` object to run the children
+of ``parallel`` control statements at the same time. The children of all other control
+statements run one after the other, in the order in which they are defined.
+
+A child of a parallel control statement that depends on the outputs of an earlier sibling
+starts when that sibling has finished, so results are the same as those of a sequential run.
+The dependencies are taken from a ``DependencyGraph`` object when the ``ExecutionPlan`` object
+is built.
+
+Component callables are offloaded to worker threads or processes, so that the event loop
+schedules further components while they run. A capacity limiter bounds how many run at once.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import math
+import sys
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import anyio
+
+from .dependencies import DependencyGraph
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup
+
+T = TypeVar("T")
+
+PARALLEL = "parallel"
+"""Control type of the control statements whose children run concurrently."""
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    Stores the order in which the components under a control statement may run.
+
+    Plans are immutable and may be shared by all instances of a workflow.
+    """
+
+    name: str
+    """Full name of the control statement."""
+    parallel: bool
+    """Flag indicating if the children may run concurrently."""
+    children: Tuple[Union[ExecutionPlan, str], ...]
+    """Plans of the child control statements and full names of the child components."""
+    predecessors: Tuple[Tuple[int, ...], ...]
+    """Indices of the earlier siblings that each child must wait for, if ``parallel`` is set."""
+
+    @classmethod
+    def build(
+        cls,
+        root_name: str,
+        control_statements: Mapping[str, Tuple[str, Sequence[str]]],
+        graph: DependencyGraph,
+    ) -> ExecutionPlan:
+        """
+        Build the plan of a workflow.
+
+        Parameters
+        ----------
+        root_name : str
+            Full name of the root control statement.
+        control_statements : Mapping[str, Tuple[str, Sequence[str]]]
+            Control type and full names of the children of each control statement, by the full
+            name of the control statement. Children that are not in the mapping are components.
+        graph : DependencyGraph
+            Dependencies between the components of the workflow.
+        """
+        return _PlanBuilder(control_statements, graph).build(root_name)
+
+
+class _PlanBuilder:
+    """Builds the plans of the control statements of a workflow."""
+
+    def __init__(
+        self, control_statements: Mapping[str, Tuple[str, Sequence[str]]], graph: DependencyGraph
+    ):
+        self._control_statements = control_statements
+        self._graph = graph
+        self._components: Dict[str, FrozenSet[str]] = {}
+
+    def build(self, name: str) -> ExecutionPlan:
+        control_type, child_names = self._control_statements[name]
+        children = tuple(
+            self.build(child) if child in self._control_statements else child
+            for child in child_names
+        )
+        predecessors: List[Tuple[int, ...]] = []
+        if control_type == PARALLEL:
+            owned = [self._components_under(child) for child in child_names]
+            for index, child in enumerate(child_names):
+                required = set(self._graph.required_components({child}))
+                predecessors.append(
+                    tuple(
+                        earlier
+                        for earlier in range(index)
+                        if not required.isdisjoint(owned[earlier])
+                    )
+                )
+        return ExecutionPlan(name, control_type == PARALLEL, children, tuple(predecessors))
+
+    def _components_under(self, name: str) -> FrozenSet[str]:
+        if name not in self._control_statements:
+            return frozenset((name,))
+        components = self._components.get(name)
+        if components is None:
+            _, child_names = self._control_statements[name]
+            components = frozenset().union(*map(self._components_under, child_names))
+            self._components[name] = components
+        return components
+
+
+class ParallelExecutor:
+    """
+    Provides an anyio-based executor that runs the children of parallel control statements
+    concurrently.
+
+    An executor may be shared by several workflow instances. If it offloads to processes, it
+    owns a process pool, which its ``close`` method shuts down.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        limiter: Optional[anyio.CapacityLimiter] = None,
+        offload: str = "thread",
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        max_concurrency : int, default: 8
+            Maximum number of component callables that run at once. Ignored if ``limiter`` is
+            given.
+        limiter : Optional[anyio.CapacityLimiter], default: None
+            Capacity limiter that bounds the number of component callables that run at once,
+            which may be shared with other code.
+        offload : str, default: "thread"
+            Where component callables run: ``"thread"`` for worker threads, or ``"process"``
+            for worker processes. Processes give a speedup for callables that hold the global
+            interpreter lock, but the callables, their arguments, and their results must be
+            picklable.
+        """
+        if offload not in ("thread", "process"):
+            raise ValueError(f"Unknown offload {offload!r}, expected 'thread' or 'process'.")
+        if limiter is None:
+            if max_concurrency < 1:
+                raise ValueError("The maximum concurrency must be at least 1.")
+            limiter = anyio.CapacityLimiter(max_concurrency)
+        self._limiter = limiter
+        self._offload = offload
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        """Capacity limiter that bounds the number of component callables that run at once."""
+        return self._limiter
+
+    @property
+    def offload(self) -> str:
+        """Where component callables run, ``"thread"`` or ``"process"``."""
+        return self._offload
+
+    async def run(
+        self, plan: ExecutionPlan, run_component: Callable[[str], Awaitable[None]]
+    ) -> None:
+        """
+        Run the components of a workflow in the order of its plan.
+
+        If a component fails, the components that are running concurrently are cancelled and
+        its exception is raised.
+
+        Parameters
+        ----------
+        plan : ExecutionPlan
+            Plan of the workflow.
+        run_component : Callable[[str], Awaitable[None]]
+            Coroutine function that runs the component with the given full name, typically by
+            calling the ``call`` method. It is called for every component in the plan and
+            should return at once for components that do not need to run.
+        """
+        try:
+            await self._run_plan(plan, run_component)
+        except BaseExceptionGroup as group:
+            raise _first_exception(group) from None
+
+    async def call(self, function: Callable[..., T], arguments: Mapping[str, Any]) -> T:
+        """
+        Call a component callable on a worker thread or process.
+
+        Parameters
+        ----------
+        function : Callable[..., T]
+            Component callable.
+        arguments : Mapping[str, Any]
+            Keyword arguments of the call.
+        """
+        if self._offload == "thread":
+            return await anyio.to_thread.run_sync(
+                partial(function, **arguments), limiter=self._limiter
+            )
+        async with self._limiter:
+            future = self._get_process_pool().submit(function, **arguments)
+            # The token is held while the process runs, so the waiting thread uses the default
+            # limiter of the event loop instead.
+            return await anyio.to_thread.run_sync(future.result)
+
+    def close(self) -> None:
+        """Shut down the process pool of the executor, if any."""
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+
+    def __enter__(self) -> ParallelExecutor:
+        """Enter a context that closes the executor on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the executor."""
+        self.close()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                tokens = self._limiter.total_tokens
+                self._process_pool = ProcessPoolExecutor(
+                    None if math.isinf(tokens) else int(tokens)
+                )
+            return self._process_pool
+
+    async def _run_plan(
+        self, plan: ExecutionPlan, run_component: Callable[[str], Awaitable[None]]
+    ) -> None:
+        if not plan.parallel:
+            for child in plan.children:
+                await self._run_child(child, run_component)
+            return
+        finished = [anyio.Event() for _ in plan.children]
+
+        async def run_after_predecessors(index: int) -> None:
+            for predecessor in plan.predecessors[index]:
+                await finished[predecessor].wait()
+            await self._run_child(plan.children[index], run_component)
+            finished[index].set()
+
+        async with anyio.create_task_group() as task_group:
+            for index in range(len(plan.children)):
+                task_group.start_soon(run_after_predecessors, index)
+
+    async def _run_child(
+        self, child: Union[ExecutionPlan, str], run_component: Callable[[str], Awaitable[None]]
+    ) -> None:
+        if isinstance(child, ExecutionPlan):
+            await self._run_plan(child, run_component)
+        else:
+            await run_component(child)
+
+
+def _first_exception(group: BaseExceptionGroup) -> BaseException:
+    """Get the first exception of a task group that is not a nested group."""
+    exception = group.exceptions[0]
+    while isinstance(exception, BaseExceptionGroup):
+        exception = exception.exceptions[0]
+    return exception
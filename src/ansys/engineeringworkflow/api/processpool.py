@@ -0,0 +1,340 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Process-pool execution of workflow runs.
+
+Components written in Python hold the global interpreter lock while they run, so runs of
+workflow instances in one process use one core. The executor in this module spreads runs over a
+pool of worker processes instead. Each worker creates its own engine and loads its own instance
+of the workflow when it starts, and then runs the designs sent to it one after the other.
+Datapins that a design does not set have their initial states, whichever designs the worker ran
+before.
+
+Inputs and outputs are sent between processes in the compact form of the ``serialization``
+module, so only datapin types that it supports can be used. Runs are reported as
+``concurrent.futures.Future`` objects.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, InvalidStateError, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+import multiprocessing.context
+import os
+from os import PathLike
+from typing import (
+    AbstractSet,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
+
+from ansys.tools.variableinterop import VariableState
+
+from .datatypes import BatchRunResult
+from .iworkflow import IFileBasedWorkflowEngine, IWorkflowInstance
+from .serialization import dumps_states, loads_states
+
+_worker_instance: Optional[IWorkflowInstance] = None
+"""Workflow instance of the current worker process."""
+
+_worker_initial_states: Dict[str, VariableState] = {}
+"""Initial states of the datapins that the designs run by the current worker process have set."""
+
+
+def _initialize_worker(
+    engine_factory: Callable[[], IFileBasedWorkflowEngine], file_name: str
+) -> None:
+    global _worker_instance
+    _worker_instance = engine_factory().load_workflow(file_name)
+
+
+def _run(
+    inputs: bytes, reset: bool, validation_names: AbstractSet[str], collect_names: AbstractSet[str]
+) -> bytes:
+    assert _worker_instance is not None
+    design = loads_states(inputs)
+    # Datapins are recorded before any design sets them, and restored for designs that do not.
+    new_names = design.keys() - _worker_initial_states.keys()
+    if new_names:
+        _worker_initial_states.update(_worker_instance.get_states(new_names))
+    states = {**_worker_initial_states, **design}
+    outputs = _worker_instance.run(states, reset, validation_names, collect_names)
+    return dumps_states(outputs)
+
+
+def _run_chunk(
+    chunk: List[bytes],
+    reset: bool,
+    validation_names: AbstractSet[str],
+    collect_names: AbstractSet[str],
+) -> List[Union[bytes, Exception]]:
+    results: List[Union[bytes, Exception]] = []
+    for inputs in chunk:
+        try:
+            results.append(_run(inputs, reset, validation_names, collect_names))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
+def _decode(future: Future) -> Future:
+    """Get a future of the outputs of a run from the future of their serialized form."""
+    decoded: Future = Future()
+
+    def copy_outcome(done: Future) -> None:
+        try:
+            if done.cancelled():
+                decoded.cancel()
+            elif done.exception() is not None:
+                decoded.set_exception(done.exception())
+            else:
+                decoded.set_result(loads_states(done.result()))
+        except InvalidStateError:
+            # The decoded future was cancelled while the run was already in progress.
+            pass
+        except Exception as error:
+            decoded.set_exception(error)
+
+    def propagate_cancel(done: Future) -> None:
+        if done.cancelled():
+            future.cancel()
+
+    decoded.add_done_callback(propagate_cancel)
+    future.add_done_callback(copy_outcome)
+    return decoded
+
+
+@dataclass
+class _Chunk:
+    """Designs that were sent to a worker together."""
+
+    start: int
+    """Index of the first design of the chunk."""
+    payloads: List[Union[bytes, Exception]]
+    """Serialized inputs of each design, or the error that prevented serializing them."""
+    future: Future
+    """Future of the results of the designs that were sent."""
+
+    def results(self) -> Iterator[BatchRunResult]:
+        try:
+            sent_results: List[Union[bytes, Exception]] = self.future.result()
+        except Exception as error:
+            # The whole chunk failed, for example because a worker process died.
+            sent_results = [error] * len(self.payloads)
+        outcomes = iter(sent_results)
+        for index, payload in enumerate(self.payloads, self.start):
+            outcome = payload if isinstance(payload, Exception) else next(outcomes)
+            if isinstance(outcome, Exception):
+                yield BatchRunResult(index, exception=outcome)
+                continue
+            try:
+                yield BatchRunResult(index, loads_states(outcome))
+            except ValueError as error:
+                yield BatchRunResult(index, exception=error)
+
+
+class ProcessPoolWorkflowExecutor:
+    """
+    Provides an executor that runs a workflow in a pool of worker processes.
+
+    Each worker has its own workflow instance. Before each design, the datapins that earlier
+    designs set but this one does not are restored to their initial states, so the outputs of a
+    design do not depend on which worker runs it. Components whose inputs did not change may
+    still reuse their outputs from an earlier run, as in any workflow instance.
+
+    The executor is a context manager that shuts it down on exit.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], IFileBasedWorkflowEngine],
+        file_name: Union[PathLike, str],
+        max_workers: Optional[int] = None,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        engine_factory : Callable[[], IFileBasedWorkflowEngine]
+            Function that each worker calls to create its engine, such as an engine class. It
+            must be picklable, which means that it must be defined at module level.
+        file_name : Union[PathLike, str]
+            Path to the workflow file that each worker loads.
+        max_workers : Optional[int], default: None
+            Number of worker processes. If ``None``, the number of processors is used.
+        mp_context : Optional[multiprocessing.context.BaseContext], default: None
+            Multiprocessing context to start workers with. If ``None``, the default context is
+            used.
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            self._max_workers,
+            mp_context,
+            initializer=_initialize_worker,
+            initargs=(engine_factory, os.fspath(file_name)),
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Number of worker processes."""
+        return self._max_workers
+
+    def submit(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+    ) -> Future:
+        """
+        Run the workflow in a worker process.
+
+        The arguments are those of the ``IWorkflowInstance.run`` method.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the collected outputs, as a ``Mapping[str, VariableState]`` object.
+
+        Raises
+        ------
+        ValueError
+            If an input has a type that cannot be serialized.
+        """
+        future = self._executor.submit(
+            _run, dumps_states(inputs), reset, set(validation_names), set(collect_names)
+        )
+        return _decode(future)
+
+    def run_batch(
+        self,
+        inputs: Iterable[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        chunk_size: int = 1,
+    ) -> Iterator[BatchRunResult]:
+        """
+        Run the workflow once for each design, spread over the worker processes.
+
+        Designs are sent to the workers in chunks, and only a few chunks per worker are in
+        progress at any time, so the inputs may be a lazily generated sequence of any length.
+
+        Parameters
+        ----------
+        inputs : Iterable[Mapping[str, VariableState]]
+            Input states of each design.
+        reset : bool, default: False
+            Whether to reset the workflow before running each design.
+        validation_names : AbstractSet[str], default: set()
+            Names of the elements and datapins to validate in each run.
+        collect_names : AbstractSet[str], default: set()
+            Names of the elements and datapins to collect the outputs of.
+        ordered : bool, default: True
+            Whether to yield the results in the order of the designs. If ``False``, each chunk's
+            results are yielded as soon as it has finished.
+        chunk_size : int, default: 1
+            Number of designs to send to a worker at once. Larger chunks reduce the overhead of
+            runs that take less than a few milliseconds.
+
+        Returns
+        -------
+        Iterator[BatchRunResult]
+            Result of each design. An exception raised by one design does not stop the batch.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+        designs = iter(inputs)
+        names = (set(validation_names), set(collect_names))
+        pending: Deque[_Chunk] = deque()
+        index = 0
+        while True:
+            while len(pending) < 2 * self._max_workers:
+                designs_in_chunk = list(islice(designs, chunk_size))
+                if not designs_in_chunk:
+                    break
+                pending.append(self._submit_chunk(index, designs_in_chunk, reset, *names))
+                index += len(designs_in_chunk)
+            if not pending:
+                return
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished = wait([chunk.future for chunk in pending], return_when=FIRST_COMPLETED)
+                done = [chunk for chunk in pending if chunk.future in finished.done]
+                for chunk in done:
+                    pending.remove(chunk)
+            for chunk in done:
+                yield from chunk.results()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Stop the worker processes.
+
+        Parameters
+        ----------
+        wait : bool, default: True
+            Whether to wait for the submitted runs to finish.
+        cancel_futures : bool, default: False
+            Whether to cancel the submitted runs that have not started.
+        """
+        self._executor.shutdown(wait, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> ProcessPoolWorkflowExecutor:
+        """Enter a context in which the workers are running."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Shut down the executor, waiting for submitted runs to finish."""
+        self.shutdown()
+
+    def _submit_chunk(
+        self,
+        start: int,
+        designs: List[Mapping[str, VariableState]],
+        reset: bool,
+        validation_names: Set[str],
+        collect_names: Set[str],
+    ) -> _Chunk:
+        payloads: List[Union[bytes, Exception]] = []
+        for design in designs:
+            try:
+                payloads.append(dumps_states(design))
+            except ValueError as error:
+                # Designs that cannot be serialized fail without being sent.
+                payloads.append(error)
+        sendable = [payload for payload in payloads if isinstance(payload, bytes)]
+        future = self._executor.submit(_run_chunk, sendable, reset, validation_names, collect_names)
+        return _Chunk(start, payloads, future)
@@ -0,0 +1,328 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Persistent result store.
+
+This module contains a content-addressed store of run outputs on disk that any number of
+processes on one machine can share without a server. Outputs are stored under keys such as
+those computed by the ``memoize.run_key`` function, so a design that one process has already
+run does not need to be run again by another.
+
+The store is a single append-only file of records. Each record holds a key, the outputs
+serialized by the ``serialization`` module, and a checksum. Readers follow the end of the file
+without locking. Writers append while holding an exclusive lock on a companion ``.lock`` file.
+When the file grows past its size cap, the writer that notices it compacts the file: the newest
+records that fit in half of the cap are copied to a new file, which atomically replaces the old
+one. Other processes notice the replacement and reopen the file.
+
+Locking relies on ``fcntl`` on POSIX systems and ``msvcrt`` on Windows. On Windows, compaction
+fails while other processes have the file open.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+import zlib
+
+from ansys.tools.variableinterop import VariableState
+
+from .serialization import dumps_states, loads_states
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+_FILE_HEADER = b"EWRSTORE\x01\x00\x00\x00"
+_RECORD_MAGIC = b"EWR1"
+_RECORD_HEADER = struct.Struct("<4s16sII")
+"""Record magic, key digest, payload length, and CRC-32 of the payload."""
+
+
+def _pread(fd: int, length: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+    os.lseek(fd, offset, os.SEEK_SET)  # pragma: no cover
+    return os.read(fd, length)  # pragma: no cover
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+class _FileLock:
+    """Provides an exclusive lock on a file that is shared by all processes."""
+
+    def __init__(self, path: Path):
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+
+    def __enter__(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+
+    def __exit__(self, *exc_info: object) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class ResultStore:
+    """
+    Stores run outputs in a file that several processes can share.
+
+    Each process keeps an index of the records in memory and reads a record only when its
+    outputs are requested. The object is thread-safe.
+    """
+
+    def __init__(self, path: Union[os.PathLike, str], max_bytes: int = 1 << 30):
+        """
+        Open or create a store.
+
+        Parameters
+        ----------
+        path : Union[os.PathLike, str]
+            Path of the store file. A file with the same name plus ``.lock`` is created next to
+            it.
+        max_bytes : int, default: 1 GiB
+            Size that the store file may reach before it is compacted.
+
+        Raises
+        ------
+        ValueError
+            If the file exists but is not a result store, or if the size cap is smaller than
+            the file header.
+        """
+        if max_bytes <= len(_FILE_HEADER):
+            raise ValueError("The size cap is too small.")
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._file_lock = _FileLock(self._path.with_name(self._path.name + ".lock"))
+        self._fd = -1
+        self._index: Dict[bytes, Tuple[int, int]] = {}
+        self._scanned = 0
+        with self._file_lock:
+            if not self._path.exists():
+                self._write_new_file(self._path, [])
+        self._open()
+
+    @property
+    def path(self) -> Path:
+        """Path of the store file."""
+        return self._path
+
+    @property
+    def max_bytes(self) -> int:
+        """Size that the store file may reach before it is compacted."""
+        return self._max_bytes
+
+    def __len__(self) -> int:
+        """Get the number of records that this process has seen so far."""
+        with self._lock:
+            return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        """Get whether the store holds outputs under the given key."""
+        with self._lock:
+            return self._find(_digest(key)) is not None
+
+    def get(self, key: str) -> Optional[Dict[str, VariableState]]:
+        """
+        Get the outputs stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the outputs.
+
+        Returns
+        -------
+        Optional[Dict[str, VariableState]]
+            Stored outputs, or ``None`` if there are none.
+        """
+        with self._lock:
+            location = self._find(_digest(key))
+            if location is None:
+                return None
+            offset, length = location
+            payload = _pread(self._fd, length, offset)
+        return loads_states(payload)
+
+    def put(self, key: str, outputs: Mapping[str, VariableState]) -> None:
+        """
+        Store outputs under a key, unless outputs are already stored under it.
+
+        Parameters
+        ----------
+        key : str
+            Key of the outputs.
+        outputs : Mapping[str, VariableState]
+            Outputs to store.
+
+        Raises
+        ------
+        ValueError
+            If one of the values cannot be serialized, or if the record is larger than the size
+            cap.
+        """
+        digest = _digest(key)
+        payload = dumps_states(outputs)
+        record = _RECORD_HEADER.pack(_RECORD_MAGIC, digest, len(payload), zlib.crc32(payload))
+        record += payload
+        if len(_FILE_HEADER) + len(record) > self._max_bytes:
+            raise ValueError("The outputs are too large for the store.")
+        with self._lock, self._file_lock:
+            self._follow_replacement()
+            self._scan(truncate_torn_tail=True)
+            if digest in self._index:
+                return
+            end = os.fstat(self._fd).st_size
+            if end + len(record) > self._max_bytes:
+                self._compact_locked(self._max_bytes // 2 - len(record))
+                end = os.fstat(self._fd).st_size
+            os.write(self._fd, record)
+            self._index[digest] = (end + _RECORD_HEADER.size, len(payload))
+            self._scanned = end + len(record)
+
+    def compact(self, target_bytes: Optional[int] = None) -> None:
+        """
+        Rewrite the store file, keeping only the newest records that fit in the given size.
+
+        Parameters
+        ----------
+        target_bytes : Optional[int]
+            Maximum size of the compacted file. If ``None``, half of the size cap is used.
+        """
+        with self._lock, self._file_lock:
+            self._follow_replacement()
+            self._scan(truncate_torn_tail=True)
+            self._compact_locked(self._max_bytes // 2 if target_bytes is None else target_bytes)
+
+    def close(self) -> None:
+        """Close the store file."""
+        with self._lock:
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+                self._file_lock.close()
+
+    def __enter__(self) -> ResultStore:
+        """Enter the context, returning the store."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the store."""
+        self.close()
+
+    def _open(self) -> None:
+        fd = os.open(self._path, os.O_RDWR | os.O_APPEND | getattr(os, "O_BINARY", 0))
+        if _pread(fd, len(_FILE_HEADER), 0) != _FILE_HEADER:
+            os.close(fd)
+            raise ValueError(f"The file {str(self._path)!r} is not a result store.")
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = fd
+        self._index = {}
+        self._scanned = len(_FILE_HEADER)
+
+    def _follow_replacement(self) -> None:
+        """Reopen the file if another process has compacted it."""
+        try:
+            replaced = os.stat(self._path).st_ino != os.fstat(self._fd).st_ino
+        except FileNotFoundError:
+            replaced = False
+        if replaced:
+            self._open()
+
+    def _find(self, digest: bytes) -> Optional[Tuple[int, int]]:
+        location = self._index.get(digest)
+        if location is None:
+            self._follow_replacement()
+            self._scan(truncate_torn_tail=False)
+            location = self._index.get(digest)
+        return location
+
+    def _scan(self, truncate_torn_tail: bool) -> None:
+        """
+        Index the records that were appended since the last scan.
+
+        Scanning stops at the first incomplete or damaged record. Without the file lock, such a
+        record may still be being written. With the file lock, it was left behind by a writer
+        that failed, so it is truncated if ``truncate_torn_tail`` is set.
+        """
+        end = os.fstat(self._fd).st_size
+        offset = self._scanned
+        while offset < end:
+            header = _pread(self._fd, _RECORD_HEADER.size, offset)
+            if len(header) < _RECORD_HEADER.size:
+                break
+            magic, digest, length, checksum = _RECORD_HEADER.unpack(header)
+            payload_offset = offset + _RECORD_HEADER.size
+            if magic != _RECORD_MAGIC or payload_offset + length > end:
+                break
+            if zlib.crc32(_pread(self._fd, length, payload_offset)) != checksum:
+                break
+            self._index[digest] = (payload_offset, length)
+            offset = payload_offset + length
+        self._scanned = offset
+        if truncate_torn_tail and offset < end:
+            os.ftruncate(self._fd, offset)
+
+    def _compact_locked(self, target_bytes: int) -> None:
+        records: List[bytes] = []
+        size = len(_FILE_HEADER)
+        by_offset = sorted(self._index.items(), key=lambda item: item[1][0], reverse=True)
+        for digest, (offset, length) in by_offset:
+            record_size = _RECORD_HEADER.size + length
+            if size + record_size > target_bytes:
+                break
+            records.append(_pread(self._fd, record_size, offset - _RECORD_HEADER.size))
+            size += record_size
+        records.reverse()
+        temporary = self._path.with_name(self._path.name + f".{os.getpid()}.tmp")
+        self._write_new_file(temporary, records)
+        os.replace(temporary, self._path)
+        self._open()
+        self._scan(truncate_torn_tail=False)
+
+    @staticmethod
+    def _write_new_file(path: Path, records: List[bytes]) -> None:
+        with open(path, "wb") as file:
+            file.write(_FILE_HEADER)
+            for record in records:
+                file.write(record)
+            file.flush()
+            os.fsync(file.fileno())
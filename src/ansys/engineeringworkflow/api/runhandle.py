@@ -0,0 +1,523 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Run handle implementations.
+
+This module contains ready-made implementations of the ``IRunHandle`` and ``IAsyncRunHandle``
+interfaces that engines can return from their ``start_run`` methods:
+
+- Engines that are notified when a run finishes complete a ``RunHandle`` or ``AsyncRunHandle``
+  object, which wakes waiters directly.
+- Engines that can only report the state of the workflow instance return a
+  ``PollingRunHandle`` or ``AsyncPollingRunHandle`` object, which polls the state with an
+  exponentially growing delay between calls.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+import time
+from typing import AbstractSet, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional
+
+from ansys.tools.variableinterop import VariableState
+import anyio
+import anyio.from_thread
+import anyio.lowlevel
+import anyio.to_thread
+
+from .datatypes import WorkflowInstanceState
+from .elementindex import async_get_children, get_children
+from .exceptions import RunCancelledError, RunFailedError
+from .iasyncworkflow import (
+    IAsyncDatapin,
+    IAsyncElement,
+    IAsyncRunHandle,
+    IAsyncWorkflowInstance,
+)
+from .iworkflow import (
+    IDatapin,
+    IElement,
+    IRunHandle,
+    IWorkflowInstance,
+)
+
+_UNFINISHED_STATES = (WorkflowInstanceState.RUNNING, WorkflowInstanceState.PAUSED)
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Defines the delays between successive polls of a workflow instance's state."""
+
+    initial_delay: float = 0.001
+    """Delay before the second poll, in seconds."""
+    factor: float = 2.0
+    """Factor by which the delay grows after each poll."""
+    max_delay: float = 0.5
+    """Upper limit of the delay, in seconds."""
+
+    def delays(self) -> Iterator[float]:
+        """Generate the successive delays, in seconds."""
+        delay = self.initial_delay
+        while True:
+            yield delay
+            delay = min(delay * self.factor, self.max_delay)
+
+
+def collect_states(
+    instance: IWorkflowInstance, collect_names: AbstractSet[str]
+) -> Dict[str, VariableState]:
+    """
+    Get the states of the named datapins and of all datapins below the named elements.
+
+    Parameters
+    ----------
+    instance : IWorkflowInstance
+        Workflow instance to get the states from.
+    collect_names : AbstractSet[str]
+        Names of datapins or elements, as for the ``collect_names`` parameter of ``run``.
+
+    Returns
+    -------
+    Dict[str, VariableState]
+        Map of full datapin names to datapin states.
+    """
+    states: Dict[str, VariableState] = {}
+    pending: List[IElement] = [instance.get_element_by_name(name) for name in collect_names]
+    while pending:
+        element = pending.pop()
+        if isinstance(element, IDatapin):
+            states[element.full_name] = element.get_state()
+            continue
+        pending.extend(get_children(element))
+    return states
+
+
+async def async_collect_states(
+    instance: IAsyncWorkflowInstance, collect_names: AbstractSet[str]
+) -> Dict[str, VariableState]:
+    """
+    Get the states of the named datapins and of all datapins below the named elements.
+
+    Parameters
+    ----------
+    instance : IAsyncWorkflowInstance
+        Workflow instance to get the states from.
+    collect_names : AbstractSet[str]
+        Names of datapins or elements, as for the ``collect_names`` parameter of ``run``.
+
+    Returns
+    -------
+    Dict[str, VariableState]
+        Map of full datapin names to datapin states.
+    """
+    states: Dict[str, VariableState] = {}
+    pending: List[IAsyncElement] = [
+        await instance.get_element_by_name(name) for name in collect_names
+    ]
+    while pending:
+        element = pending.pop()
+        if isinstance(element, IAsyncDatapin):
+            states[element.full_name] = await element.get_state()
+            continue
+        pending.extend(await async_get_children(element))
+    return states
+
+
+class RunHandle(IRunHandle):
+    """
+    Provides a run handle that the engine completes when the run finishes.
+
+    The engine calls the ``set_result`` or ``set_exception`` method, possibly from another
+    thread, which immediately wakes all waiters.
+    """
+
+    def __init__(self, cancel: Optional[Callable[[], None]] = None) -> None:
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        cancel : Optional[Callable[[], None]], default: None
+            Function that the ``cancel`` method calls to ask the engine to stop the run. If
+            ``None``, the run cannot be cancelled.
+        """
+        self._cancel = cancel
+        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        self._outputs: Mapping[str, VariableState] = {}
+        self._exception: Optional[BaseException] = None
+        self._callbacks: List[Callable[[RunHandle], None]] = []
+
+    def set_result(self, outputs: Mapping[str, VariableState]) -> None:
+        """
+        Complete the run successfully.
+
+        Parameters
+        ----------
+        outputs : Mapping[str, VariableState]
+            Collected outputs of the run.
+        """
+        self._outputs = outputs
+        self._finish()
+
+    def set_exception(self, exception: BaseException) -> None:
+        """
+        Complete the run with an error.
+
+        Parameters
+        ----------
+        exception : BaseException
+            Error to raise from the ``result`` method.
+        """
+        self._exception = exception
+        self._finish()
+
+    def _finish(self) -> None:
+        with self._lock:
+            if self._finished.is_set():
+                raise RuntimeError("The run has already finished.")
+            self._finished.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback: Callable[[RunHandle], None]) -> None:
+        """
+        Add a function to call with this handle when the run finishes.
+
+        If the run has already finished, the function is called immediately. Otherwise, it is
+        called on the thread that completes the run.
+
+        Parameters
+        ----------
+        callback : Callable[[RunHandle], None]
+            Function to call.
+        """
+        with self._lock:
+            if not self._finished.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def done(self) -> bool:
+        """Get whether the run has finished, either successfully or not."""
+        return self._finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the run to finish."""
+        return self._finished.wait(timeout)
+
+    def result(self, timeout: Optional[float] = None) -> Mapping[str, VariableState]:
+        """Wait for the run to finish and get its outputs."""
+        if not self._finished.wait(timeout):
+            raise TimeoutError("The run did not finish before the timeout expired.")
+        if self._exception is not None:
+            raise self._exception
+        return self._outputs
+
+    def cancel(self) -> None:
+        """
+        Ask the run to stop by calling the function given to the constructor.
+
+        Raises
+        ------
+        NotImplementedError
+            If no function was given to the constructor, so that the run cannot be cancelled.
+        """
+        if self._cancel is None:
+            raise NotImplementedError("This run cannot be cancelled.")
+        if not self._finished.is_set():
+            self._cancel()
+
+
+class PollingRunHandle(IRunHandle):
+    """
+    Provides a run handle that polls the state of the workflow instance.
+
+    The run is considered finished once the instance leaves the ``RUNNING`` and ``PAUSED``
+    states. The outputs are then collected from the instance's datapins.
+    """
+
+    def __init__(
+        self,
+        instance: IWorkflowInstance,
+        collect_names: AbstractSet[str] = set(),
+        backoff: Backoff = Backoff(),
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : IWorkflowInstance
+            Workflow instance that is running.
+        collect_names : AbstractSet[str]
+            Names of the datapins or elements whose states the ``result`` method returns.
+        backoff : Backoff
+            Delays between successive polls.
+        """
+        self._instance = instance
+        self._collect_names = collect_names
+        self._backoff = backoff
+        self._lock = threading.Lock()
+        self._final_state: Optional[WorkflowInstanceState] = None
+        self._outputs: Optional[Mapping[str, VariableState]] = None
+
+    def _poll(self) -> bool:
+        if self._final_state is None:
+            state = self._instance.get_state()
+            if state not in _UNFINISHED_STATES:
+                self._final_state = state
+        return self._final_state is not None
+
+    def done(self) -> bool:
+        """Get whether the run has finished, which polls the instance once."""
+        return self._poll()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the run to finish, polling with an exponentially growing delay."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for delay in self._backoff.delays():
+            if self._poll():
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+        return False  # pragma: no cover
+
+    def result(self, timeout: Optional[float] = None) -> Mapping[str, VariableState]:
+        """Wait for the run to finish and collect its outputs."""
+        if not self.wait(timeout):
+            raise TimeoutError("The run did not finish before the timeout expired.")
+        if self._final_state == WorkflowInstanceState.FAILED:
+            raise RunFailedError("The workflow run failed.")
+        if self._final_state == WorkflowInstanceState.CANCELLED:
+            raise RunCancelledError("The workflow run was cancelled.")
+        with self._lock:
+            if self._outputs is None:
+                self._outputs = collect_states(self._instance, self._collect_names)
+            return self._outputs
+
+    def cancel(self) -> None:
+        """Ask the run to stop with the ``cancel`` method of the instance."""
+        if not self._poll():
+            self._instance.cancel()
+
+
+class AsyncRunHandle(IAsyncRunHandle):
+    """
+    Provides an asynchronous run handle that the engine completes when the run finishes.
+
+    The handle must be created in the event loop that waits on it. The ``set_result`` and
+    ``set_exception`` methods must be called from that event loop. To complete the handle from a
+    synchronous ``RunHandle`` running on another thread, use the ``from_run_handle`` method.
+    """
+
+    def __init__(self, cancel: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        cancel : Optional[Callable[[], Awaitable[None]]], default: None
+            Asynchronous function that the ``cancel`` method calls to ask the engine to stop the
+            run. If ``None``, the run cannot be cancelled.
+        """
+        self._cancel = cancel
+        self._finished = anyio.Event()
+        self._outputs: Mapping[str, VariableState] = {}
+        self._exception: Optional[BaseException] = None
+
+    @classmethod
+    def from_run_handle(cls, handle: RunHandle) -> AsyncRunHandle:
+        """
+        Create a handle that is completed on the current event loop when a ``RunHandle`` is.
+
+        This method must be called from the event loop.
+
+        Parameters
+        ----------
+        handle : RunHandle
+            Synchronous handle to follow.
+        """
+
+        async def cancel() -> None:
+            await anyio.to_thread.run_sync(handle.cancel)
+
+        async_handle = cls(cancel if handle._cancel is not None else None)
+        token = anyio.lowlevel.current_token()
+        loop_thread = threading.get_ident()
+
+        def forward(finished: RunHandle) -> None:
+            if threading.get_ident() == loop_thread:
+                async_handle._copy(finished)
+                return
+            try:
+                anyio.from_thread.run_sync(async_handle._copy, finished, token=token)
+            except RuntimeError:
+                # The event loop has closed, so nobody can be waiting any more.
+                pass
+
+        handle.add_done_callback(forward)
+        return async_handle
+
+    def _copy(self, handle: RunHandle) -> None:
+        if handle._exception is not None:
+            self.set_exception(handle._exception)
+        else:
+            self.set_result(handle._outputs)
+
+    def set_result(self, outputs: Mapping[str, VariableState]) -> None:
+        """
+        Complete the run successfully.
+
+        Parameters
+        ----------
+        outputs : Mapping[str, VariableState]
+            Collected outputs of the run.
+        """
+        if self._finished.is_set():
+            raise RuntimeError("The run has already finished.")
+        self._outputs = outputs
+        self._finished.set()
+
+    def set_exception(self, exception: BaseException) -> None:
+        """
+        Complete the run with an error.
+
+        Parameters
+        ----------
+        exception : BaseException
+            Error to raise from the ``result`` method.
+        """
+        if self._finished.is_set():
+            raise RuntimeError("The run has already finished.")
+        self._exception = exception
+        self._finished.set()
+
+    def done(self) -> bool:
+        """Get whether the run has finished, either successfully or not."""
+        return self._finished.is_set()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the run to finish."""
+        with anyio.move_on_after(timeout):
+            await self._finished.wait()
+        return self._finished.is_set()
+
+    async def result(self, timeout: Optional[float] = None) -> Mapping[str, VariableState]:
+        """Wait for the run to finish and get its outputs."""
+        if not await self.wait(timeout):
+            raise TimeoutError("The run did not finish before the timeout expired.")
+        if self._exception is not None:
+            raise self._exception
+        return self._outputs
+
+    async def cancel(self) -> None:
+        """
+        Ask the run to stop by calling the function given to the constructor.
+
+        Raises
+        ------
+        NotImplementedError
+            If no function was given to the constructor, so that the run cannot be cancelled.
+        """
+        if self._cancel is None:
+            raise NotImplementedError("This run cannot be cancelled.")
+        if not self._finished.is_set():
+            await self._cancel()
+
+
+class AsyncPollingRunHandle(IAsyncRunHandle):
+    """
+    Provides an asynchronous run handle that polls the state of the workflow instance.
+
+    The run is considered finished once the instance leaves the ``RUNNING`` and ``PAUSED``
+    states. The outputs are then collected from the instance's datapins.
+    """
+
+    def __init__(
+        self,
+        instance: IAsyncWorkflowInstance,
+        collect_names: AbstractSet[str] = set(),
+        backoff: Backoff = Backoff(),
+    ):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : IAsyncWorkflowInstance
+            Workflow instance that is running.
+        collect_names : AbstractSet[str]
+            Names of the datapins or elements whose states the ``result`` method returns.
+        backoff : Backoff
+            Delays between successive polls.
+        """
+        self._instance = instance
+        self._collect_names = collect_names
+        self._backoff = backoff
+        self._lock = anyio.Lock()
+        self._final_state: Optional[WorkflowInstanceState] = None
+        self._outputs: Optional[Mapping[str, VariableState]] = None
+
+    async def _poll(self) -> bool:
+        if self._final_state is None:
+            state = await self._instance.get_state()
+            if state not in _UNFINISHED_STATES:
+                self._final_state = state
+        return self._final_state is not None
+
+    def done(self) -> bool:
+        """Get whether a previous call to ``wait`` or ``result`` has seen the run finish."""
+        return self._final_state is not None
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the run to finish, polling with an exponentially growing delay."""
+        with anyio.move_on_after(timeout):
+            for delay in self._backoff.delays():
+                if await self._poll():
+                    break
+                await anyio.sleep(delay)
+        return self._final_state is not None
+
+    async def result(self, timeout: Optional[float] = None) -> Mapping[str, VariableState]:
+        """Wait for the run to finish and collect its outputs."""
+        if not await self.wait(timeout):
+            raise TimeoutError("The run did not finish before the timeout expired.")
+        if self._final_state == WorkflowInstanceState.FAILED:
+            raise RunFailedError("The workflow run failed.")
+        if self._final_state == WorkflowInstanceState.CANCELLED:
+            raise RunCancelledError("The workflow run was cancelled.")
+        async with self._lock:
+            if self._outputs is None:
+                self._outputs = await async_collect_states(self._instance, self._collect_names)
+            return self._outputs
+
+    async def cancel(self) -> None:
+        """Ask the run to stop with the ``cancel`` method of the instance."""
+        if not await self._poll():
+            await self._instance.cancel()
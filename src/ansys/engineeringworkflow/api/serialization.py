@@ -0,0 +1,144 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Compact serialization of datapin states.
+
+This module converts maps of datapin names to ``VariableState`` objects, such as the inputs and
+outputs of runs, to bytes and back, so that they can be stored on disk or sent to other
+processes. The format is UTF-8 encoded JSON. Scalar values are stored as JSON values, and
+numeric arrays are stored as their raw little-endian bytes, which round-trip exactly. Values of
+file types are not supported.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, Dict, List, Mapping
+
+from ansys.tools.variableinterop import (
+    BooleanArrayValue,
+    BooleanValue,
+    IntegerArrayValue,
+    IntegerValue,
+    IVariableValue,
+    RealArrayValue,
+    RealValue,
+    StringValue,
+    VariableState,
+    VariableType,
+    from_api_string,
+)
+import numpy as np
+
+_SCALAR_TYPES = {
+    VariableType.REAL: (RealValue, float),
+    VariableType.INTEGER: (IntegerValue, int),
+    VariableType.BOOLEAN: (BooleanValue, bool),
+    VariableType.STRING: (StringValue, str),
+}
+
+_NUMERIC_ARRAY_TYPES = {
+    VariableType.REAL_ARRAY: (RealArrayValue, np.dtype("<f8")),
+    VariableType.INTEGER_ARRAY: (IntegerArrayValue, np.dtype("<i8")),
+    VariableType.BOOLEAN_ARRAY: (BooleanArrayValue, np.dtype("?")),
+}
+
+
+def _encode(value: IVariableValue) -> Any:
+    value_type = value.variable_type
+    if value_type in _SCALAR_TYPES:
+        return _SCALAR_TYPES[value_type][1](value)
+    if value_type in _NUMERIC_ARRAY_TYPES:
+        array = np.ascontiguousarray(value, dtype=_NUMERIC_ARRAY_TYPES[value_type][1])
+        return [list(array.shape), base64.b64encode(array.tobytes()).decode("ascii")]
+    if value_type == VariableType.STRING_ARRAY:
+        return value.to_api_string()
+    raise ValueError(f"Values of type {value_type} cannot be serialized.")
+
+
+def _decode(value_type: VariableType, encoded: Any) -> IVariableValue:
+    if value_type in _SCALAR_TYPES:
+        return _SCALAR_TYPES[value_type][0](encoded)
+    if value_type in _NUMERIC_ARRAY_TYPES:
+        value_class, dtype = _NUMERIC_ARRAY_TYPES[value_type]
+        shape, data = encoded
+        array = np.frombuffer(base64.b64decode(data), dtype=dtype).reshape(shape)
+        return value_class(values=array)
+    if value_type == VariableType.STRING_ARRAY:
+        return from_api_string(value_type, encoded)
+    raise ValueError(f"Values of type {value_type} cannot be deserialized.")
+
+
+def dumps_states(states: Mapping[str, VariableState]) -> bytes:
+    """
+    Serialize a map of datapin names to states.
+
+    Parameters
+    ----------
+    states : Mapping[str, VariableState]
+        Map to serialize.
+
+    Returns
+    -------
+    bytes
+        Serialized map.
+
+    Raises
+    ------
+    ValueError
+        If one of the values is of a file type.
+    """
+    entries: List[Any] = [
+        [name, state.value.variable_type.name, state.is_valid, _encode(state.value)]
+        for name, state in states.items()
+    ]
+    return json.dumps(entries, separators=(",", ":")).encode()
+
+
+def loads_states(data: bytes) -> Dict[str, VariableState]:
+    """
+    Deserialize a map of datapin names to states.
+
+    Parameters
+    ----------
+    data : bytes
+        Data created by the ``dumps_states`` function.
+
+    Returns
+    -------
+    Dict[str, VariableState]
+        Deserialized map.
+
+    Raises
+    ------
+    ValueError
+        If the data is not valid.
+    """
+    try:
+        entries = json.loads(data)
+        return {
+            name: VariableState(_decode(VariableType[type_name], encoded), is_valid)
+            for name, type_name, is_valid, encoded in entries
+        }
+    except (KeyError, TypeError) as error:
+        raise ValueError("The data is not a serialized map of datapin states.") from error
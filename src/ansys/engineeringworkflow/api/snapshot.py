@@ -0,0 +1,191 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Tree snapshot builders.
+
+This module contains the default implementations of the ``get_tree_snapshot`` methods of the
+workflow instance interfaces, which build a ``TreeSnapshot`` object by walking the element tree
+from the root element. Engines that can describe their whole tree in one request should
+override those methods instead.
+"""
+
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
+
+from .datatypes import ElementKind, ElementSnapshot, TreeSnapshot
+from .elementindex import async_get_children, get_children
+from .iasyncworkflow import (
+    IAsyncComponent,
+    IAsyncControlStatement,
+    IAsyncDatapin,
+    IAsyncElement,
+    IAsyncWorkflowInstance,
+)
+from .iworkflow import (
+    IComponent,
+    IControlStatement,
+    IDatapin,
+    IElement,
+    IWorkflowInstance,
+)
+
+
+class _SnapshotBuilder:
+    """Collects element descriptions in depth-first order and filters them by name."""
+
+    def __init__(self, max_depth: Optional[int], name_filter: Optional[str]):
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("The maximum depth must not be negative.")
+        self.max_depth = max_depth
+        self._name_filter = name_filter
+        self._descriptions: List[Tuple[int, int, Dict[str, Any]]] = []
+
+    def add(self, parent_index: int, depth: int, description: Dict[str, Any]) -> int:
+        self._descriptions.append((parent_index, depth, description))
+        return len(self._descriptions) - 1
+
+    def expands(self, depth: int) -> bool:
+        return self.max_depth is None or depth < self.max_depth
+
+    def finish(self) -> TreeSnapshot:
+        kept = [self._name_filter is None] * len(self._descriptions)
+        if self._name_filter is not None:
+            # Keep the ancestors of matching elements so that the hierarchy stays connected.
+            for index, (_, _, description) in enumerate(self._descriptions):
+                if fnmatchcase(description["full_name"], self._name_filter):
+                    while index >= 0 and not kept[index]:
+                        kept[index] = True
+                        index = self._descriptions[index][0]
+        new_indices: Dict[int, int] = {-1: -1}
+        elements = []
+        for index, (parent_index, depth, description) in enumerate(self._descriptions):
+            if kept[index]:
+                new_indices[index] = len(elements)
+                elements.append(
+                    ElementSnapshot(
+                        index=len(elements),
+                        parent_index=new_indices[parent_index],
+                        depth=depth,
+                        **description,
+                    )
+                )
+        return TreeSnapshot(tuple(elements))
+
+
+def _describe(element: IElement) -> Dict[str, Any]:
+    description: Dict[str, Any] = {
+        "element_id": element.element_id,
+        "full_name": element.full_name,
+        "properties": MappingProxyType(dict(element.get_properties())),
+    }
+    if isinstance(element, IControlStatement):
+        description.update(kind=ElementKind.CONTROL_STATEMENT, control_type=element.control_type)
+    elif isinstance(element, IComponent):
+        description.update(kind=ElementKind.COMPONENT, pacz_url=element.pacz_url)
+    elif isinstance(element, IDatapin):
+        description.update(
+            kind=ElementKind.DATAPIN,
+            value_type=element.value_type,
+            metadata=element.get_metadata(),
+            is_input_to_component=element.is_input_to_component,
+            is_input_to_workflow=element.is_input_to_workflow,
+        )
+    return description
+
+
+async def _async_describe(element: IAsyncElement) -> Dict[str, Any]:
+    description: Dict[str, Any] = {
+        "element_id": element.element_id,
+        "full_name": element.full_name,
+        "properties": MappingProxyType(dict(await element.get_properties())),
+    }
+    if isinstance(element, IAsyncControlStatement):
+        description.update(kind=ElementKind.CONTROL_STATEMENT, control_type=element.control_type)
+    elif isinstance(element, IAsyncComponent):
+        description.update(kind=ElementKind.COMPONENT, pacz_url=element.pacz_url)
+    elif isinstance(element, IAsyncDatapin):
+        description.update(
+            kind=ElementKind.DATAPIN,
+            value_type=element.value_type,
+            metadata=await element.get_metadata(),
+            is_input_to_component=element.is_input_to_component,
+            is_input_to_workflow=element.is_input_to_workflow,
+        )
+    return description
+
+
+def take_snapshot(
+    instance: IWorkflowInstance, max_depth: Optional[int] = None, name_filter: Optional[str] = None
+) -> TreeSnapshot:
+    """
+    Build a snapshot of the element tree of a workflow instance by walking it.
+
+    Parameters
+    ----------
+    instance : IWorkflowInstance
+        Workflow instance to describe.
+    max_depth : Optional[int]
+        Maximum depth of the elements to include, where the root element has a depth of ``0``.
+        Elements below this depth are not visited. If ``None``, all elements are included.
+    name_filter : Optional[str]
+        Shell-style wildcard pattern, such as ``'Root.Solver.*'``, that the full names of the
+        elements to include must match. The ancestors of matching elements are always included.
+        If ``None``, all elements are included.
+
+    Raises
+    ------
+    ValueError
+        If the maximum depth is negative.
+    """
+    builder = _SnapshotBuilder(max_depth, name_filter)
+    pending: List[Tuple[IElement, int, int]] = [(instance.get_root(), -1, 0)]
+    while pending:
+        element, parent_index, depth = pending.pop()
+        index = builder.add(parent_index, depth, _describe(element))
+        if builder.expands(depth):
+            children = get_children(element)
+            pending.extend((child, index, depth + 1) for child in reversed(children))
+    return builder.finish()
+
+
+async def async_take_snapshot(
+    instance: IAsyncWorkflowInstance,
+    max_depth: Optional[int] = None,
+    name_filter: Optional[str] = None,
+) -> TreeSnapshot:
+    """
+    Build a snapshot of the element tree of an asynchronous workflow instance by walking it.
+
+    See the ``take_snapshot`` function for a description of the parameters.
+    """
+    builder = _SnapshotBuilder(max_depth, name_filter)
+    pending: List[Tuple[IAsyncElement, int, int]] = [(await instance.get_root(), -1, 0)]
+    while pending:
+        element, parent_index, depth = pending.pop()
+        index = builder.add(parent_index, depth, await _async_describe(element))
+        if builder.expands(depth):
+            children = await async_get_children(element)
+            pending.extend((child, index, depth + 1) for child in reversed(children))
+    return builder.finish()
@@ -0,0 +1,706 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Synchronous adapters of asynchronous engines.
+
+This module exposes any ``IAsyncWorkflowEngine`` object and its workflow instances and elements
+through the synchronous interfaces, so that scripts can use engines that are only asynchronous.
+
+All calls run on one event loop, which an ``EventLoopThread`` object keeps running on a
+background thread for as long as the adapters are in use. Calls from other threads are
+submitted to it through a blocking portal, which costs much less than starting an event loop
+per call, and may be made from any number of threads at once.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+import logging
+from os import PathLike
+import threading
+from typing import (
+    AbstractSet,
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ansys.tools.variableinterop import (
+    CommonVariableMetadata,
+    IVariableValue,
+    VariableState,
+    VariableType,
+)
+import anyio
+from anyio.from_thread import BlockingPortal
+
+from .cancellation import cancel_scope, deadline_after
+from .datatypes import (
+    BatchRunResult,
+    CancelToken,
+    DatapinLink,
+    Property,
+    RunStatistics,
+    TreeSnapshot,
+    WorkflowEngineInfo,
+    WorkflowEvent,
+    WorkflowInstanceState,
+)
+from .iasyncworkflow import (
+    IAsyncComponent,
+    IAsyncControlStatement,
+    IAsyncDatapin,
+    IAsyncElement,
+    IAsyncFileBasedWorkflowEngine,
+    IAsyncRunHandle,
+    IAsyncWorkflowEngine,
+    IAsyncWorkflowInstance,
+)
+from .iworkflow import (
+    IComponent,
+    IControlStatement,
+    IDatapin,
+    IElement,
+    IFileBasedWorkflowEngine,
+    IRunHandle,
+    IWorkflowInstance,
+)
+from .linkgraph import LinkGraph
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """
+    Runs an event loop on a background thread and calls coroutine functions on it.
+
+    The loop starts on first use and runs until the ``close`` method is called. Its thread is a
+    daemon thread, so a loop that is never closed does not keep the interpreter alive.
+    """
+
+    def __init__(self, backend: str = "asyncio", backend_options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        backend : str, default: "asyncio"
+            Name of the anyio backend of the event loop.
+        backend_options : Optional[Dict[str, Any]], default: None
+            Keyword arguments of the backend's ``run`` function.
+        """
+        self._backend = backend
+        self._backend_options = backend_options
+        self._lock = threading.Lock()
+        self._portal: Optional[BlockingPortal] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def call(self, function: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        Call a coroutine function on the event loop and wait for its result.
+
+        Parameters
+        ----------
+        function : Callable[..., Awaitable[T]]
+            Coroutine function to call.
+        *args : Any
+            Positional arguments of the call.
+
+        Raises
+        ------
+        RuntimeError
+            If the event loop thread is closed, or if this method is called on the event loop
+            thread, which would wait for itself.
+        """
+        return self._get_portal().call(function, *args)
+
+    def iterate(self, iterable: AsyncIterable[T]) -> Iterator[T]:
+        """
+        Iterate over an asynchronous iterable on the event loop.
+
+        The iterable is consumed by a single task, which gets each item only when it is
+        requested, so that asynchronous generators may hold cancel scopes across their
+        ``yield`` statements. The generator is closed when the returned iterator is.
+
+        Parameters
+        ----------
+        iterable : AsyncIterable[T]
+            Iterable to iterate over.
+        """
+        portal = self._get_portal()
+        request_send, request_receive = anyio.create_memory_object_stream[None](0)
+        item_send, item_receive = anyio.create_memory_object_stream[T](0)
+
+        async def produce() -> None:
+            async with request_receive, item_send:
+                iterator = iterable.__aiter__()
+                try:
+                    async for _ in request_receive:
+                        try:
+                            item = await iterator.__anext__()
+                        except StopAsyncIteration:
+                            return
+                        await item_send.send(item)
+                finally:
+                    aclose = getattr(iterator, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
+
+        future = portal.start_task_soon(produce)
+        try:
+            while True:
+                try:
+                    portal.call(request_send.send, None)
+                    item = portal.call(item_receive.receive)
+                except (anyio.BrokenResourceError, anyio.EndOfStream):
+                    break
+                yield item
+        finally:
+            portal.call(request_send.aclose)
+            portal.call(item_receive.aclose)
+            error = future.exception()
+        if error is not None:
+            raise error
+
+    def start_task_soon(self, function: Callable[..., Awaitable[Any]], *args: Any) -> Future[Any]:
+        """
+        Start a coroutine function on the event loop without waiting for it.
+
+        Parameters
+        ----------
+        function : Callable[..., Awaitable[Any]]
+            Coroutine function to call.
+        *args : Any
+            Positional arguments of the call.
+
+        Returns
+        -------
+        Future[Any]
+            Future of the result of the call. Cancelling it cancels the task.
+        """
+        return self._get_portal().start_task_soon(function, *args)
+
+    def close(self) -> None:
+        """
+        Stop the event loop and wait for its thread to end.
+
+        Calls that are still running are cancelled. Closing a closed instance has no effect.
+        """
+        with self._lock:
+            portal, thread = self._portal, self._thread
+            self._closed = True
+            self._portal = self._thread = None
+        if portal is not None and thread is not None:
+            portal.call(portal.stop, True)
+            thread.join()
+
+    def __enter__(self) -> EventLoopThread:
+        """Enter a context that closes the event loop thread on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the event loop thread."""
+        self.close()
+
+    def _get_portal(self) -> BlockingPortal:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The event loop thread is closed.")
+            if self._portal is None:
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._serve, args=(ready,), name="EventLoopThread", daemon=True
+                )
+                thread.start()
+                ready.wait()
+                if self._portal is None:
+                    raise RuntimeError("The event loop failed to start.") from self._error
+                self._thread = thread
+            return self._portal
+
+    def _serve(self, ready: threading.Event) -> None:
+        async def serve() -> None:
+            async with BlockingPortal() as portal:
+                self._portal = portal
+                ready.set()
+                await portal.sleep_until_stopped()
+
+        try:
+            anyio.run(serve, backend=self._backend, backend_options=self._backend_options)
+        except BaseException as error:
+            self._error = error
+        finally:
+            ready.set()
+
+
+class SyncWorkflowEngine(IFileBasedWorkflowEngine):
+    """Provides a synchronous workflow engine that forwards every call to an asynchronous one."""
+
+    def __init__(self, engine: IAsyncWorkflowEngine, loop: Optional[EventLoopThread] = None):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        engine : IAsyncWorkflowEngine
+            Asynchronous engine to forward calls to.
+        loop : Optional[EventLoopThread], default: None
+            Event loop to run the calls on, which may be shared with other adapters. If
+            ``None``, the adapter starts an event loop of its own, which its ``close`` method
+            stops.
+        """
+        self._engine = engine
+        self._owns_loop = loop is None
+        self._loop = EventLoopThread() if loop is None else loop
+
+    @property
+    def engine(self) -> IAsyncWorkflowEngine:
+        """Asynchronous engine that calls are forwarded to."""
+        return self._engine
+
+    @property
+    def loop(self) -> EventLoopThread:
+        """Event loop that the calls run on."""
+        return self._loop
+
+    def get_server_info(self) -> WorkflowEngineInfo:
+        """Get information about the server that is serving the request."""
+        return self._loop.call(self._engine.get_server_info)
+
+    def load_workflow(self, file_name: Union[PathLike, str]) -> SyncWorkflowInstance:
+        """
+        Load a workflow from a local file into the engine.
+
+        Raises
+        ------
+        NotImplementedError
+            If the asynchronous engine does not load workflows from files.
+        """
+        if not isinstance(self._engine, IAsyncFileBasedWorkflowEngine):
+            raise NotImplementedError("This engine does not load workflows from files.")
+        return SyncWorkflowInstance(
+            self._loop.call(self._engine.load_workflow, file_name), self._loop
+        )
+
+    def close(self) -> None:
+        """Stop the event loop of the adapter if the adapter started it."""
+        if self._owns_loop:
+            self._loop.close()
+
+    def __enter__(self) -> SyncWorkflowEngine:
+        """Enter a context that closes the adapter on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the adapter."""
+        self.close()
+
+
+class SyncWorkflowInstance(IWorkflowInstance):
+    """Provides a synchronous workflow instance that forwards every call to an asynchronous one."""
+
+    def __init__(self, instance: IAsyncWorkflowInstance, loop: EventLoopThread):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : IAsyncWorkflowInstance
+            Asynchronous workflow instance to forward calls to.
+        loop : EventLoopThread
+            Event loop to run the calls on.
+        """
+        self._instance = instance
+        self._loop = loop
+        self._wrappers: Dict[str, SyncElement] = {}
+        self._wrappers_lock = threading.Lock()
+
+    @property
+    def instance(self) -> IAsyncWorkflowInstance:
+        """Asynchronous workflow instance that calls are forwarded to."""
+        return self._instance
+
+    def _wrap(self, element: Optional[IAsyncElement]) -> Optional[SyncElement]:
+        """Get the synchronous wrapper of an element, creating it on first use."""
+        if element is None:
+            return None
+        with self._wrappers_lock:
+            wrapper = self._wrappers.get(element.element_id)
+            if wrapper is None:
+                if isinstance(element, IAsyncControlStatement):
+                    wrapper = SyncControlStatement(self, element)
+                elif isinstance(element, IAsyncComponent):
+                    wrapper = SyncComponent(self, element)
+                elif isinstance(element, IAsyncDatapin):
+                    wrapper = SyncDatapin(self, element)
+                else:
+                    wrapper = SyncElement(self, element)
+                self._wrappers[element.element_id] = wrapper
+            return wrapper
+
+    def _wrap_all(self, elements: Any) -> Dict[str, Any]:
+        """Wrap the elements of a mapping or collection returned by an asynchronous element."""
+        if isinstance(elements, Mapping):
+            elements = elements.values()
+        return {element.name: self._wrap(element) for element in elements}
+
+    def get_state(self) -> WorkflowInstanceState:
+        """Get the state of the workflow instance."""
+        return self._loop.call(self._instance.get_state)
+
+    def run(
+        self,
+        inputs: Mapping[str, VariableState] = {},
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Mapping[str, VariableState]:
+        """
+        Set a workflow's input datapins and run it.
+
+        A timeout or cancel token cancels the asynchronous run with a cancel scope.
+        """
+        arguments = (inputs, reset, validation_names, collect_names)
+        if timeout is None and cancel_token is None:
+            return self._loop.call(self._instance.run, *arguments)
+        return self._loop.call(self._run_in_scope, arguments, deadline_after(timeout), cancel_token)
+
+    async def _run_in_scope(
+        self,
+        arguments: Tuple[Any, ...],
+        deadline: Optional[float],
+        cancel_token: Optional[CancelToken],
+    ) -> Mapping[str, VariableState]:
+        with cancel_scope(cancel_token, deadline):
+            outputs = await self._instance.run(*arguments)
+        return outputs
+
+    def start_run(
+        self,
+        inputs: Mapping[str, VariableState],
+        reset: bool,
+        validation_names: AbstractSet[str],
+        collect_names: AbstractSet[str] = set(),
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> SyncRunHandle:
+        """Set a workflow's input datapins and start running the workflow."""
+        handle = SyncRunHandle(
+            self._loop.call(
+                self._instance.start_run, inputs, reset, validation_names, collect_names, timeout
+            ),
+            self._loop,
+        )
+        if cancel_token is not None:
+            cancel_token.add_callback(handle.cancel)
+        return handle
+
+    def cancel(self) -> None:
+        """Ask the current run of the workflow instance to stop."""
+        self._loop.call(self._instance.cancel)
+
+    def run_batch(
+        self,
+        inputs: Sequence[Mapping[str, VariableState]],
+        reset: bool = False,
+        validation_names: AbstractSet[str] = set(),
+        collect_names: AbstractSet[str] = set(),
+        ordered: bool = True,
+        max_concurrency: int = 1,
+    ) -> Iterator[BatchRunResult]:
+        """Run the workflow once for each design."""
+        return self._loop.iterate(
+            self._instance.run_batch(
+                inputs, reset, validation_names, collect_names, ordered, max_concurrency
+            )
+        )
+
+    def subscribe(self, callback: Callable[[WorkflowEvent], None]) -> Callable[[], None]:
+        """
+        Call a function with the events of the workflow instance until unsubscribed.
+
+        Events are read from the event stream of the asynchronous workflow instance. The callback
+        is called on a worker thread, one event at a time, so it may call the adapters.
+        """
+        stream = self._loop.call(self._instance.subscribe)
+
+        async def forward() -> None:
+            async with stream:
+                async for event in stream:
+                    try:
+                        await anyio.to_thread.run_sync(callback, event)
+                    except Exception:
+                        _LOGGER.exception("A workflow event subscriber raised an exception.")
+
+        return self._loop.start_task_soon(forward).cancel
+
+    def get_root(self) -> SyncControlStatement:
+        """Get the root element of the workflow instance."""
+        return self._wrap(self._loop.call(self._instance.get_root))  # type: ignore[return-value]
+
+    def get_element_by_name(self, element_name: str) -> SyncElement:
+        """Get an element of the workflow instance by name."""
+        return self._wrap(  # type: ignore[return-value]
+            self._loop.call(self._instance.get_element_by_name, element_name)
+        )
+
+    def get_metadata_version(self) -> int:
+        """Get a number that changes whenever the structure or datapin metadata changes."""
+        return self._loop.call(self._instance.get_metadata_version)
+
+    def get_states(self, datapin_names: AbstractSet[str]) -> Mapping[str, VariableState]:
+        """Get the states of several datapins in one call."""
+        return self._loop.call(self._instance.get_states, datapin_names)
+
+    def set_states(self, states: Mapping[str, VariableState]) -> None:
+        """Set the states of several datapins in one call."""
+        self._loop.call(self._instance.set_states, states)
+
+    def get_properties_bulk(
+        self, element_names: AbstractSet[str], property_names: Optional[AbstractSet[str]] = None
+    ) -> Mapping[str, Mapping[str, Property]]:
+        """Get the properties of several elements in one call."""
+        return self._loop.call(self._instance.get_properties_bulk, element_names, property_names)
+
+    def set_properties_bulk(self, values: Mapping[Tuple[str, str], IVariableValue]) -> None:
+        """Set properties of several elements in one call."""
+        self._loop.call(self._instance.set_properties_bulk, values)
+
+    def get_tree_snapshot(
+        self, max_depth: Optional[int] = None, name_filter: Optional[str] = None
+    ) -> TreeSnapshot:
+        """Get a description of the whole element tree of the workflow instance in one call."""
+        return self._loop.call(self._instance.get_tree_snapshot, max_depth, name_filter)
+
+    def get_links(self) -> Sequence[DatapinLink]:
+        """Get the links between the datapins of the workflow instance."""
+        return self._loop.call(self._instance.get_links)
+
+    def get_link_graph(self) -> LinkGraph:
+        """Get a graph of the links between the datapins of the workflow instance."""
+        return self._loop.call(self._instance.get_link_graph)
+
+    def get_run_statistics(self) -> RunStatistics:
+        """Get what happened to each component of the workflow instance during its last run."""
+        return self._loop.call(self._instance.get_run_statistics)
+
+
+class SyncRunHandle(IRunHandle):
+    """Provides a synchronous handle on a run started through an asynchronous handle."""
+
+    def __init__(self, handle: IAsyncRunHandle, loop: EventLoopThread):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        handle : IAsyncRunHandle
+            Asynchronous handle to forward calls to.
+        loop : EventLoopThread
+            Event loop to run the calls on.
+        """
+        self._handle = handle
+        self._loop = loop
+
+    def done(self) -> bool:
+        """Get whether the run is known to have finished, either successfully or not."""
+        return self._handle.done()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the run to finish."""
+        return self._loop.call(self._handle.wait, timeout)
+
+    def result(self, timeout: Optional[float] = None) -> Mapping[str, VariableState]:
+        """Wait for the run to finish and get its outputs."""
+        return self._loop.call(self._handle.result, timeout)
+
+    def cancel(self) -> None:
+        """Ask the run to stop."""
+        self._loop.call(self._handle.cancel)
+
+
+class SyncElement(IElement):
+    """Provides a synchronous element that forwards every call to an asynchronous one."""
+
+    def __init__(self, instance: SyncWorkflowInstance, element: IAsyncElement):
+        """
+        Initialize a new instance.
+
+        Parameters
+        ----------
+        instance : SyncWorkflowInstance
+            Adapter of the workflow instance that the element belongs to.
+        element : IAsyncElement
+            Asynchronous element to forward calls to.
+        """
+        self._instance = instance
+        self._element = element
+        self._loop = instance._loop
+
+    @property
+    def element(self) -> IAsyncElement:
+        """Asynchronous element that calls are forwarded to."""
+        return self._element
+
+    @property
+    def element_id(self) -> str:
+        """Unique ID for the element that is assigned by the system."""
+        return self._element.element_id
+
+    @property
+    def parent_element_id(self) -> str:
+        """Element ID of the parent element."""
+        return self._element.parent_element_id
+
+    def get_parent_element(self) -> Optional[SyncElement]:
+        """Get the parent element of the element."""
+        return self._instance._wrap(self._loop.call(self._element.get_parent_element))
+
+    @property
+    def name(self) -> str:
+        """Name of the element."""
+        return self._element.name
+
+    @property
+    def full_name(self) -> str:
+        """Full name of the element in dotted notation."""
+        return self._element.full_name
+
+    def get_property(self, property_name: str) -> Property:
+        """Get a property by name."""
+        return self._loop.call(self._element.get_property, property_name)
+
+    def get_property_names(self) -> AbstractSet[str]:
+        """Get the names of the properties of the element."""
+        return self._loop.call(self._element.get_property_names)
+
+    def get_properties(self) -> Mapping[str, Property]:
+        """Get all properties of the element."""
+        return self._loop.call(self._element.get_properties)
+
+    def set_property(self, property_name: str, property_value: IVariableValue) -> None:
+        """Set the value of a property."""
+        self._loop.call(self._element.set_property, property_name, property_value)
+
+
+class _SyncDatapinContainer(SyncElement):
+    """Provides the ``get_datapins`` method of synchronous components and control statements."""
+
+    def get_datapins(self) -> Mapping[str, IDatapin]:
+        """Get the datapins of the element, by name."""
+        return self._instance._wrap_all(
+            self._loop.call(self._element.get_datapins)  # type: ignore[attr-defined]
+        )
+
+
+class SyncControlStatement(_SyncDatapinContainer, IControlStatement):
+    """Provides a synchronous control statement that forwards every call to an asynchronous one."""
+
+    @property
+    def control_type(self) -> str:
+        """Type of the control statement."""
+        return self._element.control_type  # type: ignore[attr-defined]
+
+    def get_elements(self) -> Mapping[str, IElement]:
+        """Get the child elements of the control statement, by name."""
+        return self._instance._wrap_all(
+            self._loop.call(self._element.get_elements)  # type: ignore[attr-defined]
+        )
+
+
+class SyncComponent(_SyncDatapinContainer, IComponent):
+    """Provides a synchronous component that forwards every call to an asynchronous one."""
+
+    @property
+    def pacz_url(self) -> Optional[str]:
+        """URL to the PACZ file or directory."""
+        return self._element.pacz_url  # type: ignore[attr-defined]
+
+
+class SyncDatapin(SyncElement, IDatapin):
+    """Provides a synchronous datapin that forwards every call to an asynchronous one."""
+
+    def get_metadata(self) -> CommonVariableMetadata:
+        """Get the metadata for the datapin."""
+        return self._loop.call(self._element.get_metadata)  # type: ignore[attr-defined]
+
+    @property
+    def value_type(self) -> VariableType:
+        """Type of value that the datapin stores."""
+        return self._element.value_type  # type: ignore[attr-defined]
+
+    def get_state(self, hid: Optional[str] = None) -> VariableState:
+        """Get the state of the datapin."""
+        return self._loop.call(self._element.get_state, hid)  # type: ignore[attr-defined]
+
+    def set_state(self, state: VariableState) -> None:
+        """Set the state of the datapin."""
+        self._loop.call(self._element.set_state, state)  # type: ignore[attr-defined]
+
+    def get_history_ids(self) -> Sequence[str]:
+        """Get the IDs of the recorded history entries of the datapin, oldest first."""
+        return self._loop.call(self._element.get_history_ids)  # type: ignore[attr-defined]
+
+    def iter_history(
+        self, hids: Optional[Sequence[str]] = None, chunk_size: int = 1000
+    ) -> Iterator[Sequence[Tuple[str, VariableState]]]:
+        """Get history entries of the datapin in chunks."""
+        return self._loop.iterate(
+            self._element.iter_history(hids, chunk_size)  # type: ignore[attr-defined]
+        )
+
+    def get_upstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """Get the datapins that this datapin depends on."""
+        return self._loop.call(
+            self._element.get_upstream_datapins, transitive  # type: ignore[attr-defined]
+        )
+
+    def get_downstream_datapins(self, transitive: bool = False) -> Sequence[str]:
+        """Get the datapins that depend on this datapin."""
+        return self._loop.call(
+            self._element.get_downstream_datapins, transitive  # type: ignore[attr-defined]
+        )
+
+    @property
+    def is_input_to_component(self) -> bool:
+        """Flag indicating if this datapin is an input in the context of its component."""
+        return self._element.is_input_to_component  # type: ignore[attr-defined]
+
+    @property
+    def is_input_to_workflow(self) -> bool:
+        """Flag indicating if this datapin is an unlinked input in the context of the workflow."""
+        return self._element.is_input_to_workflow  # type: ignore[attr-defined]
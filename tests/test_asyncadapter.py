@@ -0,0 +1,139 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the asynchronous adapters of synchronous engines."""
+
+import json
+import threading
+import time
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import anyio
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.asyncadapter import AsyncWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import InMemoryWorkflowEngine
+
+THREADS = set()
+ACTIVE = [0, 0]
+LOCK = threading.Lock()
+
+
+def double(a):
+    THREADS.add(threading.get_ident())
+    with LOCK:
+        ACTIVE[0] += 1
+        ACTIVE[1] = max(ACTIVE)
+    time.sleep(0.02)
+    with LOCK:
+        ACTIVE[0] -= 1
+    return {"b": 2.0 * a}
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "datapins": {"x": {"type": "real", "is_input": True, "value": 1.0}, "y": {"type": "real"}},
+        "elements": [
+            {
+                "name": "Double",
+                "callable": "test_asyncadapter:double",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            }
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Double.a"},
+        {"source": "Root.Double.b", "target": "Root.y"},
+    ],
+}
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    return path
+
+
+@pytest.mark.anyio
+async def test_runs_and_navigates_through_the_interfaces(workflow_file):
+    engine = AsyncWorkflowEngine(InMemoryWorkflowEngine())
+    instance = await engine.load_workflow(workflow_file)
+    THREADS.clear()
+
+    result = await instance.run(
+        inputs={"Root.x": VariableState(RealValue(3.0), True)}, collect_names={"Root.y"}
+    )
+    root = await instance.get_root()
+    pin = await instance.get_element_by_name("Root.Double.b")
+
+    assert result["Root.y"].value == 6.0
+    assert threading.get_ident() not in THREADS
+    assert await instance.get_state() == api.WorkflowInstanceState.SUCCESS
+    assert isinstance(root, api.IAsyncControlStatement)
+    assert list(await root.get_elements()) == ["Double"]
+    assert (await root.get_datapins())["x"].is_input_to_workflow
+    assert isinstance(pin, api.IAsyncDatapin)
+    assert pin.full_name == "Root.Double.b"
+    assert (await pin.get_state()).value == 6.0
+    assert (await pin.get_parent_element()) is (await root.get_elements())["Double"]
+    assert list(await pin.get_downstream_datapins()) == ["Root.y"]
+    with pytest.raises(ValueError):
+        await instance.get_element_by_name("Root.Missing")
+
+
+@pytest.mark.anyio
+async def test_run_handle_batches_and_events(workflow_file):
+    instance = await AsyncWorkflowEngine(InMemoryWorkflowEngine()).load_workflow(workflow_file)
+    designs = [{"Root.x": VariableState(RealValue(x), True)} for x in (1.0, 2.0, 3.0)]
+
+    async with await instance.subscribe() as events:
+        handle = await instance.start_run(designs[1], False, set(), {"Root.y"})
+        assert (await handle)["Root.y"].value == 4.0
+        states = []
+        async for event in events:
+            if event.state is not None:
+                states.append(event.state)
+            if event.state == api.WorkflowInstanceState.SUCCESS:
+                break
+    results = [result async for result in instance.run_batch(designs, collect_names={"Root.y"})]
+
+    assert states[-2:] == [api.WorkflowInstanceState.RUNNING, api.WorkflowInstanceState.SUCCESS]
+    assert [result.outputs["Root.y"].value for result in results] == [2.0, 4.0, 6.0]
+
+
+@pytest.mark.anyio
+async def test_limiter_bounds_worker_threads(workflow_file):
+    engine = AsyncWorkflowEngine(InMemoryWorkflowEngine(), max_threads=2)
+    instances = [await engine.load_workflow(workflow_file) for _ in range(6)]
+    ACTIVE[1] = 0
+
+    async with anyio.create_task_group() as task_group:
+        for instance in instances:
+            task_group.start_soon(instance.run)
+
+    assert ACTIVE[1] == 2
+    with pytest.raises(ValueError):
+        AsyncWorkflowEngine(InMemoryWorkflowEngine(), max_threads=0)
@@ -0,0 +1,251 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the cancellation and deadlines of workflow runs."""
+
+import json
+import threading
+
+import anyio
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.asyncadapter import AsyncWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import InMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.parallelexecutor import ParallelExecutor
+from ansys.engineeringworkflow.api.syncadapter import SyncWorkflowEngine
+
+STARTED = threading.Event()
+RELEASE = threading.Event()
+
+
+def slow(a):
+    STARTED.set()
+    RELEASE.wait(0.1)
+    return {"b": a}
+
+
+def add_one(a):
+    return {"b": a + 1.0}
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "datapins": {"x": {"type": "real", "is_input": True, "value": 1.0}, "y": {"type": "real"}},
+        "elements": [
+            {
+                "name": "Slow",
+                "callable": "test_cancellation:slow",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            },
+            {
+                "name": "AddOne",
+                "callable": "test_cancellation:add_one",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            },
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Slow.a"},
+        {"source": "Root.Slow.b", "target": "Root.AddOne.a"},
+        {"source": "Root.AddOne.b", "target": "Root.y"},
+    ],
+}
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    STARTED.clear()
+    RELEASE.clear()
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    return path
+
+
+def cancel_when_started(cancel):
+    def run():
+        STARTED.wait(5.0)
+        cancel()
+        RELEASE.set()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_cancel_token_callbacks():
+    token = api.CancelToken()
+    calls = []
+    remove = token.add_callback(lambda: calls.append("removed"))
+    token.add_callback(lambda: calls.append("kept"))
+    remove()
+
+    token.cancel()
+    token.cancel()
+    token.add_callback(lambda: calls.append("late"))
+
+    assert token.cancelled and token.wait(0)
+    assert calls == ["kept", "late"]
+
+
+class MinimalInstance(api.IWorkflowInstance):
+    def get_state(self):
+        return api.WorkflowInstanceState.INVALID
+
+    def start_run(self, inputs, reset, validation_names, collect_names=set()):
+        raise NotImplementedError
+
+    def get_root(self):
+        raise NotImplementedError
+
+    def get_element_by_name(self, element_name):
+        raise NotImplementedError
+
+
+def test_engines_without_cancellation_can_be_instantiated():
+    with pytest.raises(NotImplementedError):
+        MinimalInstance().cancel()
+
+
+def test_timeout_stops_run_between_components(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    with pytest.raises(api.RunTimeoutError) as raised:
+        instance.run(timeout=0.01)
+
+    assert isinstance(raised.value, TimeoutError)
+    assert instance.get_state() == api.WorkflowInstanceState.CANCELLED
+    statuses = instance.get_run_statistics().statuses
+    assert statuses == (api.ElementRunStatus.EXECUTED, api.ElementRunStatus.NOT_RUN)
+    assert instance.get_element_by_name("Root.Slow.b").get_state().is_valid
+    assert not instance.get_element_by_name("Root.AddOne.b").get_state().is_valid
+
+    RELEASE.set()
+    outputs = instance.run(collect_names={"Root.y"})
+    assert outputs["Root.y"].value == 2.0
+    assert instance.get_state() == api.WorkflowInstanceState.SUCCESS
+
+
+def test_cancel_token_stops_run(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    token = api.CancelToken()
+    thread = cancel_when_started(token.cancel)
+
+    with pytest.raises(api.RunCancelledError) as raised:
+        instance.run(cancel_token=token)
+    thread.join()
+
+    assert not isinstance(raised.value, api.RunTimeoutError)
+    assert instance.get_state() == api.WorkflowInstanceState.CANCELLED
+
+
+def test_run_handle_cancel(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    states = []
+    instance.subscribe(lambda event: states.append(event.state))
+
+    handle = instance.start_run({}, False, set(), {"Root.y"})
+    thread = cancel_when_started(handle.cancel)
+
+    with pytest.raises(api.RunCancelledError):
+        handle.result(5.0)
+    thread.join()
+    handle.cancel()
+
+    assert instance.get_state() == api.WorkflowInstanceState.CANCELLED
+    assert states[-1] == api.WorkflowInstanceState.CANCELLED
+
+
+def test_executor_run_timeout(workflow_file):
+    with ParallelExecutor() as executor:
+        instance = InMemoryWorkflowEngine(executor=executor).load_workflow(workflow_file)
+
+        with pytest.raises(api.RunTimeoutError):
+            instance.run(timeout=0.01)
+
+    assert instance.get_state() == api.WorkflowInstanceState.CANCELLED
+    statuses = instance.get_run_statistics().statuses
+    assert statuses == (api.ElementRunStatus.EXECUTED, api.ElementRunStatus.NOT_RUN)
+
+
+@pytest.mark.anyio
+async def test_async_run_in_cancel_scope(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    with anyio.move_on_after(0.01) as scope:
+        await instance.run()
+
+    assert scope.cancelled_caught
+    assert await instance.get_state() == api.WorkflowInstanceState.CANCELLED
+
+
+@pytest.mark.anyio
+async def test_async_run_is_cancelled_with_its_task(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(instance.run)
+        await anyio.to_thread.run_sync(STARTED.wait, 5.0)
+        task_group.cancel_scope.cancel()
+
+    assert await instance.get_state() == api.WorkflowInstanceState.CANCELLED
+    statuses = (await instance.get_run_statistics()).statuses
+    assert statuses == (api.ElementRunStatus.EXECUTED, api.ElementRunStatus.NOT_RUN)
+
+
+@pytest.mark.anyio
+async def test_async_run_with_executor_is_cancelled_with_its_task(workflow_file):
+    with ParallelExecutor() as executor:
+        engine = AsyncInMemoryWorkflowEngine(InMemoryWorkflowEngine(executor=executor))
+        instance = await engine.load_workflow(workflow_file)
+
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(instance.run)
+            await anyio.to_thread.run_sync(STARTED.wait, 5.0)
+            task_group.cancel_scope.cancel()
+
+    assert await instance.get_state() == api.WorkflowInstanceState.CANCELLED
+
+
+def test_sync_adapter_timeout(workflow_file):
+    with SyncWorkflowEngine(AsyncInMemoryWorkflowEngine()) as engine:
+        instance = engine.load_workflow(workflow_file)
+
+        with pytest.raises(api.RunTimeoutError):
+            instance.run(timeout=0.01)
+
+        assert instance.get_state() == api.WorkflowInstanceState.CANCELLED
+
+
+@pytest.mark.anyio
+async def test_async_adapter_cancel_scope(workflow_file):
+    instance = await AsyncWorkflowEngine(InMemoryWorkflowEngine()).load_workflow(workflow_file)
+
+    with pytest.raises(TimeoutError):
+        with anyio.fail_after(0.01):
+            await instance.run()
+
+    assert await instance.get_state() == api.WorkflowInstanceState.CANCELLED
@@ -0,0 +1,137 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for columnar batch runs."""
+
+import numpy as np
+import pytest
+
+from ansys.engineeringworkflow.api.columnar import async_run_columns, run_columns
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+
+
+def scale(x, n, flag):
+    if n < 0:
+        raise ValueError("The count is negative.")
+    return {"y": x * n, "positive": flag and x > 0, "label": f"{n}"}
+
+
+DEFINITION = WorkflowDefinition.from_dict(
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "elements": [
+                {
+                    "name": "Scale",
+                    "callable": "test_columnar:scale",
+                    "inputs": {
+                        "x": {"type": "real"},
+                        "n": {"type": "integer"},
+                        "flag": {"type": "boolean"},
+                    },
+                    "outputs": {
+                        "y": {"type": "real"},
+                        "positive": {"type": "boolean"},
+                        "label": {"type": "string"},
+                    },
+                }
+            ],
+        }
+    }
+)
+
+INPUTS = {
+    "Root.Scale.x": np.array([1.0, -2.0, 3.0]),
+    "Root.Scale.n": np.array([2, 3, -1]),
+    "Root.Scale.flag": np.array([True, True, False]),
+}
+
+
+def test_run_columns():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+
+    result = run_columns(instance, INPUTS, collect_names={"Root.Scale"})
+
+    y = result.values["Root.Scale.y"]
+    assert y.dtype == np.float64
+    assert y[:2].tolist() == [2.0, -6.0]
+    assert result.values["Root.Scale.positive"].dtype == np.bool_
+    assert result.values["Root.Scale.positive"][:2].tolist() == [True, False]
+    assert result.values["Root.Scale.label"].tolist() == ["2", "3", None]
+    assert result.valid["Root.Scale.y"].tolist() == [True, True, False]
+    assert list(result.errors) == [2]
+
+
+def test_run_columns_creates_declared_columns_when_every_design_fails():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+    collect_names = {"Root.Scale.y", "Root.Scale.label"}
+
+    result = run_columns(
+        instance, {"Root.Scale.n": np.array([-1, -2])}, collect_names=collect_names
+    )
+
+    assert set(result.values) == collect_names
+    assert result.values["Root.Scale.y"].dtype == np.float64
+    assert result.values["Root.Scale.label"].tolist() == [None, None]
+    assert result.valid["Root.Scale.label"].tolist() == [False, False]
+    assert list(result.errors) == [0, 1]
+
+
+def test_run_columns_uses_validity_masks():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+    x = np.array([1.0, 2.0])
+
+    run_columns(
+        instance,
+        {"Root.Scale.x": x},
+        valid={"Root.Scale.x": np.array([True, False])},
+        collect_names={"Root.Scale.y"},
+    )
+
+    assert not instance.get_element_by_name("Root.Scale.x").get_state().is_valid
+
+
+def test_run_columns_rejects_bad_columns():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+
+    with pytest.raises(ValueError):
+        run_columns(instance, {"Root.Scale.x": np.zeros(2), "Root.Scale.n": np.zeros(3)})
+    with pytest.raises(ValueError):
+        run_columns(instance, {"Root.Scale.x": np.zeros((2, 2))})
+    with pytest.raises(ValueError):
+        run_columns(instance, {"Root.Scale": np.zeros(2)})
+
+
+@pytest.mark.anyio
+async def test_async_run_columns():
+    instance = await AsyncInMemoryWorkflowEngine().create_instance(DEFINITION)
+
+    result = await async_run_columns(instance, INPUTS, collect_names={"Root.Scale.y"})
+
+    assert result.values["Root.Scale.y"][:2].tolist() == [2.0, -6.0]
+    assert list(result.errors) == [2]
+    with pytest.raises(ValueError):
+        await async_run_columns(instance, {"Root.Scale": np.zeros(2)})
@@ -0,0 +1,75 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the dependency analysis for partial workflow runs."""
+
+from ansys.tools.variableinterop import RealValue, VariableState
+
+from ansys.engineeringworkflow.api.dependencies import DependencyGraph, InputChangeTracker
+
+
+def test_required_components_follow_links_and_hierarchy():
+    graph = DependencyGraph(
+        {
+            "Root.A": (["Root.A.in"], ["Root.A.out"]),
+            "Root.B": (["Root.B.in"], ["Root.B.out"]),
+            "Root.Loop.C": (["Root.Loop.C.in"], ["Root.Loop.C.out"]),
+            "Root.Loop-2.D": ([], ["Root.Loop-2.D.out"]),
+        },
+        [
+            ("Root.x", "Root.A.in"),
+            ("Root.A.out", "Root.Loop.C.in"),
+            ("Root.Loop.C.out", "Root.y"),
+            ("Root.Loop-2.D.out", "Root.B.in"),
+        ],
+    )
+
+    assert graph.required_components({"Root.y"}) == ("Root.A", "Root.Loop.C")
+    assert graph.required_components({"Root.Loop"}) == ("Root.A", "Root.Loop.C")
+    assert graph.required_components({"Root.B.out", "Root.A"}) == (
+        "Root.A",
+        "Root.B",
+        "Root.Loop-2.D",
+    )
+    assert graph.required_components({"Root.x", "Root.Unknown"}) == ()
+    assert graph.required_components(set()) == graph.component_names
+
+
+def test_long_chains_do_not_recurse():
+    count = 5000
+    components = {f"Root.C{i}": ([f"Root.C{i}.in"], [f"Root.C{i}.out"]) for i in range(count)}
+    links = [(f"Root.C{i}.out", f"Root.C{i + 1}.in") for i in range(count - 1)]
+
+    graph = DependencyGraph(components, links)
+
+    assert len(graph.required_components({f"Root.C{count - 1}.out"})) == count
+
+
+def test_input_change_tracker():
+    tracker = InputChangeTracker()
+    inputs = {"a": VariableState(RealValue(1.0), True)}
+
+    assert tracker.unchanged_outputs("A", inputs) is None
+    tracker.record("A", inputs, "outputs")
+    assert tracker.unchanged_outputs("A", {"a": VariableState(RealValue(1.0), True)}) == "outputs"
+    assert tracker.unchanged_outputs("A", {"a": VariableState(RealValue(2.0), True)}) is None
+    tracker.forget("A")
+    assert tracker.unchanged_outputs("A", inputs) is None
@@ -0,0 +1,141 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the element index."""
+
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.elementindex import (
+    AsyncIndexedWorkflowInstanceMixin,
+    ElementIndex,
+    IndexedWorkflowInstanceMixin,
+)
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+
+DEFINITION = WorkflowDefinition.from_dict(
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "datapins": {"x": {"type": "real", "is_input": True}},
+            "elements": [
+                {
+                    "name": "Group",
+                    "control_type": "sequential",
+                    "elements": [
+                        {"name": "Component", "callable": dict, "inputs": {"a": {"type": "real"}}}
+                    ],
+                }
+            ],
+        }
+    }
+)
+
+
+class WalkedInstance(IndexedWorkflowInstanceMixin):
+    def __init__(self, root):
+        self.root = root
+        self.walks = 0
+        self.version = 0
+
+    def get_root(self):
+        self.walks += 1
+        return self.root
+
+    def get_metadata_version(self):
+        return self.version
+
+
+class AsyncWalkedInstance(AsyncIndexedWorkflowInstanceMixin):
+    def __init__(self, root):
+        self.root = root
+        self.walks = 0
+        self.version = 0
+
+    async def get_root(self):
+        self.walks += 1
+        return self.root
+
+    async def get_metadata_version(self):
+        return self.version
+
+
+def test_index_lookups():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+    index = ElementIndex.from_root(instance.get_root())
+    pin = instance.get_element_by_name("Root.Group.Component.a")
+
+    assert len(index) == 5
+    assert index.get_by_name("Root.Group.Component.a") is pin
+    assert index.get_by_id(pin.element_id) is pin
+    assert index.get_parent(pin) is pin.get_parent_element()
+    assert index.get_parent(instance.get_root()) is None
+    with pytest.raises(ValueError):
+        index.get_by_name("Root.Missing")
+    with pytest.raises(ValueError):
+        index.get_by_id("missing")
+    with pytest.raises(api.NameCollisionError):
+        index.add(pin)
+
+
+def test_mixin_builds_index_once_until_invalidated():
+    root = InMemoryWorkflowEngine().create_instance(DEFINITION).get_root()
+    instance = WalkedInstance(root)
+
+    assert instance.get_element_by_name("Root.x").name == "x"
+    assert instance.get_element_by_id(root.element_id) is root
+    assert instance.walks == 1
+    instance.invalidate_element_index()
+    instance.get_element_by_name("Root.Group")
+    assert instance.walks == 2
+
+
+def test_mixin_rebuilds_index_when_version_changes():
+    root = InMemoryWorkflowEngine().create_instance(DEFINITION).get_root()
+    instance = WalkedInstance(root)
+    instance.element_index_version_check_interval = 0.0
+
+    instance.get_element_by_name("Root.x")
+    instance.get_element_by_name("Root.x")
+    assert instance.walks == 1
+    instance.version = 1
+    instance.get_element_by_name("Root.x")
+    assert instance.walks == 2
+
+
+@pytest.mark.anyio
+async def test_async_mixin():
+    root = await (await AsyncInMemoryWorkflowEngine().create_instance(DEFINITION)).get_root()
+    instance = AsyncWalkedInstance(root)
+
+    component = await instance.get_element_by_name("Root.Group.Component")
+    assert (await instance.get_element_by_id(component.parent_element_id)).name == "Group"
+    assert len(await instance.get_element_index()) == 5
+    assert instance.walks == 1
+    instance.element_index_version_check_interval = 0.0
+    instance.version = 1
+    await instance.get_element_by_name("Root.x")
+    assert instance.walks == 2
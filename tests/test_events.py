@@ -0,0 +1,192 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for workflow instance events."""
+
+import queue
+import threading
+
+import anyio
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.events import (
+    EventBroadcaster,
+    PollingEventStream,
+    StatePoller,
+    state_changed,
+)
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+
+State = api.WorkflowInstanceState
+EventType = api.WorkflowEventType
+
+
+def double(a):
+    return {"b": a * 2.0}
+
+
+def fail(a):
+    raise RuntimeError("The component failed.")
+
+
+def workflow(function):
+    return WorkflowDefinition.from_dict(
+        {
+            "root": {
+                "name": "Root",
+                "control_type": "sequential",
+                "datapins": {"x": {"type": "real", "is_input": True, "value": 1.0}},
+                "elements": [
+                    {
+                        "name": "Component",
+                        "callable": function,
+                        "inputs": {"a": {"type": "real"}},
+                        "outputs": {"b": {"type": "real"}},
+                    }
+                ],
+            },
+            "links": [{"source": "Root.x", "target": "Root.Component.a"}],
+        }
+    )
+
+
+def summarize(events):
+    return [(event.event_type, event.state, event.element_name) for event in events]
+
+
+def test_subscribe_reports_states_and_components():
+    instance = InMemoryWorkflowEngine().create_instance(workflow(double))
+    events = queue.Queue()
+    unsubscribe = instance.subscribe(events.put)
+
+    instance.run()
+    unsubscribe()
+    instance.run(reset=True)
+
+    assert summarize(events.queue) == [
+        (EventType.STATE_CHANGED, State.RUNNING, ""),
+        (EventType.COMPONENT_STARTED, None, "Root.Component"),
+        (EventType.COMPONENT_FINISHED, None, "Root.Component"),
+        (EventType.STATE_CHANGED, State.SUCCESS, ""),
+    ]
+
+
+def test_subscribe_reports_failed_components():
+    instance = InMemoryWorkflowEngine().create_instance(workflow(fail))
+    events = []
+    instance.subscribe(events.append)
+
+    with pytest.raises(RuntimeError):
+        instance.run()
+
+    assert summarize(events)[-2:] == [
+        (EventType.COMPONENT_FAILED, None, "Root.Component"),
+        (EventType.STATE_CHANGED, State.FAILED, ""),
+    ]
+
+
+def test_state_poller_reports_current_state():
+    instance = InMemoryWorkflowEngine().create_instance(workflow(double))
+    events = queue.Queue()
+
+    poller = StatePoller(instance, events.put, interval=0.01)
+    first = events.get(timeout=5.0)
+    instance.run()
+    second = events.get(timeout=5.0)
+    poller.stop()
+
+    assert first.state == State.INVALID
+    assert second.state == State.SUCCESS
+
+
+@pytest.mark.anyio
+async def test_async_subscribe_streams_events_of_background_runs():
+    instance = await AsyncInMemoryWorkflowEngine().create_instance(workflow(double))
+
+    async with await instance.subscribe() as events:
+        handle = await instance.start_run({}, False, set())
+        received = []
+        async for event in events:
+            received.append(event)
+            if event.state == State.SUCCESS:
+                break
+        await handle
+
+    assert [event.event_type for event in received] == [
+        EventType.STATE_CHANGED,
+        EventType.COMPONENT_STARTED,
+        EventType.COMPONENT_FINISHED,
+        EventType.STATE_CHANGED,
+    ]
+    assert [event async for event in events] == []
+
+
+@pytest.mark.anyio
+async def test_async_subscribe_drops_events_beyond_buffer_size():
+    instance = await AsyncInMemoryWorkflowEngine().create_instance(workflow(double))
+
+    events = await instance.subscribe(max_buffer_size=1)
+    await instance.run()
+
+    assert (await events.__anext__()).state == State.RUNNING
+    assert events.dropped_count == 3
+    await events.aclose()
+
+
+@pytest.mark.anyio
+async def test_publishing_does_not_wait_for_the_event_loop():
+    broadcaster = EventBroadcaster()
+    received = []
+
+    async def consume(events):
+        received.append(await events.__anext__())
+
+    async with broadcaster.subscribe_stream() as events:
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(consume, events)
+            await anyio.wait_all_tasks_blocked()
+            publisher = threading.Thread(
+                target=broadcaster.publish, args=(state_changed(State.RUNNING),)
+            )
+            publisher.start()
+            # Block the event loop, as a caller waiting for an engine lock would.
+            publisher.join(5.0)
+            published = not publisher.is_alive()
+
+    assert published
+    assert [event.state for event in received] == [State.RUNNING]
+
+
+@pytest.mark.anyio
+async def test_polling_event_stream():
+    instance = await AsyncInMemoryWorkflowEngine().create_instance(workflow(double))
+
+    async with PollingEventStream(instance, interval=0.01) as events:
+        first = await events.__anext__()
+        await instance.run()
+        second = await events.__anext__()
+
+    assert (first.state, second.state) == (State.INVALID, State.SUCCESS)
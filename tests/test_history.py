@@ -0,0 +1,114 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for datapin history."""
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import numpy as np
+import pytest
+
+from ansys.engineeringworkflow.api.history import async_history_to_arrays, history_to_arrays
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+
+
+def check(x):
+    return {"y": x * x, "big": x > 2.0, "label": str(x)}
+
+
+DEFINITION = WorkflowDefinition.from_dict(
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "elements": [
+                {
+                    "name": "Check",
+                    "callable": check,
+                    "inputs": {"x": {"type": "real"}},
+                    "outputs": {
+                        "y": {"type": "real"},
+                        "big": {"type": "boolean"},
+                        "label": {"type": "string"},
+                    },
+                }
+            ],
+        }
+    }
+)
+
+
+def run_designs(instance, values):
+    for value in values:
+        instance.run({"Root.Check.x": VariableState(RealValue(value), True)})
+
+
+def test_history_is_recorded_after_each_run():
+    instance = InMemoryWorkflowEngine(record_history=True).create_instance(DEFINITION)
+    run_designs(instance, [1.0, 2.0, 3.0])
+    y = instance.get_element_by_name("Root.Check.y")
+
+    assert y.get_history_ids() == ("0", "1", "2")
+    assert y.get_state("1").value == 4.0
+    assert [len(chunk) for chunk in y.iter_history(chunk_size=2)] == [2, 1]
+    assert [hid for hid, _ in next(y.iter_history(["2", "0"]))] == ["2", "0"]
+    with pytest.raises(ValueError):
+        y.get_state("3")
+
+
+def test_history_is_not_recorded_by_default():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+    run_designs(instance, [1.0])
+
+    assert instance.get_element_by_name("Root.Check.y").get_history_ids() == ()
+
+
+def test_history_to_arrays():
+    instance = InMemoryWorkflowEngine(record_history=True).create_instance(DEFINITION)
+    run_designs(instance, [1.0, 2.0, 3.0])
+
+    y = history_to_arrays(instance.get_element_by_name("Root.Check.y"), chunk_size=2)
+    big = history_to_arrays(instance.get_element_by_name("Root.Check.big"), hids=["2"])
+
+    assert y.hids == ("0", "1", "2")
+    assert np.array_equal(y.values, [1.0, 4.0, 9.0])
+    assert y.valid.all()
+    assert big.values.dtype == np.bool_
+    assert big.values.tolist() == [True]
+    with pytest.raises(ValueError):
+        history_to_arrays(instance.get_element_by_name("Root.Check.label"))
+
+
+@pytest.mark.anyio
+async def test_async_history():
+    engine = AsyncInMemoryWorkflowEngine(InMemoryWorkflowEngine(record_history=True))
+    instance = await engine.create_instance(DEFINITION)
+    run_designs(instance.instance, [1.0, 2.0])
+    y = await instance.get_element_by_name("Root.Check.y")
+
+    chunks = [chunk async for chunk in y.iter_history(chunk_size=1)]
+    arrays = await async_history_to_arrays(y)
+
+    assert [chunk[0][0] for chunk in chunks] == ["0", "1"]
+    assert arrays.values.tolist() == [1.0, 4.0]
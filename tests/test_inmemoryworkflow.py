@@ -0,0 +1,371 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the in-memory reference engine."""
+
+import json
+import threading
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import InMemoryWorkflowEngine
+
+CALLS = []
+THREADS = []
+
+
+def square(a):
+    CALLS.append("square")
+    THREADS.append(threading.get_ident())
+    return {"b": a * a}
+
+
+def add_one(a):
+    CALLS.append("add_one")
+    return {"b": a + 1.0}
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "properties": {"tolerance": 0.5},
+        "datapins": {
+            "x": {"type": "real", "is_input": True, "value": 2.0, "upper_bound": 10.0},
+            "y": {"type": "real"},
+        },
+        "elements": [
+            {
+                "name": "Square",
+                "callable": "test_inmemoryworkflow:square",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            },
+            {
+                "name": "Branch",
+                "control_type": "parallel",
+                "elements": [
+                    {
+                        "name": "AddOne",
+                        "callable": "test_inmemoryworkflow:add_one",
+                        "inputs": {"a": {"type": "real"}},
+                        "outputs": {"b": {"type": "real"}},
+                    }
+                ],
+            },
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Square.a"},
+        {"source": "Root.Square.b", "target": "Root.Branch.AddOne.a"},
+        {"source": "Root.Branch.AddOne.b", "target": "Root.y"},
+    ],
+}
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    return path
+
+
+def test_run_collects_linked_outputs(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    assert instance.get_state() == api.WorkflowInstanceState.INVALID
+    result = instance.run(
+        inputs={"Root.x": VariableState(RealValue(3.0), True)}, collect_names={"Root.y"}
+    )
+
+    assert result == {"Root.y": VariableState(RealValue(10.0), True)}
+    assert instance.get_state() == api.WorkflowInstanceState.SUCCESS
+
+
+def test_invalidated_datapins_keep_their_values(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    instance.run()
+
+    instance.set_states({"Root.x": VariableState(RealValue(3.0), True)})
+
+    states = instance.get_states({"Root.y", "Root.Square.b"})
+    assert states["Root.y"] == VariableState(RealValue(5.0), False)
+    assert states["Root.Square.b"] == VariableState(RealValue(4.0), False)
+
+
+def test_run_only_reruns_invalidated_components(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    instance.run()
+    CALLS.clear()
+
+    instance.run()
+    assert CALLS == []
+
+    instance.get_element_by_name("Root.Branch.AddOne.a").set_state(
+        VariableState(RealValue(1.0), True)
+    )
+    assert instance.get_state() == api.WorkflowInstanceState.INVALID
+    instance.run()
+    # The link restores the input of AddOne to its value in the last run.
+    assert CALLS == []
+    assert instance.get_state() == api.WorkflowInstanceState.SUCCESS
+
+    instance.run(inputs={"Root.x": VariableState(RealValue(-2.0), True)})
+    assert CALLS == ["square"]
+
+    CALLS.clear()
+    instance.run(reset=True)
+    assert CALLS == ["square", "add_one"]
+
+
+def test_validation_names_limit_run_to_dependencies(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    CALLS.clear()
+
+    result = instance.run(validation_names={"Root.Square.b"}, collect_names={"Root.Square.b"})
+
+    assert result["Root.Square.b"].value == 4.0
+    assert CALLS == ["square"]
+    assert instance.get_state() == api.WorkflowInstanceState.INVALID
+    assert not instance.get_element_by_name("Root.y").get_state().is_valid
+    instance.run(validation_names={"Root.Branch"})
+    assert CALLS == ["square", "add_one"]
+    assert instance.get_state() == api.WorkflowInstanceState.SUCCESS
+    with pytest.raises(ValueError):
+        instance.run(validation_names={"Root.Missing"})
+
+
+def test_tree_navigation(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    root = instance.get_root()
+
+    assert list(root.get_elements()) == ["Square", "Branch"]
+    assert list(root.get_datapins()) == ["x", "y"]
+    assert root.get_property("tolerance").property_value == 0.5
+    pin = instance.get_element_by_name("Root.Branch.AddOne.b")
+    assert isinstance(pin, api.IDatapin)
+    assert pin.get_parent_element().get_parent_element().control_type == "parallel"
+    assert pin.get_parent_element().parent_element_id == root.get_elements()["Branch"].element_id
+    assert root.get_datapins()["x"].is_input_to_workflow
+    assert not instance.get_element_by_name("Root.Square.a").is_input_to_workflow
+    with pytest.raises(ValueError):
+        instance.get_element_by_name("Root.Missing")
+
+
+def test_out_of_range_input_is_rejected(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    with pytest.raises(api.ValueOutOfRangeError):
+        instance.run(inputs={"Root.x": VariableState(RealValue(11.0), True)})
+    assert instance.get_element_by_name("Root.x").get_state().value == 2.0
+
+
+def test_duplicate_names_are_rejected(tmp_path):
+    definition = {"root": {"name": "Root", "control_type": "sequential"}}
+    definition["root"]["elements"] = [WORKFLOW["root"]["elements"][0]] * 2
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(definition))
+
+    with pytest.raises(api.NameCollisionError):
+        InMemoryWorkflowEngine().load_workflow(path)
+
+
+@pytest.mark.anyio
+async def test_async_engine(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    result = await instance.run(collect_names={"Root.Branch"})
+    root = await instance.get_root()
+    branch = (await root.get_elements())["Branch"]
+
+    assert result["Root.Branch.AddOne.b"].value == 5.0
+    assert isinstance(branch, api.IAsyncControlStatement)
+    assert (await branch.get_parent_element()) is root
+
+
+@pytest.mark.anyio
+async def test_async_run_does_not_block_the_event_loop(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+    THREADS.clear()
+
+    await instance.run()
+
+    assert THREADS and threading.get_ident() not in THREADS
+
+
+def test_run_batch_reports_each_design_in_order(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    designs = [{"Root.x": VariableState(RealValue(x), True)} for x in (1.0, 11.0, 3.0)]
+
+    results = list(instance.run_batch(designs, collect_names={"Root.y"}))
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].outputs["Root.y"].value == 2.0
+    assert not results[1].succeeded
+    assert isinstance(results[1].exception, api.ValueOutOfRangeError)
+    assert results[2].outputs["Root.y"].value == 10.0
+
+
+@pytest.mark.anyio
+async def test_async_run_batch(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+    designs = [{"Root.x": VariableState(RealValue(x), True)} for x in (1.0, 2.0)]
+
+    results = [result async for result in instance.run_batch(designs, collect_names={"Root.y"})]
+
+    assert [result.outputs["Root.y"].value for result in results] == [2.0, 5.0]
+
+
+def test_set_states_is_atomic(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    instance.run()
+    CALLS.clear()
+
+    with pytest.raises(api.ValueOutOfRangeError):
+        instance.set_states(
+            {
+                "Root.Branch.AddOne.a": VariableState(RealValue(1.0), True),
+                "Root.x": VariableState(RealValue(11.0), True),
+            }
+        )
+    assert instance.get_state() == api.WorkflowInstanceState.SUCCESS
+
+    instance.set_states(
+        {
+            "Root.Branch.AddOne.a": VariableState(RealValue(1.0), True),
+            "Root.x": VariableState(RealValue(3.0), True),
+        }
+    )
+    states = instance.get_states({"Root.x", "Root.Branch.AddOne.a"})
+    assert states["Root.x"].value == 3.0
+    assert states["Root.Branch.AddOne.a"].value == 1.0
+    with pytest.raises(ValueError):
+        instance.get_states({"Root.Branch"})
+
+
+def test_default_set_states_restores_states_on_error(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    pin = instance.get_element_by_name("Root.Branch.AddOne.a")
+
+    with pytest.raises(api.ValueOutOfRangeError):
+        api.IWorkflowInstance.set_states(
+            instance,
+            {
+                "Root.Branch.AddOne.a": VariableState(RealValue(1.0), True),
+                "Root.x": VariableState(RealValue(11.0), True),
+            },
+        )
+
+    assert not pin.get_state().is_valid
+    assert api.IWorkflowInstance.get_states(instance, {"Root.x"})["Root.x"].value == 2.0
+
+
+@pytest.mark.anyio
+async def test_async_bulk_states(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    await instance.set_states({"Root.x": VariableState(RealValue(4.0), True)})
+
+    assert (await instance.get_states({"Root.x"}))["Root.x"].value == 4.0
+    await api.IAsyncWorkflowInstance.set_states(
+        instance, {"Root.x": VariableState(RealValue(5.0), True)}
+    )
+    assert (await api.IAsyncWorkflowInstance.get_states(instance, {"Root.x"}))[
+        "Root.x"
+    ].value == 5.0
+
+
+def test_bulk_properties(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    with pytest.raises(ValueError):
+        instance.set_properties_bulk(
+            {("Root.Square", "mesh_size"): RealValue(0.1), ("Root.Missing", "x"): RealValue(1.0)}
+        )
+    assert instance.get_properties_bulk({"Root.Square"}) == {"Root.Square": {}}
+
+    instance.set_properties_bulk(
+        {
+            ("Root.Square", "mesh_size"): RealValue(0.1),
+            ("Root.Branch.AddOne", "mesh_size"): RealValue(0.2),
+        }
+    )
+    properties = instance.get_properties_bulk({"Root.Square", "Root.Branch.AddOne"}, {"mesh_size"})
+
+    assert properties["Root.Branch.AddOne"]["mesh_size"].property_value == 0.2
+    assert properties["Root.Square"]["mesh_size"].parent_element_id == (
+        instance.get_element_by_name("Root.Square").element_id
+    )
+    with pytest.raises(ValueError):
+        instance.get_properties_bulk({"Root"}, {"mesh_size"})
+
+
+@pytest.mark.anyio
+async def test_async_bulk_properties(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    await instance.set_properties_bulk({("Root", "tolerance"): RealValue(0.25)})
+    properties = await instance.get_properties_bulk({"Root"})
+
+    assert properties["Root"]["tolerance"].property_value == 0.25
+
+
+def test_run_statistics(workflow_file):
+    instance = InMemoryWorkflowEngine().load_workflow(workflow_file)
+    statistics = instance.get_run_statistics()
+    assert statistics.element_names == ("Root.Square", "Root.Branch.AddOne")
+    assert set(statistics.statuses) == {api.ElementRunStatus.SKIPPED}
+
+    instance.run()
+    statistics = instance.get_run_statistics()
+    assert statistics.statuses == (api.ElementRunStatus.EXECUTED,) * 2
+    assert statistics.execution_counts == (1, 1)
+    assert all(wall_time > 0.0 for wall_time in statistics.wall_times)
+
+    instance.get_element_by_name("Root.Branch.AddOne.a").set_state(
+        VariableState(RealValue(1.0), True)
+    )
+    instance.run()
+    records = instance.get_run_statistics().to_numpy()
+    assert records["element_name"].tolist() == ["Root.Square", "Root.Branch.AddOne"]
+    assert records["status"].tolist() == [
+        api.ElementRunStatus.SKIPPED.value,
+        api.ElementRunStatus.CACHED.value,
+    ]
+    assert records["execution_count"].tolist() == [0, 0]
+
+    instance.run(reset=True, validation_names={"Root.Square"})
+    statuses = instance.get_run_statistics().statuses
+    assert statuses == (api.ElementRunStatus.EXECUTED, api.ElementRunStatus.SKIPPED)
+
+
+@pytest.mark.anyio
+async def test_async_run_statistics(workflow_file):
+    instance = await AsyncInMemoryWorkflowEngine().load_workflow(workflow_file)
+
+    await instance.run()
+    statistics = await instance.get_run_statistics()
+
+    assert len(statistics) == 2
+    assert statistics.statuses == (api.ElementRunStatus.EXECUTED,) * 2
@@ -0,0 +1,163 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the pools of pre-warmed workflow instances."""
+
+import json
+import threading
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import InMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.instancepool import (
+    AsyncWorkflowInstancePool,
+    WorkflowInstancePool,
+)
+
+CALLS = []
+
+
+def double(a):
+    CALLS.append(a)
+    return {"b": 2.0 * a}
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "datapins": {"x": {"type": "real", "is_input": True, "value": 1.0}, "y": {"type": "real"}},
+        "elements": [
+            {
+                "name": "Double",
+                "callable": "test_instancepool:double",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            }
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Double.a"},
+        {"source": "Root.Double.b", "target": "Root.y"},
+    ],
+}
+
+
+class CountingEngine(InMemoryWorkflowEngine):
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    def load_workflow(self, file_name):
+        self.loads += 1
+        return super().load_workflow(file_name)
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    return path
+
+
+def test_checked_in_instances_are_reset_and_reused(workflow_file):
+    engine = CountingEngine()
+    with WorkflowInstancePool(engine) as pool:
+        with pool.instance(workflow_file) as instance:
+            instance.run({"Root.x": VariableState(RealValue(3.0), True)})
+            wrapped = instance.wrapped
+        CALLS.clear()
+
+        with pool.instance(workflow_file) as instance:
+            assert instance.wrapped is wrapped
+            assert instance.get_states({"Root.x"})["Root.x"].value == 1.0
+            instance.run({"Root.x": VariableState(RealValue(3.0), True)})
+            instance.run()
+
+        assert engine.loads == 1
+        assert CALLS == [3.0]
+        with pytest.raises(ValueError):
+            pool.check_in(instance)
+
+
+def test_checkout_waits_while_pool_is_full(workflow_file):
+    pool = WorkflowInstancePool(InMemoryWorkflowEngine(), max_size=1)
+    instance = pool.check_out(workflow_file)
+
+    with pytest.raises(TimeoutError):
+        pool.check_out(workflow_file, timeout=0.01)
+    threading.Timer(0.05, pool.check_in, [instance]).start()
+    assert pool.check_out(workflow_file, timeout=5.0).wrapped is instance.wrapped
+
+
+def test_idle_instances_are_evicted_down_to_minimum(workflow_file):
+    engine = CountingEngine()
+    discarded = []
+    pool = WorkflowInstancePool(
+        engine, min_size=1, max_size=3, idle_timeout=0.0, on_discard=discarded.append
+    )
+
+    pool.prewarm(workflow_file)
+    assert (pool.size(workflow_file), engine.loads) == (1, 1)
+    instances = [pool.check_out(workflow_file) for _ in range(3)]
+    busy = instances[0].start_run({}, False, set())
+    for instance in instances:
+        pool.check_in(instance)
+    busy.wait()
+
+    assert (pool.size(workflow_file), pool.idle_count(workflow_file)) == (1, 1)
+    assert len(discarded) == 2 and instances[0].wrapped in discarded
+    pool.close()
+    assert pool.size(workflow_file) == 0
+    assert {id(instance) for instance in discarded} == {id(i.wrapped) for i in instances}
+    with pytest.raises(RuntimeError):
+        pool.check_out(workflow_file)
+
+
+@pytest.mark.anyio
+async def test_async_pool(workflow_file):
+    discarded = []
+
+    async def discard(instance):
+        discarded.append(instance)
+
+    async with AsyncWorkflowInstancePool(
+        AsyncInMemoryWorkflowEngine(), min_size=2, max_size=2, on_discard=discard
+    ) as pool:
+        await pool.prewarm(workflow_file)
+        assert pool.idle_count(workflow_file) == 2
+
+        async with pool.instance(workflow_file) as instance:
+            result = await instance.run(
+                {"Root.x": VariableState(RealValue(2.0), True)}, collect_names={"Root.y"}
+            )
+            assert result["Root.y"].value == 4.0
+        async with pool.instance(workflow_file) as instance:
+            async with pool.instance(workflow_file) as other:
+                assert other.wrapped is not instance.wrapped
+                states = await instance.get_states({"Root.x"})
+                assert states["Root.x"].value == 1.0
+            with pytest.raises(TimeoutError):
+                async with pool.instance(workflow_file, timeout=0.0):
+                    pass
+    assert len(discarded) == 2
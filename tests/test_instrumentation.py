@@ -0,0 +1,150 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the call instrumentation of workflow engines."""
+
+import json
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import InMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.instrumentation import Instrumentation
+
+
+def double(a):
+    return {"b": 2.0 * a}
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "datapins": {
+            "x": {"type": "real", "is_input": True, "value": 1.0, "upper_bound": 10.0},
+            "y": {"type": "real"},
+        },
+        "elements": [
+            {
+                "name": "Double",
+                "callable": "test_instrumentation:double",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            }
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Double.a"},
+        {"source": "Root.Double.b", "target": "Root.y"},
+    ],
+}
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    return path
+
+
+def test_records_calls_errors_and_payloads(workflow_file):
+    instrumentation = Instrumentation()
+    engine = instrumentation.wrap(InMemoryWorkflowEngine())
+    instance = engine.load_workflow(workflow_file)
+
+    for x in (1.0, 2.0, 3.0):
+        instance.run({"Root.x": VariableState(RealValue(x), True)}, collect_names={"Root.y"})
+    with pytest.raises(api.ValueOutOfRangeError):
+        instance.run({"Root.x": VariableState(RealValue(11.0), True)})
+    results = list(instance.run_batch([{}, {}]))
+    root = instance.get_root()
+    pin = root.get_elements()["Double"].get_datapins()["b"]
+
+    assert isinstance(engine, api.IFileBasedWorkflowEngine)
+    assert isinstance(instance, api.IWorkflowInstance)
+    assert isinstance(pin, api.IDatapin)
+    assert pin.get_parent_element() is root.get_elements()["Double"]
+    assert pin.get_state().value == 6.0
+    assert len(results) == 2
+    statistics = instrumentation.statistics()
+    run = statistics["IWorkflowInstance.run"]
+    assert run.calls == 4
+    assert run.errors == {"ValueOutOfRangeError": 1}
+    assert run.payload_items == 3 * 3 + 1
+    assert 0.0 < run.p50_seconds <= run.p95_seconds <= run.p99_seconds
+    assert statistics["IWorkflowInstance.run_batch"].payload_items == 4
+    assert statistics["IDatapin.get_state"].calls == 1
+    assert "IWorkflowInstance.get_state" not in statistics
+
+    text = instrumentation.to_prometheus()
+    assert 'ewapi_calls_total{method="IWorkflowInstance.run"} 4' in text
+    assert (
+        'ewapi_call_errors_total{method="IWorkflowInstance.run",exception="ValueOutOfRangeError"} 1'
+    ) in text
+    assert 'ewapi_call_duration_seconds_bucket{method="IWorkflowInstance.run",le="+Inf"} 4' in text
+    assert 'quantile="0.99"' in text
+    instrumentation.reset()
+    assert instrumentation.statistics() == {}
+
+
+def test_percentiles_follow_the_durations():
+    instrumentation = Instrumentation()
+    recorder = instrumentation._recorder("IWorkflowInstance.run")
+    for index in range(1000):
+        instrumentation._record(recorder, (index + 1) / 1000, 0, None)
+
+    statistics = instrumentation.statistics()["IWorkflowInstance.run"]
+
+    assert statistics.p50_seconds == pytest.approx(0.5, rel=0.2)
+    assert statistics.p95_seconds == pytest.approx(0.95, rel=0.2)
+    assert statistics.p99_seconds == pytest.approx(0.99, rel=0.2)
+    assert statistics.total_seconds == pytest.approx(500.5)
+
+
+@pytest.mark.anyio
+async def test_async_spans(workflow_file):
+    spans = []
+    instrumentation = Instrumentation(span_exporter=spans.append)
+    engine = instrumentation.wrap(AsyncInMemoryWorkflowEngine())
+    instance = await engine.load_workflow(workflow_file)
+
+    pin = await instance.get_element_by_name("Root.y")
+    await instance.run()
+    state = await pin.get_state()
+    with pytest.raises(ValueError):
+        await instance.get_element_by_name("Root.Missing")
+
+    assert state.value == 2.0
+    assert isinstance(pin, api.IAsyncDatapin)
+    assert [span.name for span in spans] == [
+        "IAsyncFileBasedWorkflowEngine.load_workflow",
+        "IAsyncWorkflowInstance.get_element_by_name",
+        "IAsyncWorkflowInstance.run",
+        "IAsyncDatapin.get_state",
+        "IAsyncWorkflowInstance.get_element_by_name",
+    ]
+    assert spans[3].attributes["ewapi.element"] == "Root.y"
+    assert spans[-1].status_code == "ERROR"
+    assert spans[-1].attributes["exception.type"] == "ValueError"
+    assert all(span.parent_span_id is None for span in spans)
+    assert spans[2].end_time_unix_nano >= spans[2].start_time_unix_nano
@@ -0,0 +1,122 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the datapin link graphs."""
+
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+from ansys.engineeringworkflow.api.linkgraph import LinkGraph
+
+
+def negate(a):
+    return {"b": -a}
+
+
+DEFINITION = WorkflowDefinition.from_dict(
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "datapins": {"x": {"type": "real", "is_input": True}, "y": {"type": "real"}},
+            "elements": [
+                {
+                    "name": name,
+                    "callable": negate,
+                    "inputs": {"a": {"type": "real"}},
+                    "outputs": {"b": {"type": "real"}},
+                }
+                for name in ("First", "Second")
+            ],
+        },
+        "links": [
+            {"source": "Root.x", "target": "Root.First.a"},
+            {"source": "Root.First.b", "target": "Root.Second.a"},
+            {"source": "Root.Second.b", "target": "Root.y"},
+        ],
+    }
+)
+
+
+def test_queries_follow_links_and_components():
+    graph = DEFINITION.link_graph
+
+    assert graph.upstream({"Root.y"}) == ("Root.Second.b",)
+    assert graph.upstream({"Root.y"}, transitive=True) == (
+        "Root.Second.b",
+        "Root.Second.a",
+        "Root.First.b",
+        "Root.First.a",
+        "Root.x",
+    )
+    assert graph.downstream({"Root.First.a"}) == ()
+    assert set(graph.downstream({"Root.First.a", "Root.Second.b"}, transitive=True)) == {
+        "Root.First.b",
+        "Root.Second.a",
+        "Root.y",
+    }
+    assert graph.upstream({"Root.Unknown"}, transitive=True) == ()
+    indptr, indices = graph.csr
+    source = graph.datapin_names.index("Root.x")
+    assert [graph.datapin_names[i] for i in indices[indptr[source] : indptr[source + 1]]] == [
+        "Root.First.a"
+    ]
+
+
+def test_wide_and_deep_graphs():
+    width = 500
+    components = {f"Root.C{i}": ([f"Root.C{i}.a"], [f"Root.C{i}.b"]) for i in range(width)}
+    links = [("Root.x", f"Root.C{i}.a") for i in range(width)]
+    links += [(f"Root.C{i}.b", f"Root.C{i + 1}.a") for i in range(width - 1)]
+    graph = LinkGraph(links, components)
+
+    assert len(graph.downstream({"Root.x"})) == width
+    assert len(graph.downstream({"Root.x"}, transitive=True)) == 2 * width
+    assert len(graph.upstream({f"Root.C{width - 1}.b"}, transitive=True)) == 2 * width
+
+
+def test_instances_and_datapins_report_links():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+    datapin = instance.get_element_by_name("Root.First.b")
+
+    assert instance.get_links()[0] == api.DatapinLink("Root.x", "Root.First.a")
+    assert datapin.get_downstream_datapins() == ("Root.Second.a",)
+    assert datapin.get_upstream_datapins(transitive=True) == ("Root.First.a", "Root.x")
+    default_graph = api.IWorkflowInstance.get_link_graph(instance)
+    assert default_graph.upstream({"Root.y"}, True) == instance.get_link_graph().upstream(
+        {"Root.y"}, True
+    )
+
+
+@pytest.mark.anyio
+async def test_async_link_queries():
+    instance = await AsyncInMemoryWorkflowEngine().create_instance(DEFINITION)
+    datapin = await instance.get_element_by_name("Root.y")
+
+    assert len(await instance.get_links()) == 3
+    assert await datapin.get_upstream_datapins() == ("Root.Second.b",)
+    graph = await api.IAsyncWorkflowInstance.get_link_graph(instance)
+    assert graph.downstream({"Root.x"}, transitive=True)[-1] == "Root.y"
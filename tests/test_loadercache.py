@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the cache of parsed workflow files."""
+
+import json
+import os
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+from ansys.engineeringworkflow.api.loadercache import WorkflowLoaderCache
+
+
+def write_workflow(path, value=1.0):
+    definition = {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "datapins": {"x": {"type": "real", "is_input": True, "value": value}},
+        }
+    }
+    path.write_text(json.dumps(definition))
+    return path
+
+
+def test_engine_creates_independent_instances_from_cache(tmp_path):
+    path = write_workflow(tmp_path / "workflow.json")
+    cache = WorkflowLoaderCache(WorkflowDefinition.from_json)
+    engine = InMemoryWorkflowEngine(loader_cache=cache)
+
+    first = engine.load_workflow(path)
+    second = engine.load_workflow(path)
+    first.set_states({"Root.x": VariableState(RealValue(5.0), True)})
+
+    assert first.definition is second.definition
+    assert second.get_states({"Root.x"})["Root.x"].value == 1.0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_reloads_changed_files(tmp_path):
+    path = write_workflow(tmp_path / "workflow.json")
+    cache = WorkflowLoaderCache(WorkflowDefinition.from_json)
+    definition = cache.load(path)
+
+    os.utime(path, ns=(0, 0))
+    assert cache.load(path) is definition
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    write_workflow(path, 2.0)
+    os.utime(path, ns=(1, 1))
+    changed = cache.load(path)
+    assert changed.root.datapins[0].default_value == 2.0
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_identical_files_share_an_entry(tmp_path):
+    cache = WorkflowLoaderCache(WorkflowDefinition.from_json)
+
+    first = cache.load(write_workflow(tmp_path / "first.json"))
+    second = cache.load(write_workflow(tmp_path / "second.json"))
+
+    assert first is second
+    assert len(cache) == 1
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    paths = [write_workflow(tmp_path / f"{value}.json", value) for value in range(3)]
+    size = os.path.getsize(paths[0])
+    cache = WorkflowLoaderCache(WorkflowDefinition.from_json, max_entries=2)
+
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])
+    cache.load(paths[2])
+    assert len(cache) == 2
+    cache.load(paths[0])
+    assert cache.misses == 3
+    cache.load(paths[1])
+    assert cache.misses == 4
+
+    small = WorkflowLoaderCache(WorkflowDefinition.from_json, max_bytes=size + 1)
+    small.load(paths[0])
+    small.load(paths[1])
+    assert (len(small), small.total_bytes) == (1, size)
+    assert WorkflowLoaderCache(WorkflowDefinition.from_json, max_bytes=size - 1).load(paths[0])
+    with pytest.raises(ValueError):
+        WorkflowLoaderCache(WorkflowDefinition.from_json, max_entries=0)
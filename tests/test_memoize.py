@@ -0,0 +1,182 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for run memoization."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+from ansys.engineeringworkflow.api import ElementRunStatus
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+from ansys.engineeringworkflow.api.memoize import (
+    AsyncMemoizingWorkflowInstance,
+    MemoizingWorkflowInstance,
+    run_key,
+)
+
+CALLS = []
+
+
+def add(a, b):
+    CALLS.append((a, b))
+    return {"c": a + b}
+
+
+DEFINITION = WorkflowDefinition.from_dict(
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "datapins": {
+                "a": {"type": "real", "is_input": True, "value": 1.0},
+                "b": {"type": "real", "is_input": True, "value": 2.0},
+            },
+            "elements": [
+                {
+                    "name": "Add",
+                    "callable": add,
+                    "inputs": {"a": {"type": "real"}, "b": {"type": "real"}},
+                    "outputs": {"c": {"type": "real"}},
+                }
+            ],
+        },
+        "links": [
+            {"source": "Root.a", "target": "Root.Add.a"},
+            {"source": "Root.b", "target": "Root.Add.b"},
+        ],
+    }
+)
+
+
+def real(value):
+    return VariableState(RealValue(value), True)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CALLS.clear()
+
+
+def test_repeated_designs_are_not_rerun():
+    instance = MemoizingWorkflowInstance(InMemoryWorkflowEngine().create_instance(DEFINITION))
+
+    first = instance.run({"Root.a": real(3.0)}, reset=True, collect_names={"Root.Add.c"})
+    instance.run({"Root.a": real(4.0)}, reset=True, collect_names={"Root.Add.c"})
+    again = instance.run({"Root.a": real(3.0)}, reset=True, collect_names={"Root.Add.c"})
+
+    assert first == again == {"Root.Add.c": real(5.0)}
+    assert len(CALLS) == 2
+    assert (instance.hits, instance.misses, len(instance)) == (1, 2, 2)
+    assert instance.get_run_statistics().statuses == (ElementRunStatus.CACHED,)
+    instance.run({"Root.a": real(5.0)}, reset=True)
+    assert instance.get_run_statistics().statuses == (ElementRunStatus.EXECUTED,)
+
+
+def test_key_covers_inputs_that_are_not_passed():
+    instance = MemoizingWorkflowInstance(InMemoryWorkflowEngine().create_instance(DEFINITION))
+
+    instance.run({"Root.a": real(3.0)}, reset=True)
+    instance.wrapped.get_element_by_name("Root.b").set_state(real(10.0))
+    instance.run({"Root.a": real(3.0)}, reset=True)
+
+    assert instance.misses == 2
+
+
+def test_hits_set_the_inputs_of_the_wrapped_instance():
+    wrapped = InMemoryWorkflowEngine().create_instance(DEFINITION)
+    instance = MemoizingWorkflowInstance(wrapped)
+    collect_names = {"Root.Add.c"}
+
+    instance.run({"Root.a": real(2.0), "Root.b": real(1.0)}, collect_names=collect_names)
+    instance.run({"Root.a": real(1.0), "Root.b": real(1.0)}, collect_names=collect_names)
+    instance.run({"Root.a": real(2.0)}, collect_names=collect_names)
+    outputs = instance.run({"Root.b": real(5.0)}, collect_names=collect_names)
+
+    assert instance.hits == 1
+    assert outputs == {"Root.Add.c": real(7.0)}
+    assert wrapped.get_element_by_name("Root.a").get_state() == real(2.0)
+
+
+def test_memoized_flag_is_per_thread():
+    instance = MemoizingWorkflowInstance(InMemoryWorkflowEngine().create_instance(DEFINITION))
+    instance.run({"Root.a": real(3.0)}, reset=True)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(instance.run, {"Root.a": real(3.0)}, True).result()
+
+    assert instance.hits == 1
+    assert instance.get_run_statistics().statuses == (ElementRunStatus.EXECUTED,)
+
+
+def test_float_tolerance_and_eviction():
+    instance = MemoizingWorkflowInstance(
+        InMemoryWorkflowEngine().create_instance(DEFINITION), max_size=1, float_tolerance=1e-6
+    )
+
+    instance.run({"Root.a": real(3.0)}, reset=True)
+    instance.run({"Root.a": real(3.0 + 1e-9)}, reset=True)
+    instance.run({"Root.a": real(4.0)}, reset=True)
+    instance.run({"Root.a": real(3.0)}, reset=True)
+
+    assert (instance.hits, instance.misses, len(instance)) == (1, 3, 1)
+    with pytest.raises(ValueError):
+        MemoizingWorkflowInstance(instance.wrapped, float_tolerance=0.0)
+
+
+def test_property_changes_change_the_fingerprint():
+    instance = MemoizingWorkflowInstance(InMemoryWorkflowEngine().create_instance(DEFINITION))
+
+    instance.run(reset=True)
+    instance.set_properties_bulk({("Root.Add", "mesh_size"): RealValue(0.1)})
+    instance.run(reset=True)
+
+    assert instance.misses == 2
+
+
+def test_run_key_is_order_independent():
+    first = run_key("f", {"a": real(1.0), "b": real(2.0)}, set(), {"x", "y"})
+    second = run_key("f", {"b": real(2.0), "a": real(1.0)}, set(), {"y", "x"})
+
+    assert first == second
+    assert first != run_key("g", {"a": real(1.0), "b": real(2.0)}, set(), {"x", "y"})
+
+
+@pytest.mark.anyio
+async def test_async_memoization():
+    wrapped = await AsyncInMemoryWorkflowEngine().create_instance(DEFINITION)
+    instance = AsyncMemoizingWorkflowInstance(wrapped)
+
+    for _ in range(3):
+        outputs = await instance.run({"Root.a": real(5.0)}, collect_names={"Root.Add.c"})
+
+    assert outputs["Root.Add.c"].value == 7.0
+    assert (instance.hits, instance.misses) == (2, 1)
+
+    await instance.run({"Root.a": real(1.0)})
+    await instance.run({"Root.a": real(5.0)}, collect_names={"Root.Add.c"})
+    outputs = await instance.run({"Root.b": real(1.0)}, collect_names={"Root.Add.c"})
+    assert outputs["Root.Add.c"].value == 6.0
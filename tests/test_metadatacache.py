@@ -0,0 +1,124 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the datapin metadata caches."""
+
+import pytest
+
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    InMemoryWorkflowInstance,
+    WorkflowDefinition,
+)
+from ansys.engineeringworkflow.api.metadatacache import AsyncMetadataCache, MetadataCache
+
+DEFINITION = WorkflowDefinition.from_dict(
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "datapins": {
+                "x": {"type": "real", "is_input": True, "upper_bound": 1.0},
+                "y": {"type": "real", "is_input": True},
+                "z": {"type": "real", "is_input": True},
+            },
+        }
+    }
+)
+
+
+class VersionedInstance(InMemoryWorkflowInstance):
+    version = 0
+    version_checks = 0
+
+    def get_metadata_version(self):
+        self.version_checks += 1
+        return self.version
+
+
+def test_cache_hits_and_evicts_least_recently_used():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+    x, y, z = (instance.get_element_by_name(f"Root.{name}") for name in "xyz")
+    cache = MetadataCache(instance, max_size=2)
+
+    assert cache.get_metadata(x).upper_bound == 1.0
+    assert cache.get_metadata(x) is cache.get_metadata(x)
+    cache.get_metadata(y)
+    cache.get_metadata(x)
+    cache.get_metadata(z)
+
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (3, 3)
+    cache.get_metadata(y)
+    assert cache.misses == 4
+    with pytest.raises(ValueError):
+        MetadataCache(instance, max_size=0)
+
+
+def test_cache_is_cleared_when_version_changes():
+    instance = VersionedInstance(DEFINITION)
+    x = instance.get_element_by_name("Root.x")
+    cache = MetadataCache(instance, version_check_interval=0.0)
+
+    first = cache.get_metadata(x)
+    instance.version = 1
+    second = cache.get_metadata(x)
+
+    assert first is not second
+    assert cache.misses == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lookups_do_not_check_version_each():
+    instance = VersionedInstance(DEFINITION)
+    x, y = (instance.get_element_by_name(f"Root.{name}") for name in "xy")
+    cache = MetadataCache(instance)
+
+    for _ in range(100):
+        cache.get_metadata(x)
+        cache.get_metadata(y)
+
+    assert instance.version_checks == 1
+    assert (cache.hits, cache.misses) == (198, 2)
+
+
+def test_version_check_interval():
+    instance = VersionedInstance(DEFINITION)
+    x = instance.get_element_by_name("Root.x")
+    cache = MetadataCache(instance, version_check_interval=3600.0)
+
+    cache.get_metadata(x)
+    instance.version = 1
+    cache.get_metadata(x)
+
+    assert cache.hits == 1
+
+
+@pytest.mark.anyio
+async def test_async_cache():
+    instance = await AsyncInMemoryWorkflowEngine().create_instance(DEFINITION)
+    x = await instance.get_element_by_name("Root.x")
+    cache = AsyncMetadataCache(instance)
+
+    assert (await cache.get_metadata(x)) is (await cache.get_metadata(x))
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
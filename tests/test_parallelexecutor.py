@@ -0,0 +1,187 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the concurrent execution of parallel control statements."""
+
+import json
+import time
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.dependencies import DependencyGraph
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import InMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.parallelexecutor import ExecutionPlan, ParallelExecutor
+
+DELAY = 0.2
+
+
+def slow_double(a):
+    time.sleep(DELAY)
+    return {"b": 2.0 * a}
+
+
+def fail(a):
+    raise ArithmeticError("component failed")
+
+
+def _component(name, callable="test_parallelexecutor:slow_double"):
+    return {
+        "name": name,
+        "callable": callable,
+        "inputs": {"a": {"type": "real"}},
+        "outputs": {"b": {"type": "real"}},
+    }
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "datapins": {
+            "x": {"type": "real", "is_input": True, "value": 1.0},
+            "y": {"type": "real"},
+        },
+        "elements": [
+            {
+                "name": "Branch",
+                "control_type": "parallel",
+                "elements": [_component("A"), _component("B"), _component("C"), _component("D")],
+            }
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Branch.A.a"},
+        {"source": "Root.x", "target": "Root.Branch.B.a"},
+        {"source": "Root.x", "target": "Root.Branch.C.a"},
+        {"source": "Root.Branch.A.b", "target": "Root.Branch.D.a"},
+        {"source": "Root.Branch.D.b", "target": "Root.y"},
+    ],
+}
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    return path
+
+
+def test_plan_orders_dependent_siblings():
+    graph = DependencyGraph(
+        {
+            "Root.P.A": ([], ["Root.P.A.b"]),
+            "Root.P.Q.B": (["Root.P.Q.B.a"], []),
+            "Root.P.C": ([], []),
+        },
+        [("Root.P.A.b", "Root.P.Q.B.a")],
+    )
+    plan = ExecutionPlan.build(
+        "Root",
+        {
+            "Root": ("sequential", ["Root.P"]),
+            "Root.P": ("parallel", ["Root.P.A", "Root.P.Q", "Root.P.C"]),
+            "Root.P.Q": ("sequential", ["Root.P.Q.B"]),
+        },
+        graph,
+    )
+
+    branch = plan.children[0]
+    assert not plan.parallel
+    assert branch.parallel
+    assert branch.predecessors == ((), (0,), ())
+    assert branch.children[1].children == ("Root.P.Q.B",)
+
+
+def test_parallel_children_run_concurrently(workflow_file):
+    executor = ParallelExecutor(max_concurrency=4)
+    instance = InMemoryWorkflowEngine(executor=executor).load_workflow(workflow_file)
+
+    start = time.perf_counter()
+    result = instance.run(
+        inputs={"Root.x": VariableState(RealValue(3.0), True)}, collect_names={"Root.Branch"}
+    )
+    elapsed = time.perf_counter() - start
+
+    # A, B, and C run at once, and D runs after A: two delays instead of four.
+    assert elapsed < 3.5 * DELAY
+    assert [result[f"Root.Branch.{name}.b"].value for name in "ABCD"] == [6.0, 6.0, 6.0, 12.0]
+    assert instance.get_element_by_name("Root.y").get_state().value == 12.0
+    assert instance.get_state() == api.WorkflowInstanceState.SUCCESS
+
+
+def test_limiter_bounds_concurrency(workflow_file):
+    instance = InMemoryWorkflowEngine(executor=ParallelExecutor(max_concurrency=1)).load_workflow(
+        workflow_file
+    )
+
+    start = time.perf_counter()
+    instance.run(validation_names={"Root.Branch.B", "Root.Branch.C"})
+
+    assert time.perf_counter() - start >= 2 * DELAY
+    statistics = instance.get_run_statistics()
+    waits = dict(zip(statistics.element_names, statistics.queue_waits))
+    assert max(waits["Root.Branch.B"], waits["Root.Branch.C"]) >= 0.9 * DELAY
+    assert statistics.statuses[0] == api.ElementRunStatus.SKIPPED
+    with pytest.raises(ValueError):
+        ParallelExecutor(offload="interpreter")
+
+
+def test_failure_raises_component_exception(tmp_path):
+    definition = json.loads(json.dumps(WORKFLOW))
+    definition["root"]["elements"][0]["elements"][1] = _component("B", "test_parallelexecutor:fail")
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(definition))
+    instance = InMemoryWorkflowEngine(executor=ParallelExecutor()).load_workflow(path)
+    events = []
+    instance.subscribe(events.append)
+
+    with pytest.raises(ArithmeticError):
+        instance.run()
+
+    assert instance.get_state() == api.WorkflowInstanceState.FAILED
+    statistics = instance.get_run_statistics()
+    statuses = dict(zip(statistics.element_names, statistics.statuses))
+    assert statuses["Root.Branch.B"] == api.ElementRunStatus.FAILED
+    assert statuses["Root.Branch.D"] != api.ElementRunStatus.EXECUTED
+    failed = [event.element_name for event in events if event.event_type.name == "COMPONENT_FAILED"]
+    assert failed == ["Root.Branch.B"]
+
+
+def test_process_offload(workflow_file):
+    with ParallelExecutor(max_concurrency=2, offload="process") as executor:
+        instance = InMemoryWorkflowEngine(executor=executor).load_workflow(workflow_file)
+
+        result = instance.run(collect_names={"Root.y"})
+
+    assert result["Root.y"].value == 4.0
+
+
+@pytest.mark.anyio
+async def test_async_engine_with_executor(workflow_file):
+    engine = AsyncInMemoryWorkflowEngine(InMemoryWorkflowEngine(executor=ParallelExecutor()))
+    instance = await engine.load_workflow(workflow_file)
+
+    result = await instance.run(collect_names={"Root.y"})
+
+    assert result["Root.y"].value == 4.0
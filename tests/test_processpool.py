@@ -0,0 +1,111 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the process-pool executor of workflow runs."""
+
+import json
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.inmemoryworkflow import InMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.processpool import ProcessPoolWorkflowExecutor
+
+
+def square(a):
+    return {"b": a * a}
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "datapins": {
+            "x": {"type": "real", "is_input": True, "upper_bound": 10.0},
+            "y": {"type": "real"},
+        },
+        "elements": [
+            {
+                "name": "Square",
+                "callable": "test_processpool:square",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            }
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Square.a"},
+        {"source": "Root.Square.b", "target": "Root.y"},
+    ],
+}
+
+
+def design(x):
+    return {"Root.x": VariableState(RealValue(x), True)}
+
+
+@pytest.fixture(scope="module")
+def executor(tmp_path_factory):
+    path = tmp_path_factory.mktemp("processpool") / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    with ProcessPoolWorkflowExecutor(InMemoryWorkflowEngine, path, max_workers=2) as executor:
+        yield executor
+
+
+def test_submit_returns_futures(executor):
+    futures = [executor.submit(design(x), collect_names={"Root.y"}) for x in (2.0, 11.0)]
+
+    assert futures[0].result()["Root.y"] == VariableState(RealValue(4.0), True)
+    with pytest.raises(api.ValueOutOfRangeError):
+        futures[1].result()
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_run_batch(executor, ordered):
+    designs = (design(x) for x in [0.0, 1.0, 11.0, 3.0, 4.0, 5.0, 6.0])
+
+    results = list(
+        executor.run_batch(designs, collect_names={"Root.y"}, ordered=ordered, chunk_size=2)
+    )
+
+    if ordered:
+        assert [result.index for result in results] == list(range(7))
+    results.sort(key=lambda result: result.index)
+    assert isinstance(results[2].exception, api.ValueOutOfRangeError)
+    assert [result.outputs["Root.y"].value for result in results if result.succeeded] == [
+        0.0,
+        1.0,
+        9.0,
+        16.0,
+        25.0,
+        36.0,
+    ]
+    with pytest.raises(ValueError):
+        next(executor.run_batch([], chunk_size=0))
+
+
+def test_designs_do_not_inherit_inputs_of_earlier_designs(executor):
+    designs = [design(3.0), {}, design(2.0), {}]
+
+    results = list(executor.run_batch(designs, collect_names={"Root.y"}, chunk_size=4))
+
+    assert [result.outputs["Root.y"].value for result in results] == [9.0, 0.0, 4.0, 0.0]
@@ -0,0 +1,158 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the persistent result store and the serialization of states."""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from ansys.tools.variableinterop import (
+    BooleanValue,
+    FileArrayValue,
+    IntegerArrayValue,
+    RealValue,
+    StringArrayValue,
+    StringValue,
+    VariableState,
+)
+import numpy as np
+import pytest
+
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+from ansys.engineeringworkflow.api.memoize import MemoizingWorkflowInstance
+from ansys.engineeringworkflow.api.resultstore import ResultStore
+from ansys.engineeringworkflow.api.serialization import dumps_states, loads_states
+
+STATES = {
+    "Root.a": VariableState(RealValue(0.1), True),
+    "Root.b": VariableState(IntegerArrayValue(values=np.arange(6).reshape(2, 3)), False),
+    "Root.c": VariableState(BooleanValue(True), True),
+    "Root.d": VariableState(StringArrayValue(values=["x", "y,z"]), True),
+    "Root.e": VariableState(StringValue("text"), True),
+}
+
+
+def outputs(value):
+    return {"Root.y": VariableState(RealValue(value), True)}
+
+
+def put_range(path, start, stop):
+    with ResultStore(path) as store:
+        for value in range(start, stop):
+            store.put(str(value), outputs(value))
+
+
+def test_serialization_round_trip():
+    states = loads_states(dumps_states(STATES))
+
+    assert states.keys() == STATES.keys()
+    for name, state in STATES.items():
+        assert type(states[name].value) is type(state.value)
+        assert np.array_equal(states[name].value, state.value)
+        assert states[name].is_valid == state.is_valid
+    with pytest.raises(ValueError):
+        dumps_states({"Root.f": VariableState(FileArrayValue(values=[]), True)})
+    with pytest.raises(ValueError):
+        loads_states(b'[["Root.a", "NOT_A_TYPE", true, 1]]')
+
+
+def test_put_and_get(tmp_path):
+    with ResultStore(tmp_path / "results") as store:
+        store.put("key", STATES)
+        size = os.path.getsize(store.path)
+        store.put("key", outputs(1.0))
+
+        assert "key" in store
+        assert "other" not in store
+        assert store.get("key")["Root.e"].value == "text"
+        assert store.get("other") is None
+        assert os.path.getsize(store.path) == size
+
+
+def test_stores_share_records_and_follow_compaction(tmp_path):
+    path = tmp_path / "results"
+    with ResultStore(path, max_bytes=2_000) as writer, ResultStore(path) as reader:
+        writer.put("0", outputs(0.0))
+        assert reader.get("0")["Root.y"].value == 0.0
+
+        for value in range(1, 50):
+            writer.put(str(value), outputs(value))
+
+        assert os.path.getsize(path) <= 2_000
+        assert writer.get("0") is None
+        assert reader.get("49")["Root.y"].value == 49.0
+        assert len(reader) == len(writer) < 50
+
+
+def test_torn_records_are_ignored_and_truncated(tmp_path):
+    path = tmp_path / "results"
+    with ResultStore(path) as store:
+        store.put("first", outputs(1.0))
+        with open(path, "ab") as file:
+            file.write(b"EWR1 partial record")
+
+        assert ResultStore(path).get("first") is not None
+        store.put("second", outputs(2.0))
+        assert ResultStore(path).get("second")["Root.y"].value == 2.0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "results"
+    path.write_bytes(b"not a store")
+
+    with pytest.raises(ValueError):
+        ResultStore(path)
+
+
+def test_processes_write_concurrently(tmp_path):
+    path = tmp_path / "results"
+    with ProcessPoolExecutor(4) as executor:
+        list(executor.map(put_range, [path] * 4, range(0, 200, 50), range(50, 250, 50)))
+
+    with ResultStore(path) as store:
+        assert len(store) == 0
+        assert all(store.get(str(value))["Root.y"].value == value for value in range(200))
+        assert len(store) == 200
+
+
+def test_memoization_shares_outputs_through_store(tmp_path):
+    definition = WorkflowDefinition.from_dict(
+        {
+            "root": {
+                "name": "Root",
+                "control_type": "sequential",
+                "datapins": {"x": {"type": "real", "is_input": True}},
+            }
+        }
+    )
+    engine = InMemoryWorkflowEngine()
+    with ResultStore(tmp_path / "results") as store:
+        first = MemoizingWorkflowInstance(engine.create_instance(definition), store=store)
+        second = MemoizingWorkflowInstance(engine.create_instance(definition), store=store)
+
+        first.run(collect_names={"Root.x"})
+        result = second.run(collect_names={"Root.x"})
+
+    assert result["Root.x"].value == 0.0
+    assert (first.misses, second.hits) == (1, 1)
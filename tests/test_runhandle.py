@@ -0,0 +1,206 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the run handle implementations."""
+
+import threading
+from unittest.mock import AsyncMock, Mock
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import anyio
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowInstance
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+from ansys.engineeringworkflow.api.runhandle import (
+    AsyncPollingRunHandle,
+    AsyncRunHandle,
+    Backoff,
+    PollingRunHandle,
+    RunHandle,
+)
+
+RELEASE = threading.Event()
+
+
+def gated_double(a):
+    assert RELEASE.wait(5)
+    if a < 0:
+        raise ArithmeticError("negative input")
+    return {"b": 2 * a}
+
+
+@pytest.fixture
+def instance():
+    RELEASE.clear()
+    definition = WorkflowDefinition.from_dict(
+        {
+            "root": {
+                "name": "Root",
+                "control_type": "sequential",
+                "datapins": {"x": {"type": "real", "is_input": True, "value": 1.0}},
+                "elements": [
+                    {
+                        "name": "Double",
+                        "callable": gated_double,
+                        "inputs": {"a": {"type": "real"}},
+                        "outputs": {"b": {"type": "real"}},
+                    }
+                ],
+            },
+            "links": [{"source": "Root.x", "target": "Root.Double.a"}],
+        }
+    )
+    return InMemoryWorkflowEngine().create_instance(definition)
+
+
+def test_run_handle_is_completed_by_engine(instance):
+    handle = instance.start_run(
+        {"Root.x": VariableState(RealValue(4.0), True)}, False, set(), {"Root.Double.b"}
+    )
+
+    assert instance.get_state() == api.WorkflowInstanceState.RUNNING
+    assert not handle.done()
+    assert not handle.wait(0.01)
+    with pytest.raises(TimeoutError):
+        handle.result(0.01)
+    RELEASE.set()
+    assert handle.result(5) == {"Root.Double.b": VariableState(RealValue(8.0), True)}
+    assert handle.done()
+
+
+def test_run_handle_raises_component_error(instance):
+    RELEASE.set()
+    handle = instance.start_run({"Root.x": VariableState(RealValue(-1.0), True)}, False, set())
+
+    with pytest.raises(ArithmeticError):
+        handle.result(5)
+    assert instance.get_state() == api.WorkflowInstanceState.FAILED
+
+
+def test_started_run_keeps_its_inputs(instance):
+    RELEASE.set()
+    handle = instance.start_run(
+        {"Root.x": VariableState(RealValue(4.0), True)}, False, set(), {"Root.Double.b"}
+    )
+    instance.set_states({"Root.x": VariableState(RealValue(10.0), True)})
+
+    assert handle.result(5) == {"Root.Double.b": VariableState(RealValue(8.0), True)}
+    assert instance.get_state() == api.WorkflowInstanceState.INVALID
+
+
+def test_run_handle_without_cancel_function_cannot_be_cancelled():
+    with pytest.raises(NotImplementedError):
+        RunHandle().cancel()
+
+
+@pytest.mark.anyio
+async def test_async_run_handle_without_cancel_function_cannot_be_cancelled():
+    with pytest.raises(NotImplementedError):
+        await AsyncRunHandle().cancel()
+
+
+def test_polling_run_handle(instance):
+    RELEASE.set()
+    instance.start_run({}, False, set()).wait(5)
+
+    handle = PollingRunHandle(instance, {"Root"})
+
+    assert handle.done()
+    assert handle.result()["Root.Double.b"].value == 2.0
+
+
+def test_polling_run_handle_backs_off_until_timeout():
+    instance = Mock(get_state=Mock(return_value=api.WorkflowInstanceState.RUNNING))
+    handle = PollingRunHandle(instance, backoff=Backoff(initial_delay=0.01, max_delay=0.04))
+
+    assert not handle.wait(0.2)
+    assert 4 <= instance.get_state.call_count <= 9
+    handle.cancel()
+    instance.cancel.assert_called_once_with()
+
+    instance.get_state.return_value = api.WorkflowInstanceState.FAILED
+    with pytest.raises(api.RunFailedError):
+        handle.result()
+
+    cancelled = PollingRunHandle(
+        Mock(get_state=Mock(return_value=api.WorkflowInstanceState.CANCELLED))
+    )
+    with pytest.raises(api.RunCancelledError):
+        cancelled.result()
+
+
+def test_backoff_delays():
+    delays = Backoff(initial_delay=1, factor=3, max_delay=20).delays()
+
+    assert [next(delays) for _ in range(5)] == [1, 3, 9, 20, 20]
+
+
+@pytest.mark.anyio
+async def test_async_run_handle_is_awaitable(instance):
+    async_instance = AsyncInMemoryWorkflowInstance(instance)
+
+    handle = await async_instance.start_run({}, False, set(), {"Root.Double.b"})
+    assert not await handle.wait(0.01)
+    RELEASE.set()
+
+    assert (await handle)["Root.Double.b"].value == 2.0
+    assert handle.done()
+
+
+@pytest.mark.anyio
+async def test_sync_run_handle_is_awaitable(instance):
+    handle = instance.start_run({}, False, set(), {"Root.Double.b"})
+    RELEASE.set()
+
+    assert (await handle)["Root.Double.b"].value == 2.0
+
+
+@pytest.mark.anyio
+async def test_async_polling_run_handle(instance):
+    async_instance = AsyncInMemoryWorkflowInstance(instance)
+    await async_instance.start_run({}, False, set())
+    handle = AsyncPollingRunHandle(async_instance, {"Root.Double.b"})
+
+    assert not await handle.wait(0.01)
+    assert not handle.done()
+    RELEASE.set()
+    assert (await handle.result(5))["Root.Double.b"].value == 2.0
+    assert handle.done()
+
+
+@pytest.mark.anyio
+async def test_async_polling_run_handle_cancel_polls_first():
+    async def get_state():
+        await anyio.sleep(0)
+        return api.WorkflowInstanceState.SUCCESS
+
+    async_instance = Mock(get_state=get_state, cancel=AsyncMock())
+    handle = AsyncPollingRunHandle(async_instance)
+
+    await handle.cancel()
+
+    assert handle.done()
+    async_instance.cancel.assert_not_called()
@@ -0,0 +1,122 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for tree snapshots."""
+
+import dataclasses
+
+from ansys.tools.variableinterop import VariableType
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.inmemoryworkflow import (
+    InMemoryWorkflowEngine,
+    WorkflowDefinition,
+)
+
+Kind = api.ElementKind
+
+DEFINITION = WorkflowDefinition.from_dict(
+    {
+        "root": {
+            "name": "Root",
+            "control_type": "sequential",
+            "properties": {"tolerance": 0.5},
+            "datapins": {"x": {"type": "real", "is_input": True, "units": "m"}},
+            "elements": [
+                {
+                    "name": "Group",
+                    "control_type": "parallel",
+                    "elements": [
+                        {
+                            "name": "Component",
+                            "callable": dict,
+                            "inputs": {"a": {"type": "real"}},
+                            "outputs": {"b": {"type": "integer"}},
+                        }
+                    ],
+                }
+            ],
+        },
+        "links": [{"source": "Root.x", "target": "Root.Group.Component.a"}],
+    }
+)
+
+ALL_NAMES = [
+    "Root",
+    "Root.x",
+    "Root.Group",
+    "Root.Group.Component",
+    "Root.Group.Component.a",
+    "Root.Group.Component.b",
+]
+
+
+def test_snapshot_describes_whole_tree():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+
+    snapshot = instance.get_tree_snapshot()
+
+    assert [element.full_name for element in snapshot] == ALL_NAMES
+    root = snapshot.root
+    assert root.kind == Kind.CONTROL_STATEMENT
+    assert root.properties["tolerance"].property_value == 0.5
+    x = snapshot.get_by_name("Root.x")
+    assert (x.kind, x.metadata.units, x.is_input_to_workflow) == (Kind.DATAPIN, "m", True)
+    component = snapshot.get_by_name("Root.Group.Component")
+    assert component.name == "Component"
+    assert component.depth == 2
+    assert snapshot.get_parent(component).control_type == "parallel"
+    assert [pin.name for pin in snapshot.get_children(component)] == ["a", "b"]
+    assert not snapshot.get_by_name("Root.Group.Component.a").is_input_to_workflow
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        component.depth = 0
+    with pytest.raises(ValueError):
+        snapshot.get_by_name("Root.Missing")
+
+
+def test_snapshot_depth_limit_and_name_filter():
+    instance = InMemoryWorkflowEngine().create_instance(DEFINITION)
+
+    shallow = instance.get_tree_snapshot(max_depth=1)
+    filtered = instance.get_tree_snapshot(name_filter="*.b")
+
+    assert [element.full_name for element in shallow] == ALL_NAMES[:3]
+    assert [element.full_name for element in filtered] == [
+        "Root",
+        "Root.Group",
+        "Root.Group.Component",
+        "Root.Group.Component.b",
+    ]
+    assert filtered.get_by_name("Root.Group.Component.b").parent_index == 2
+    with pytest.raises(ValueError):
+        instance.get_tree_snapshot(max_depth=-1)
+
+
+@pytest.mark.anyio
+async def test_async_snapshot():
+    instance = await AsyncInMemoryWorkflowEngine().create_instance(DEFINITION)
+
+    snapshot = await instance.get_tree_snapshot(name_filter="Root.Group*")
+
+    assert [element.full_name for element in snapshot] == ["Root"] + ALL_NAMES[2:]
+    assert snapshot.get_by_name("Root.Group.Component.b").value_type == VariableType.INTEGER
@@ -0,0 +1,143 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Tests for the synchronous adapters of asynchronous engines."""
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import queue
+
+from ansys.tools.variableinterop import RealValue, VariableState
+import pytest
+
+import ansys.engineeringworkflow.api as api
+from ansys.engineeringworkflow.api.inmemoryasyncworkflow import AsyncInMemoryWorkflowEngine
+from ansys.engineeringworkflow.api.syncadapter import EventLoopThread, SyncWorkflowEngine
+
+
+def double(a):
+    return {"b": 2.0 * a}
+
+
+WORKFLOW = {
+    "root": {
+        "name": "Root",
+        "control_type": "sequential",
+        "datapins": {"x": {"type": "real", "is_input": True, "value": 1.0}, "y": {"type": "real"}},
+        "elements": [
+            {
+                "name": "Double",
+                "callable": "test_syncadapter:double",
+                "inputs": {"a": {"type": "real"}},
+                "outputs": {"b": {"type": "real"}},
+            }
+        ],
+    },
+    "links": [
+        {"source": "Root.x", "target": "Root.Double.a"},
+        {"source": "Root.Double.b", "target": "Root.y"},
+    ],
+}
+
+
+@pytest.fixture
+def engine():
+    with SyncWorkflowEngine(AsyncInMemoryWorkflowEngine()) as engine:
+        yield engine
+
+
+@pytest.fixture
+def instance(engine, tmp_path):
+    path = tmp_path / "workflow.json"
+    path.write_text(json.dumps(WORKFLOW))
+    return engine.load_workflow(path)
+
+
+def test_runs_and_navigates_through_the_interfaces(instance):
+    result = instance.run(
+        inputs={"Root.x": VariableState(RealValue(3.0), True)}, collect_names={"Root.y"}
+    )
+    root = instance.get_root()
+    pin = instance.get_element_by_name("Root.Double.b")
+
+    assert result["Root.y"].value == 6.0
+    assert instance.get_state() == api.WorkflowInstanceState.SUCCESS
+    assert isinstance(root, api.IControlStatement)
+    assert list(root.get_elements()) == ["Double"]
+    assert root.get_datapins()["x"].is_input_to_workflow
+    assert isinstance(pin, api.IDatapin)
+    assert pin.get_state().value == 6.0
+    assert pin.get_parent_element() is root.get_elements()["Double"]
+    assert list(pin.get_downstream_datapins()) == ["Root.y"]
+    assert instance.get_tree_snapshot().get_by_name("Root.Double.a").is_input_to_component
+    with pytest.raises(ValueError):
+        instance.get_element_by_name("Root.Missing")
+
+
+def test_run_handle_and_batches(instance):
+    handle = instance.start_run({"Root.x": VariableState(RealValue(2.0), True)}, False, set())
+    assert handle.wait(10.0)
+    assert handle.done()
+
+    designs = [{"Root.x": VariableState(RealValue(x), True)} for x in (1.0, 2.0, 3.0)]
+    results = instance.run_batch(designs, collect_names={"Root.y"})
+    assert next(results).outputs["Root.y"].value == 2.0
+    results.close()
+    assert instance.get_element_by_name("Root.x").get_state().value == 1.0
+    results = list(instance.run_batch(designs, collect_names={"Root.y"}))
+    assert [result.outputs["Root.y"].value for result in results] == [2.0, 4.0, 6.0]
+
+
+def test_subscribe_forwards_events(instance):
+    events = queue.Queue()
+    unsubscribe = instance.subscribe(events.put)
+
+    instance.run()
+
+    received = [events.get(timeout=10.0) for _ in range(4)]
+    states = [event.state for event in received if event.state is not None]
+    assert received[1].element_name == "Root.Double"
+    assert states == [api.WorkflowInstanceState.RUNNING, api.WorkflowInstanceState.SUCCESS]
+    unsubscribe()
+
+
+def test_calls_from_many_threads_share_one_loop(instance):
+    def run(x):
+        pin = instance.get_element_by_name("Root.Double.a")
+        return pin.get_metadata(), instance.get_state()
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(run, range(64)))
+
+    assert len(results) == 64
+    assert len(instance._wrappers) == 1
+
+
+def test_closed_loop_rejects_calls():
+    loop = EventLoopThread()
+
+    async def answer():
+        return 42
+
+    assert loop.call(answer) == 42
+    loop.close()
+    with pytest.raises(RuntimeError):
+        loop.call(answer)